@@ -29,17 +29,18 @@ class AnalyzerAgent:
     Future: Upgrade to Sonnet (~$0.08/event) or Opus (~$0.40/event) for quality
     """
 
-    def __init__(self, db_path: str = "ai_pulse.db"):
+    def __init__(self, db_path: str = "ai_pulse.db", max_workers: int = 4):
         """
         Initialize analyzer agent.
 
         Args:
             db_path: Path to SQLite database
+            max_workers: Events analyzed concurrently (1 = one at a time)
         """
         load_dotenv()
 
         self.db = EventDatabase(db_path)
-        self.analyzer = SignificanceAnalyzer()
+        self.analyzer = SignificanceAnalyzer(max_workers=max_workers)
 
     def analyze_unanalyzed_events(self, limit: int = 10) -> dict:
         """
@@ -60,41 +61,41 @@ class AnalyzerAgent:
         print("AI-PULSE ANALYZER AGENT")
         print("=" * 80)
 
-        # Find unanalyzed events
+        # Claim unanalyzed events from the queue - other analyzer runs
+        # skip them until we store results or give them back
         print("\nFinding events that need analysis...")
 
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM events
-            WHERE significance_score IS NULL
-              AND (is_duplicate IS NULL OR is_duplicate = 0)
-              AND (is_semantic_duplicate IS NULL OR is_semantic_duplicate = 0)
-            ORDER BY collected_at DESC
-            LIMIT ?
-        """, (limit * 2,))  # Fetch extra in case some fail
-
-        from models.events import Event
-        unanalyzed = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
+        queue = self.db.analysis_queue
+        claimed = queue.claim(limit * 2)  # Claim extra in case some fail
 
-        if not unanalyzed:
-            print("✓ All events have been analyzed!")
+        if not claimed:
+            stats = queue.stats()
+            if stats['leased']:
+                print(f"✓ Nothing available - {stats['leased']} events claimed by other workers")
+            else:
+                print("✓ All events have been analyzed!")
             return {'analyzed': 0, 'skipped': 0}
 
-        print(f"Found {len(unanalyzed)} unanalyzed events")
+        try:
+            unanalyzed = self.db.get_events_by_ids(claimed)
+            print(f"Found {len(unanalyzed)} unanalyzed events")
 
-        # Analyze them
-        result = self.analyzer.analyze_batch(unanalyzed, max_analyze=limit)
+            # Analyze them
+            result = self.analyzer.analyze_batch(unanalyzed, max_analyze=limit)
 
-        # Store analysis results in database
-        print("\nStoring analysis results...")
+            # Store analysis results in database (the score dequeues them)
+            print("\nStoring analysis results...")
 
-        for item in result['analyzed']:
-            event = item['event']
-            analysis = item['analysis']
+            for item in result['analyzed']:
+                event = item['event']
+                analysis = item['analysis']
 
-            if event.id:
-                self.db.update_event_analysis(event.id, analysis)
-                print(f"  ✓ Stored analysis for: {event.title[:60]}...")
+                if event.id:
+                    self.db.update_event_analysis(event.id, analysis)
+                    print(f"  ✓ Stored analysis for: {event.title[:60]}...")
+        finally:
+            # Unused and failed claims go back for the next run
+            queue.release(claimed)
 
         print("\n" + "=" * 80)
         print(f"COMPLETE: {len(result['analyzed'])} events analyzed")
@@ -122,8 +123,8 @@ class AnalyzerAgent:
             LIMIT ?
         """, (threshold, limit))
 
-        from models.events import Event
-        low_score_events = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
+        from storage.db import event_from_dict
+        low_score_events = [event_from_dict(dict(row)) for row in cursor.fetchall()]
 
         if not low_score_events:
             print(f"No events found with score < {threshold}")
@@ -148,7 +149,8 @@ class AnalyzerAgent:
         """
         Get most significant events from recent period.
 
-        Returns events sorted by significance score.
+        Returns EventRows (only the columns --top prints) sorted by
+        significance score.
         """
         from datetime import timedelta, datetime
 
@@ -156,15 +158,16 @@ class AnalyzerAgent:
 
         cursor = self.db.conn.cursor()
         cursor.execute("""
-            SELECT * FROM events
+            SELECT id, title, significance_score, sentiment, investment_relevance, implications
+            FROM events
             WHERE significance_score IS NOT NULL
               AND collected_at >= ?
             ORDER BY significance_score DESC
             LIMIT ?
         """, (cutoff.isoformat(), limit))
 
-        from models.events import Event
-        return [Event.from_dict(dict(row)) for row in cursor.fetchall()]
+        from models.events import EventRow
+        return [EventRow(row) for row in cursor.fetchall()]
 
     def close(self):
         """Close database connection"""
@@ -192,6 +195,8 @@ if __name__ == "__main__":
                        help='Show top events by significance')
     parser.add_argument('--db', type=str, default='ai_pulse.db',
                        help='Database file path (default: ai_pulse.db)')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Concurrent analysis requests (default: 4, 1 = sequential)')
 
     args = parser.parse_args()
 
@@ -203,7 +208,7 @@ if __name__ == "__main__":
         print("Get key at: https://console.anthropic.com/")
         sys.exit(1)
 
-    with AnalyzerAgent(db_path=args.db) as agent:
+    with AnalyzerAgent(db_path=args.db, max_workers=args.workers) as agent:
         if args.reanalyze:
             agent.reanalyze_low_scores(threshold=args.threshold, limit=args.limit)
         elif args.top:
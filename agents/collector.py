@@ -12,6 +12,8 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -22,8 +24,12 @@ from sources.github_trending import GitHubTrendingSource
 from sources.company_ir import CompanyIRSource
 from sources.arxiv_papers import ArXivSource
 from sources.tech_rss import TechRSSSource
+from sources.http_cache import HTTPCache
+from sources.seen_items import SeenItems
 from storage.db import EventDatabase
+from storage.fingerprints import FingerprintStore
 from models.events import Event
+from analysis.title_index import TitleIndex
 from difflib import SequenceMatcher
 
 # DISABLED SOURCES (2025-11-11):
@@ -50,22 +56,45 @@ class DataCollector:
     - Reddit
     """
 
-    def __init__(self, db_path: str = "ai_pulse.db"):
+    # Per-source fetch deadlines (seconds) for parallel collection.
+    # SEC/Company IR/RSS loop over many feeds; ArXiv's RSS can be slow.
+    SOURCE_TIMEOUTS = {
+        'hackernews': 120,
+        'newsapi': 60,
+        'sec_edgar': 180,
+        'github': 120,
+        'company_ir': 120,
+        'arxiv': 240,
+        'tech_rss': 180,
+    }
+    DEFAULT_SOURCE_TIMEOUT = 120
+
+    def __init__(self, db_path: str = "ai_pulse.db", seen_window_days: int = 7,
+                 use_http_cache: bool = True, incremental: bool = True):
         """
         Initialize collector.
 
         Args:
             db_path: Path to SQLite database
+            seen_window_days: Days an event's fingerprint blocks repeats from
+                later runs (URL, title or near-identical title)
+            use_http_cache: Send conditional GETs for RSS/Atom feeds and skip
+                feeds that haven't changed since the last run
+            incremental: Skip Hacker News stories and GitHub repos already
+                stored or rejected before fetching their details
         """
         load_dotenv()  # Load .env file
 
         self.db = EventDatabase(db_path)
+        self.fingerprints = FingerprintStore(self.db.conn, window_days=seen_window_days)
+        self.http_cache = HTTPCache() if use_http_cache else None
+        self.seen_items = SeenItems(events_db_path=db_path) if incremental else None
 
         # Initialize sources
         self.sources = {}
 
         # Hacker News (always available)
-        self.sources['hackernews'] = HackerNewsSource()
+        self.sources['hackernews'] = HackerNewsSource(seen=self.seen_items)
 
         # NewsAPI (if key available)
         news_api_key = os.getenv('NEWS_API_KEY')
@@ -76,24 +105,28 @@ class DataCollector:
             print("⚠ NewsAPI disabled (no API key found)")
 
         # SEC EDGAR (always available)
-        self.sources['sec_edgar'] = SECEdgarSource()
+        self.sources['sec_edgar'] = SECEdgarSource(cache=self.http_cache)
 
         # GitHub (always available)
-        self.sources['github'] = GitHubTrendingSource()
+        self.sources['github'] = GitHubTrendingSource(seen=self.seen_items)
 
         # Company IR (always available)
-        self.sources['company_ir'] = CompanyIRSource()
+        self.sources['company_ir'] = CompanyIRSource(cache=self.http_cache)
 
         # ArXiv (always available)
-        self.sources['arxiv'] = ArXivSource()
+        self.sources['arxiv'] = ArXivSource(cache=self.http_cache)
 
         # Tech RSS feeds (always available - TechCrunch, VentureBeat, CNBC, etc.)
-        self.sources['tech_rss'] = TechRSSSource()
+        self.sources['tech_rss'] = TechRSSSource(cache=self.http_cache)
 
     def deduplicate_events(self, events: list[Event], similarity_threshold: float = 0.75) -> tuple[list[Event], int]:
         """
         Remove duplicate events based on title similarity and date.
 
+        Each event is compared against the earlier kept events of the same
+        day that the title index says could reach the threshold (an exact
+        bound, so the result is the same as comparing with every one).
+
         Args:
             events: List of events to deduplicate
             similarity_threshold: Minimum similarity (0-1) to consider duplicates
@@ -118,23 +151,18 @@ class DataCollector:
 
         # Process each date group
         for date, date_events in by_date.items():
-            # Track which events to keep
+            # Track which events to keep (only kept events are indexed)
             to_keep = []
-            marked_as_duplicate = set()
-
-            for i, event1 in enumerate(date_events):
-                if i in marked_as_duplicate:
-                    continue
+            index = TitleIndex()
 
-                # Compare with remaining events
+            for event1 in date_events:
+                # Compare with earlier kept events that could be similar
                 is_duplicate_of_earlier = False
 
-                for j in range(i):
-                    if j in marked_as_duplicate:
-                        continue
-
-                    event2 = date_events[j]
-
+                # Titles sharing a company only need 0.6
+                candidates = index.candidates(event1.title, similarity_threshold,
+                                              tags=event1.companies, tag_ratio=0.6)
+                for event2 in candidates:
                     # Calculate title similarity
                     similarity = self._calculate_similarity(event1.title, event2.title)
 
@@ -148,12 +176,12 @@ class DataCollector:
                     if similarity >= similarity_threshold or (similarity >= 0.6 and companies_match):
                         # This is a duplicate of an earlier event
                         is_duplicate_of_earlier = True
-                        marked_as_duplicate.add(i)
                         duplicates_removed += 1
                         break
 
                 if not is_duplicate_of_earlier:
                     to_keep.append(event1)
+                    index.add(event1, event1.title, tags=event1.companies)
 
             deduplicated.extend(to_keep)
 
@@ -173,6 +201,48 @@ class DataCollector:
         # Use SequenceMatcher for similarity
         return SequenceMatcher(None, t1, t2).ratio()
 
+    def _take_feeds(self, name: str) -> dict:
+        """Unconfirmed feed cache entries from a source's fetch (call from the fetching thread)"""
+        return self.http_cache.take(name) if self.http_cache else {}
+
+    def _store_events(self, label: str, events: list[Event], feeds: dict = None) -> dict:
+        """
+        Deduplicate a source's events and save them.
+
+        All database writes go through here, from the calling thread only -
+        sources may fetch concurrently but SQLite only ever sees one writer.
+
+        Args:
+            label: Source name for logging
+            events: Events fetched from the source
+            feeds: The source's feed cache entries (from _take_feeds), only
+                   remembered once the events are saved
+
+        Returns:
+            Stats dict
+        """
+        # Deduplicate before saving
+        events, content_dupes = self.deduplicate_events(events)
+        if content_dupes > 0:
+            print(f"  ⚡ Removed {content_dupes} content duplicates")
+
+        # Skip stories already stored by an earlier run or another source
+        events, seen_dupes = self.fingerprints.filter_new(events)
+        if seen_dupes > 0:
+            print(f"  ⚡ Skipped {seen_dupes} already-seen events")
+
+        result = self.db.save_events(events)
+        self.fingerprints.add(events)
+        result['seen'] = seen_dupes
+
+        # Only now can an unchanged feed safely mean "nothing new"
+        if feeds:
+            self.http_cache.confirm(feeds)
+
+        print(f"\n✓ {label}: {result['saved']} new, {result['duplicates']} URL duplicates, "
+              f"{content_dupes} content duplicates, {seen_dupes} already seen")
+        return result
+
     def collect_from_hackernews(self, limit: int = 20) -> dict:
         """
         Collect from Hacker News.
@@ -190,15 +260,7 @@ class DataCollector:
         source = self.sources['hackernews']
         events = source.fetch_ai_stories(limit=limit, top_n=200)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ Hacker News: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('Hacker News', events)
 
     def collect_from_newsapi(self, days_back: int = 1, limit: int = 30) -> dict:
         """
@@ -222,15 +284,7 @@ class DataCollector:
         source = self.sources['newsapi']
         events = source.fetch_ai_news(days_back=days_back, limit=limit)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ NewsAPI: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('NewsAPI', events)
 
     def collect_from_sec_edgar(self, filing_type: str = '8-K', days_back: int = 7) -> dict:
         """
@@ -250,15 +304,7 @@ class DataCollector:
         source = self.sources['sec_edgar']
         events = source.fetch_all_companies(filing_type=filing_type, days_back=days_back)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ SEC EDGAR: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('SEC EDGAR', events, self._take_feeds('sec_edgar'))
 
     def collect_from_github(self, days_back: int = 7, min_stars: int = 500) -> dict:
         """
@@ -278,15 +324,7 @@ class DataCollector:
         source = self.sources['github']
         events = source.fetch_trending_ai(days_back=days_back, min_stars=min_stars)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ GitHub: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('GitHub', events)
 
     def collect_from_company_ir(self, days_back: int = 7) -> dict:
         """
@@ -305,15 +343,7 @@ class DataCollector:
         source = self.sources['company_ir']
         events = source.fetch_all_companies(days_back=days_back)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ Company IR: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('Company IR', events, self._take_feeds('company_ir'))
 
     def collect_from_arxiv(self, days_back: int = 7, max_results: int = 5) -> dict:
         """
@@ -333,15 +363,7 @@ class DataCollector:
         source = self.sources['arxiv']
         events = source.fetch_recent_papers(days_back=days_back, max_results=max_results)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ ArXiv: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('ArXiv', events, self._take_feeds('arxiv'))
 
     def collect_from_tech_rss(self, days_back: int = 1, limit_per_feed: int = 10) -> dict:
         """
@@ -361,20 +383,13 @@ class DataCollector:
         source = self.sources['tech_rss']
         events = source.fetch_all_feeds(days_back=days_back, limit_per_feed=limit_per_feed)
 
-        # Deduplicate before saving
-        events, content_dupes = self.deduplicate_events(events)
-        if content_dupes > 0:
-            print(f"  ⚡ Removed {content_dupes} content duplicates")
-
-        result = self.db.save_events(events)
-
-        print(f"\n✓ Tech RSS: {result['saved']} new, {result['duplicates']} URL duplicates, {content_dupes} content duplicates")
-        return result
+        return self._store_events('Tech RSS', events, self._take_feeds('tech_rss'))
 
     def collect_all(self, hn_limit: int = 20, news_days: int = 1, news_limit: int = 30,
                     sec_days: int = 30, github_days: int = 30, github_stars: int = 100,
                     ir_days: int = 30, arxiv_days: int = 7, arxiv_limit: int = 5,
-                    rss_days: int = 1, rss_limit: int = 10) -> dict:
+                    rss_days: int = 1, rss_limit: int = 10,
+                    parallel: bool = True, source_timeout: float = None) -> dict:
         """
         Collect from all available sources.
 
@@ -390,51 +405,77 @@ class DataCollector:
             arxiv_limit: ArXiv max papers (total, not per category)
             rss_days: Tech RSS days back
             rss_limit: Tech RSS articles per feed
+            parallel: Fetch sources concurrently (default: True)
+            source_timeout: Override every source's deadline (seconds)
 
         Returns:
-            Combined stats
+            Combined stats, including per-source timings and failures
         """
         print("\n" + "=" * 80)
         print(f"AI-PULSE DATA COLLECTION - {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
         print("=" * 80)
 
-        total_saved = 0
-        total_duplicates = 0
-
-        # Collect from Hacker News
-        hn_stats = self.collect_from_hackernews(limit=hn_limit)
-        total_saved += hn_stats['saved']
-        total_duplicates += hn_stats['duplicates']
+        # (name, label, fetch) - fetch only talks to the network, never the DB
+        jobs = [
+            ('hackernews', 'Hacker News',
+             lambda: self.sources['hackernews'].fetch_ai_stories(limit=hn_limit, top_n=200)),
+            ('newsapi', 'NewsAPI',
+             lambda: self.sources['newsapi'].fetch_ai_news(days_back=news_days, limit=news_limit)),
+            ('sec_edgar', 'SEC EDGAR',
+             lambda: self.sources['sec_edgar'].fetch_all_companies(filing_type='8-K', days_back=sec_days)),
+            ('github', 'GitHub',
+             lambda: self.sources['github'].fetch_trending_ai(days_back=github_days, min_stars=github_stars)),
+            ('company_ir', 'Company IR',
+             lambda: self.sources['company_ir'].fetch_all_companies(days_back=ir_days)),
+            ('arxiv', 'ArXiv',
+             lambda: self.sources['arxiv'].fetch_recent_papers(days_back=arxiv_days, max_results=arxiv_limit)),
+            # Tech RSS feeds (TechCrunch, VentureBeat, CNBC, etc.)
+            ('tech_rss', 'Tech RSS',
+             lambda: self.sources['tech_rss'].fetch_all_feeds(days_back=rss_days, limit_per_feed=rss_limit)),
+        ]
 
-        # Collect from NewsAPI
-        news_stats = self.collect_from_newsapi(days_back=news_days, limit=news_limit)
-        total_saved += news_stats['saved']
-        total_duplicates += news_stats['duplicates']
-
-        # Collect from SEC EDGAR
-        sec_stats = self.collect_from_sec_edgar(days_back=sec_days)
-        total_saved += sec_stats['saved']
-        total_duplicates += sec_stats['duplicates']
-
-        # Collect from GitHub
-        github_stats = self.collect_from_github(days_back=github_days, min_stars=github_stars)
-        total_saved += github_stats['saved']
-        total_duplicates += github_stats['duplicates']
+        if 'newsapi' not in self.sources:
+            print("⚠ NewsAPI not configured (skipping)")
+        jobs = [job for job in jobs if job[0] in self.sources]
 
-        # Collect from Company IR
-        ir_stats = self.collect_from_company_ir(days_back=ir_days)
-        total_saved += ir_stats['saved']
-        total_duplicates += ir_stats['duplicates']
+        if parallel:
+            source_stats = self._run_sources_parallel(jobs, source_timeout)
+        else:
+            source_stats = self._run_sources_sequential(jobs)
 
-        # Collect from ArXiv
-        arxiv_stats = self.collect_from_arxiv(days_back=arxiv_days, max_results=arxiv_limit)
-        total_saved += arxiv_stats['saved']
-        total_duplicates += arxiv_stats['duplicates']
+        total_saved = sum(stats['saved'] for stats in source_stats.values())
+        total_duplicates = sum(stats['duplicates'] for stats in source_stats.values())
+        total_seen = sum(stats['seen'] for stats in source_stats.values())
 
-        # Collect from Tech RSS feeds (TechCrunch, VentureBeat, CNBC, etc.)
-        rss_stats = self.collect_from_tech_rss(days_back=rss_days, limit_per_feed=rss_limit)
-        total_saved += rss_stats['saved']
-        total_duplicates += rss_stats['duplicates']
+        # Show per-source timings
+        print("\n" + "=" * 80)
+        print("SOURCE TIMINGS")
+        print("=" * 80)
+        for name, stats in source_stats.items():
+            line = f"  {name:<12} {stats['seconds']:7.2f}s  {stats['status']}"
+            if stats.get('error'):
+                line += f" ({stats['error']})"
+            print(line)
+
+        # Show conditional-GET savings for the feed sources
+        cache_stats = self.http_cache.stats() if self.http_cache else {}
+        if cache_stats:
+            print("\n" + "=" * 80)
+            print("FEED CACHE")
+            print("=" * 80)
+            for name, counts in cache_stats.items():
+                print(f"  {name:<12} {counts['hits']:3d} not modified, {counts['unchanged']:3d} unchanged, "
+                      f"{counts['misses']:3d} fetched  ({counts['bytes_saved'] / 1024:.0f} KB saved)")
+
+        # Show item requests avoided by the seen-item lookup
+        seen_stats = self.seen_items.stats() if self.seen_items else {}
+        if seen_stats:
+            print("\n" + "=" * 80)
+            print("SEEN ITEMS")
+            print("=" * 80)
+            for name, counts in seen_stats.items():
+                print(f"  {name:<12} {counts['skipped']:3d} skipped (seen before), "
+                      f"{counts['rejected']:3d} newly rejected")
 
         # Show database stats
         print("\n" + "=" * 80)
@@ -452,18 +493,155 @@ class DataCollector:
             print(f"  {event_type}: {count}")
 
         print("\n" + "=" * 80)
-        print(f"COLLECTION COMPLETE: {total_saved} new events, {total_duplicates} duplicates")
+        print(f"COLLECTION COMPLETE: {total_saved} new events, {total_duplicates} duplicates, "
+              f"{total_seen} already seen")
         print("=" * 80 + "\n")
 
         return {
             'saved': total_saved,
             'duplicates': total_duplicates,
+            'seen': total_seen,
             'total_in_db': db_stats['total_events'],
+            'sources': source_stats,
+            'http_cache': cache_stats,
+            'seen_items': seen_stats,
+            'timings': {name: stats['seconds'] for name, stats in source_stats.items()},
+            'failed': [name for name, stats in source_stats.items() if stats['status'] != 'ok'],
+        }
+
+    def _run_sources_sequential(self, jobs: list) -> dict:
+        """Fetch and store each source in turn (the pre-parallel behaviour)"""
+        source_stats = {}
+
+        for name, label, fetch in jobs:
+            print("\n" + "=" * 80)
+            print(f"COLLECTING FROM {label.upper()}")
+            print("=" * 80)
+
+            start = time.monotonic()
+            try:
+                events = fetch()
+            except Exception as e:
+                self._take_feeds(name)  # never confirmed
+                print(f"✗ {label} failed: {e}")
+                source_stats[name] = self._source_result(time.monotonic() - start, 'error', error=str(e))
+                continue
+
+            source_stats[name] = self._source_result(time.monotonic() - start, 'ok',
+                                                     self._store_events(label, events, self._take_feeds(name)))
+
+        return source_stats
+
+    def _run_sources_parallel(self, jobs: list, source_timeout: float = None) -> dict:
+        """
+        Fetch all sources concurrently, storing results as they arrive.
+
+        Each source runs in its own worker thread and has its own deadline
+        (SOURCE_TIMEOUTS, or source_timeout for all). Results are handed back
+        to this thread, which is the only one that deduplicates and writes to
+        the database. A source that raises or misses its deadline is recorded
+        and skipped without affecting the others.
+
+        Note: Python threads can't be killed, so a timed-out source keeps
+        running in the background until its own HTTP timeouts fire; its
+        events are discarded.
+        """
+        print(f"\nFetching {len(jobs)} sources in parallel...")
+
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix='collector')
+
+        def timed(name, fetch):
+            # (events, error, seconds, finished, feeds) - finished lets a result
+            # that arrived in time be told apart from one still running; feeds
+            # are taken in this thread so a late fetch's can't be confirmed
+            fetch_start = time.monotonic()
+            try:
+                events, error = fetch(), None
+            except Exception as e:
+                events, error = None, e
+            finished = time.monotonic()
+            return events, error, finished - fetch_start, finished, self._take_feeds(name)
+
+        def on_time(future) -> bool:
+            return future.done() and future.result()[3] <= deadlines[future]
+
+        pending = {}
+        deadlines = {}
+        for name, label, fetch in jobs:
+            future = executor.submit(timed, name, fetch)
+            pending[future] = (name, label)
+            timeout = source_timeout or self.SOURCE_TIMEOUTS.get(name, self.DEFAULT_SOURCE_TIMEOUT)
+            deadlines[future] = start + timeout
+
+        source_stats = {}
+
+        try:
+            while pending:
+                next_deadline = min(deadlines[f] for f in pending)
+                done, _ = wait(pending, timeout=max(0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name, label = pending.pop(future)
+
+                    print("\n" + "=" * 80)
+                    print(f"COLLECTED FROM {label.upper()}")
+                    print("=" * 80)
+
+                    events, error, seconds, finished, feeds = future.result()
+                    if finished > deadlines[future]:
+                        # Finished, but after its deadline (seen late while storing another source)
+                        print(f"\n✗ {label} timed out after {seconds:.0f}s (skipped)")
+                        source_stats[name] = self._source_result(seconds, 'timeout',
+                                                                 error='deadline exceeded')
+                        continue
+
+                    if error is not None:
+                        print(f"✗ {label} failed: {error}")
+                        source_stats[name] = self._source_result(seconds, 'error', error=str(error))
+                        continue
+
+                    source_stats[name] = self._source_result(seconds, 'ok',
+                                                             self._store_events(label, events, feeds))
+
+                # Sources that finished in time but weren't in `done` (they completed
+                # while another source was being stored) are picked up by the next wait()
+                now = time.monotonic()
+                for future in [f for f in pending if deadlines[f] <= now and not on_time(f)]:
+                    name, label = pending.pop(future)
+                    future.cancel()
+                    timeout = deadlines[future] - start
+                    print(f"\n✗ {label} timed out after {timeout:.0f}s (skipped)")
+                    source_stats[name] = self._source_result(timeout, 'timeout',
+                                                             error='deadline exceeded')
+        finally:
+            executor.shutdown(wait=False)
+
+        # Report in the usual source order
+        return {name: source_stats[name] for name, _, _ in jobs}
+
+    def _source_result(self, seconds: float, status: str, result: dict = None,
+                       error: str = None) -> dict:
+        """Build a per-source stats entry"""
+        stats = {
+            'saved': result['saved'] if result else 0,
+            'duplicates': result['duplicates'] if result else 0,
+            'seen': result.get('seen', 0) if result else 0,
+            'seconds': round(seconds, 2),
+            'status': status,
         }
+        if error:
+            stats['error'] = error
+        return stats
 
     def close(self):
-        """Close database connection"""
+        """Close database connections"""
         self.db.close()
+        if self.http_cache:
+            self.http_cache.close()
+        if self.seen_items:
+            self.seen_items.close()
 
     def __enter__(self):
         return self
@@ -501,11 +679,20 @@ if __name__ == "__main__":
                        help='Tech RSS articles per feed (default: 10)')
     parser.add_argument('--db', type=str, default='ai_pulse.db',
                        help='Database file path (default: ai_pulse.db)')
+    parser.add_argument('--sequential', action='store_true',
+                       help='Fetch sources one at a time instead of in parallel')
+    parser.add_argument('--source-timeout', type=float, default=None,
+                       help='Deadline in seconds for every source (default: per-source)')
+    parser.add_argument('--no-http-cache', action='store_true',
+                       help='Re-download every feed instead of sending conditional GETs')
+    parser.add_argument('--full-scan', action='store_true',
+                       help='Fetch every Hacker News story and GitHub repo, even ones seen before')
 
     args = parser.parse_args()
 
     # Run collector
-    with DataCollector(db_path=args.db) as collector:
+    with DataCollector(db_path=args.db, use_http_cache=not args.no_http_cache,
+                       incremental=not args.full_scan) as collector:
         collector.collect_all(
             hn_limit=args.hn_limit,
             news_days=args.news_days,
@@ -517,5 +704,7 @@ if __name__ == "__main__":
             arxiv_days=args.arxiv_days,
             arxiv_limit=args.arxiv_limit,
             rss_days=args.rss_days,
-            rss_limit=args.rss_limit
+            rss_limit=args.rss_limit,
+            parallel=not args.sequential,
+            source_timeout=args.source_timeout
         )
@@ -9,13 +9,13 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-import sqlite3
 from datetime import datetime, timedelta
+from storage.connection import connect
 
 
 def ensure_tables(db_path: str):
     """Create required tables if they don't exist"""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Daily sentiment table (created by publish_briefing, but ensure it exists)
@@ -111,7 +111,7 @@ def calculate_correlation_for_date(date_str: str, db_path: str = "ai_pulse.db"):
     """
     ensure_correlation_table(db_path)
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Get sentiment data for this date
@@ -228,7 +228,7 @@ def calculate_correlation_range(days_back: int = 30, db_path: str = "ai_pulse.db
     print("ACCURACY SUMMARY")
     print("=" * 80)
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -7,8 +7,13 @@ Called by the 6am workflow after collection and analysis.
 
 import sqlite3
 import sys
+from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent.parent))
+from storage.connection import connect
+from storage.db import day_range
+
 
 def get_top_stories(db_path: str = "ai_pulse.db", limit: int = 10) -> list:
     """
@@ -21,20 +26,23 @@ def get_top_stories(db_path: str = "ai_pulse.db", limit: int = 10) -> list:
     Returns:
         List of story dicts with title, score, sentiment, url
     """
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
+    # Today (UTC) as a range so idx_collected_at is used
+    start, end = day_range(datetime.utcnow().strftime('%Y-%m-%d'))
+
     cursor.execute("""
         SELECT title, significance_score, sentiment, source_url
         FROM events
         WHERE significance_score IS NOT NULL
-          AND date(collected_at) = date('now')
+          AND collected_at >= ? AND collected_at < ?
           AND (is_duplicate IS NULL OR is_duplicate = 0)
           AND (is_semantic_duplicate IS NULL OR is_semantic_duplicate = 0)
         ORDER BY significance_score DESC
         LIMIT ?
-    """, (limit,))
+    """, (start, end, limit))
 
     stories = [dict(row) for row in cursor.fetchall()]
     conn.close()
@@ -11,9 +11,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 from datetime import datetime, timedelta
 from storage.db import EventDatabase
 from models.events import Event
+from storage.connection import connect
 import sqlite3
 
 
+# Columns the briefing page uses - full content and raw analysis are never loaded
+PAGE_FIELDS = ('title', 'event_type', 'significance_score', 'sentiment', 'implications',
+               'affected_parties', 'investment_relevance', 'key_context', 'companies',
+               'published_at', 'source_url', 'is_duplicate', 'is_semantic_duplicate')
+
+
 class HTMLReporter:
     """
     Generates HTML briefings for web publishing.
@@ -37,7 +44,7 @@ class HTMLReporter:
         """
         # Get recent events (convert days to hours)
         hours_back = days_back * 24
-        all_events = self.db.get_recent_events(hours=hours_back, limit=1000)
+        all_events = self.db.get_recent_events(hours=hours_back, limit=1000, fields=PAGE_FIELDS)
 
         # Filter out duplicates (both string and semantic)
         all_events = [e for e in all_events if not getattr(e, 'is_duplicate', False) and not getattr(e, 'is_semantic_duplicate', False)]
@@ -73,26 +80,9 @@ class HTMLReporter:
             sent = event.sentiment or 'unknown'
             sentiment_counts[sent] = sentiment_counts.get(sent, 0) + 1
 
-        # Get sentiment history for chart (past data)
-        sentiment_history = self.db.get_sentiment_history(days=30)
-
-        # Add today's data to history for chart
-        now = datetime.utcnow()
-        date_str = now.strftime('%Y-%m-%d')
-        today_data = {
-            'date': date_str,
-            'positive': sentiment_counts.get('positive', 0),
-            'negative': sentiment_counts.get('negative', 0),
-            'neutral': sentiment_counts.get('neutral', 0),
-            'mixed': sentiment_counts.get('mixed', 0),
-            'total_analyzed': sum(sentiment_counts.values())
-        }
-
-        # Remove today's date from history if it exists (will be replaced with fresh data)
-        sentiment_history = [row for row in sentiment_history if row['date'] != date_str]
-
-        # Insert today at the beginning (most recent)
-        full_history = [today_data] + sentiment_history
+        # Sentiment history for chart - daily_sentiment is kept current by
+        # triggers on events, so it already includes today
+        full_history = self.db.get_sentiment_history(days=30)
 
         # Get market data and correlation data
         market_data = self._get_market_data(days=30)
@@ -1054,7 +1044,7 @@ class HTMLReporter:
 
     def _get_market_data(self, days: int = 30) -> dict:
         """Get market data for last N days, keeping dates with each symbol"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1100,7 +1090,7 @@ class HTMLReporter:
 
     def _get_correlation_data(self, days: int = 30) -> dict:
         """Get sentiment-market correlation data"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
@@ -1143,7 +1133,7 @@ class HTMLReporter:
 
     def _get_latest_insights(self) -> dict:
         """Get the most recent prediction insights analysis"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
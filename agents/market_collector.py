@@ -16,7 +16,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 import yfinance as yf
 from datetime import datetime, timedelta
 from storage.db import EventDatabase
-import sqlite3
+from storage.connection import connect
 import os
 import time
 import requests
@@ -399,7 +399,7 @@ def fetch_fmp_daily(symbol: str, date_str: str, api_key: str) -> dict:
 
 def ensure_market_table(db_path: str):
     """Create market_data table if it doesn't exist"""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -456,7 +456,7 @@ def collect_market_data(date_str: str, db_path: str = "ai_pulse.db"):
 
     ensure_market_table(db_path)
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Separate indices from stocks/ETFs/crypto
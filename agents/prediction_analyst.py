@@ -9,18 +9,24 @@ patterns in sentiment vs market accuracy.
 
 import argparse
 import sqlite3
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 import os
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+sys.path.append(str(Path(__file__).parent.parent))
+from storage.connection import connect
+from analysis.llm_cache import ResponseCache
+
 # Load environment variables
 load_dotenv()
 
 
 def get_historical_data(db_path: str, days: int):
     """Query historical sentiment and market correlation data."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -172,21 +178,24 @@ def analyze_with_claude(prompt: str, api_key: str) -> str:
     """Send analysis prompt to Claude API."""
     client = Anthropic(api_key=api_key)
 
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        messages=[{
-            "role": "user",
-            "content": prompt
-        }]
-    )
+    # Same data window -> same prompt, answered from the response cache
+    with ResponseCache() as cache:
+        message = cache.create(
+            client,
+            model="claude-sonnet-4-20250514",
+            max_tokens=4096,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
 
     return message.content[0].text
 
 
 def store_insights(db_path: str, insights: str, days: int):
     """Store analysis insights in database."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Create insights table if it doesn't exist
@@ -67,32 +67,11 @@ def get_sentiment_percentages(db: EventDatabase, date: str) -> dict:
     Returns:
         Dict with sentiment percentages and total count
     """
-    cursor = db.conn.cursor()
-
-    # Get sentiment counts for today (only non-duplicates)
-    cursor.execute("""
-        SELECT
-            sentiment,
-            COUNT(*) as count
-        FROM events
-        WHERE DATE(published_at) = ?
-          AND sentiment IS NOT NULL
-          AND (is_duplicate IS NULL OR is_duplicate = 0)
-          AND (is_semantic_duplicate IS NULL OR is_semantic_duplicate = 0)
-        GROUP BY sentiment
-    """, (date,))
-
-    rows = cursor.fetchall()
-
-    # Count by sentiment
-    counts = {'positive': 0, 'negative': 0, 'neutral': 0, 'mixed': 0}
-    for row in rows:
-        sentiment = row[0]
-        count = row[1]
-        if sentiment in counts:
-            counts[sentiment] = count
+    # One row, kept current by triggers on events (same signal as before:
+    # non-duplicate events with a sentiment, published that day)
+    counts = db.get_daily_sentiment(date)
 
-    total = sum(counts.values())
+    total = counts['total_analyzed']
 
     if total == 0:
         return {
@@ -132,7 +111,7 @@ def get_top_events(db: EventDatabase, date: str, limit: int = 3) -> str:
     cursor.execute("""
         SELECT title, significance_score, sentiment, companies
         FROM events
-        WHERE DATE(published_at) = ?
+        WHERE published_date = ?
           AND significance_score IS NOT NULL
           AND (is_duplicate IS NULL OR is_duplicate = 0)
           AND (is_semantic_duplicate IS NULL OR is_semantic_duplicate = 0)
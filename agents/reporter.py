@@ -15,6 +15,11 @@ from storage.db import EventDatabase
 from models.events import EventType
 
 
+# Columns the listings print - content and analysis text are never loaded
+LISTING_FIELDS = ('title', 'summary', 'event_type', 'companies', 'source', 'source_url',
+                  'published_at', 'collected_at')
+
+
 class SimpleReporter:
     """
     Generates reports from collected data.
@@ -46,7 +51,7 @@ class SimpleReporter:
         print("=" * 80)
 
         # Get recent events
-        events = self.db.get_recent_events(limit=100, hours=hours)
+        events = self.db.get_recent_events(limit=100, hours=hours, fields=LISTING_FIELDS)
 
         if not events:
             print("\nNo events collected in the last {hours} hours.")
@@ -129,7 +134,7 @@ class SimpleReporter:
 
     def show_recent(self, limit: int = 20, hours: int = 24):
         """Show recent events in simple list format"""
-        events = self.db.get_recent_events(limit=limit, hours=hours)
+        events = self.db.get_recent_events(limit=limit, hours=hours, fields=LISTING_FIELDS)
 
         print(f"\n{len(events)} most recent events (last {hours} hours):\n")
 
@@ -11,7 +11,13 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from datetime import datetime, timedelta
 from storage.db import EventDatabase
-from models.events import EventType
+from models.events import EventType, EventRow
+
+
+# Columns the briefing prints - full content and raw analysis are never loaded
+BRIEFING_FIELDS = ('title', 'event_type', 'significance_score', 'sentiment', 'implications',
+                   'affected_parties', 'investment_relevance', 'key_context', 'companies',
+                   'published_at', 'source_url')
 
 
 class IntelligentReporter:
@@ -37,7 +43,7 @@ class IntelligentReporter:
         print("=" * 80)
 
         # Get analyzed events
-        events = self.db.get_recent_events(limit=100, hours=hours)
+        events = self.db.get_recent_events(limit=100, hours=hours, fields=BRIEFING_FIELDS)
 
         # Filter for analyzed events only
         analyzed = [e for e in events if e.significance_score is not None]
@@ -180,15 +186,14 @@ class IntelligentReporter:
 
         cursor = self.db.conn.cursor()
         cursor.execute("""
-            SELECT * FROM events
+            SELECT id, title, significance_score, sentiment, implications FROM events
             WHERE significance_score IS NOT NULL
               AND collected_at >= ?
             ORDER BY significance_score DESC
             LIMIT ?
         """, (cutoff.isoformat(), limit))
 
-        from models.events import Event
-        events = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
+        events = [EventRow(row) for row in cursor.fetchall()]
 
         if not events:
             print("\nNo analyzed events found in this period.")
@@ -0,0 +1,63 @@
+"""
+Full-text search over collected events.
+
+Searches titles, content, analysis and implications through the events_fts
+index (see EventDatabase.search), ranked by BM25 with matched words
+highlighted.
+
+Usage:
+    python agents/search.py "export controls"
+    python agents/search.py "nvidia h20" --days 7 --min-score 60
+    python agents/search.py 'title:anthropic OR title:openai' --raw
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from datetime import datetime, timedelta
+from storage.db import EventDatabase
+
+
+def show_results(results: list, query: str):
+    """Print search results in the reporter's list format"""
+    print(f"\n{len(results)} results for '{query}':\n")
+
+    for i, result in enumerate(results, 1):
+        event = result['event']
+        when = event.published_at or event.collected_at
+        time_str = when.strftime("%Y-%m-%d %H:%M") if when else "unknown date"
+        score = f" | score {event.significance_score:.0f}" if event.significance_score is not None else ""
+
+        print(f"{i}. [{event.event_type.value}] {event.title}")
+        print(f"   {event.source.value} | {time_str}{score}")
+        print(f"   {' '.join(result['snippet'].split())}")
+        print(f"   {event.source_url}\n")
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Full-text search over collected events')
+    parser.add_argument('query', type=str,
+                       help='Words to search for (all must match; word* for prefix)')
+    parser.add_argument('--days', type=int, default=None,
+                       help='Only events published in the last N days')
+    parser.add_argument('--min-score', type=float, default=None,
+                       help='Only events with significance score at or above this')
+    parser.add_argument('--limit', type=int, default=20,
+                       help='Max results to show (default: 20)')
+    parser.add_argument('--raw', action='store_true',
+                       help='Treat query as FTS5 syntax (OR, NOT, "phrase", title:word)')
+    parser.add_argument('--db', type=str, default='ai_pulse.db',
+                       help='Database file path (default: ai_pulse.db)')
+
+    args = parser.parse_args()
+
+    since = datetime.utcnow() - timedelta(days=args.days) if args.days else None
+
+    with EventDatabase(args.db) as db:
+        results = db.search(args.query, since=since, limit=args.limit,
+                            min_score=args.min_score, raw=args.raw)
+        show_results(results, args.query)
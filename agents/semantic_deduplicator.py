@@ -11,6 +11,12 @@ Example: These are all the same story but <75% string similarity:
 
 Must run BEFORE analyzer.py to avoid wasting analysis costs and ensure
 accurate sentiment percentages.
+
+With prefilter=True (--prefilter), titles are pre-clustered locally first
+(analysis/title_vectors.py): near-identical rewordings are merged without
+an API call and only ambiguous clusters are sent to Claude. It is off by
+default - on benchmarks/semantic_prefilter.py it still sends most titles
+and avoids no calls, so it isn't worth the extra pass yet.
 """
 
 import sys
@@ -26,6 +32,9 @@ from storage.db import EventDatabase
 from models.events import Event
 from typing import List, Dict
 from cost_tracking.tracker import CostTracker
+from analysis.title_vectors import cluster_titles, merge_groups, pack_chunks
+from analysis.llm_pool import RateLimiter, map_concurrently, with_retry
+from analysis.llm_cache import ResponseCache
 
 
 class SemanticDeduplicator:
@@ -37,8 +46,27 @@ class SemanticDeduplicator:
     from being analyzed multiple times with different wording.
     """
 
-    def __init__(self, db_path: str = "ai_pulse.db", enable_cost_tracking: bool = True):
-        """Initialize semantic deduplicator with Claude API"""
+    # Titles per Claude request. Larger days are split into several requests
+    # (overlapping windows where one cluster is bigger than this), so the
+    # prompt stays small and the JSON reply fits in max_tokens.
+    CHUNK_SIZE = 60
+    CHUNK_OVERLAP = 15
+
+    def __init__(self, db_path: str = "ai_pulse.db", enable_cost_tracking: bool = True,
+                 prefilter: bool = False, max_workers: int = 4, requests_per_minute: int = 50,
+                 use_cache: bool = True):
+        """
+        Initialize semantic deduplicator with Claude API.
+
+        Args:
+            db_path: Path to SQLite database
+            enable_cost_tracking: Log API usage to the cost tracker
+            prefilter: Pre-cluster titles locally and only send ambiguous
+                clusters to Claude (default False: every title is sent)
+            max_workers: Max concurrent requests when a day needs several
+            requests_per_minute: Rate limit across all requests
+            use_cache: Answer repeated prompts from the on-disk response cache
+        """
         load_dotenv()
 
         self.api_key = os.getenv('ANTHROPIC_API_KEY')
@@ -48,9 +76,14 @@ class SemanticDeduplicator:
                 "Get key at: https://console.anthropic.com/"
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # with_retry is the only retry layer (SDK retries would skip the rate limiter)
+        self.client = Anthropic(api_key=self.api_key, max_retries=0)
         self.db = EventDatabase(db_path)
         self.cost_tracker = CostTracker() if enable_cost_tracking else None
+        self.prefilter = prefilter
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate=requests_per_minute, per=60, burst=max_workers)
+        self.cache = ResponseCache() if use_cache else None
 
     def find_semantic_duplicates(self, days_back: int = 7) -> Dict:
         """
@@ -72,42 +105,32 @@ class SemanticDeduplicator:
         # Get unanalyzed events from recent days
         cutoff = datetime.utcnow() - timedelta(days=days_back)
 
+        # The analysis queue holds exactly the unanalyzed, non-duplicate events.
+        # Stream them one date at a time (oldest first) - titles are all
+        # dedup needs, so content and analysis text aren't loaded
         cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM events
-            WHERE significance_score IS NULL
-              AND collected_at >= ?
-              AND (is_duplicate IS NULL OR is_duplicate = 0)
-            ORDER BY published_at DESC
-        """, (cutoff.isoformat(),))
-
-        events = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
-
-        if not events:
-            print("\n✓ No unanalyzed events found")
-            return {'processed': 0, 'duplicates_found': 0}
-
-        print(f"\nFound {len(events)} unanalyzed events to check")
-
-        # Group by date for batch processing
-        from collections import defaultdict
-        by_date = defaultdict(list)
-
-        for event in events:
-            date = event.published_at.date() if event.published_at else event.collected_at.date()
-            by_date[date].append(event)
+        days = self.db.iter_events(
+            "id IN (SELECT event_id FROM analysis_queue WHERE collected_at >= ?)",
+            (cutoff.isoformat(),), fields=('title',), order='published_at DESC',
+        )
 
+        processed = 0
         total_duplicates = 0
+        calls = {'made': 0, 'avoided': 0, 'titles_sent': 0}
 
         # Process each date
-        for date, date_events in sorted(by_date.items()):
+        for date, date_events in days:
+            processed += len(date_events)
             if len(date_events) < 2:
                 print(f"\n{date}: Only 1 event, skipping")
                 continue
 
             print(f"\n{date}: Checking {len(date_events)} events for semantic duplicates...")
 
-            duplicates = self._find_duplicates_for_date(date_events)
+            if self.prefilter:
+                duplicates = self._prefiltered_duplicates_for_date(date_events, calls)
+            else:
+                duplicates = self._find_duplicates_for_date(date_events, calls=calls)
 
             if duplicates:
                 print(f"  → Found {len(duplicates)} semantic duplicate groups")
@@ -128,32 +151,109 @@ class SemanticDeduplicator:
             else:
                 print(f"  → No semantic duplicates found")
 
+        if not processed:
+            print("\n✓ No unanalyzed events found")
+            return {'processed': 0, 'duplicates_found': 0}
+
         print("\n" + "=" * 80)
         print(f"COMPLETE: {total_duplicates} semantic duplicates marked")
+        print(f"Claude calls: {calls['made']} made, {calls['avoided']} avoided "
+              f"({calls['titles_sent']}/{processed} titles sent)")
         print("=" * 80)
 
         return {
-            'processed': len(events),
-            'duplicates_found': total_duplicates
+            'processed': processed,
+            'duplicates_found': total_duplicates,
+            'api_calls': calls['made'],
+            'api_calls_avoided': calls['avoided'],
+            'titles_sent': calls['titles_sent'],
         }
 
-    def _find_duplicates_for_date(self, events: List[Event]) -> List[List[int]]:
+    def _prefiltered_duplicates_for_date(self, events: List[Event], calls: Dict) -> List[List[int]]:
+        """
+        Find duplicate groups for a date, asking Claude only about ambiguous clusters.
+
+        Args:
+            events: List of events from the same date
+            calls: Counters updated in place ('made', 'avoided', 'titles_sent')
+
+        Returns:
+            Duplicate groups as lists of indices into events, earliest first
+        """
+        clusters = cluster_titles([event.title for event in events], max_cluster=self.CHUNK_SIZE)
+        groups = list(clusters['duplicates'])
+
+        if clusters['duplicates']:
+            merged = sum(len(group) - 1 for group in clusters['duplicates'])
+            print(f"  Local clustering: {merged} near-identical titles merged")
+
+        if clusters['ambiguous']:
+            sent = sum(len(cluster) for cluster in clusters['ambiguous'])
+            print(f"  Sending {sent} titles in {len(clusters['ambiguous'])} "
+                  f"ambiguous clusters to Claude")
+            groups.extend(self._find_duplicates_for_date(events, clusters['ambiguous'], calls))
+        else:
+            print("  No ambiguous clusters - Claude call skipped")
+            calls['avoided'] += 1
+
+        return merge_groups(groups, len(events))
+
+    def _find_duplicates_for_date(self, events: List[Event], blocks: List[List[int]] = None,
+                                  calls: Dict = None) -> List[List[int]]:
         """
         Use Claude to find semantic duplicate groups for a single date.
 
+        Titles are packed into requests of at most CHUNK_SIZE. When that
+        takes more than one request they run concurrently (max_workers, rate
+        limited) and the groups from all replies are merged with union-find.
+
         Args:
             events: List of events from the same date
+            blocks: Index lists to send, each kept in one request where it
+                fits (default: all events, similar titles packed together)
+            calls: Counters updated in place ('made', 'titles_sent')
 
         Returns:
             List of duplicate groups, each group is list of event indices
             Example: [[1, 3, 5], [7, 9]] means events 1,3,5 are duplicates, 7,9 are duplicates
         """
+        if blocks is None:
+            blocks = [list(range(len(events)))]
+            if len(events) > self.CHUNK_SIZE:
+                # Keep likely duplicates in the same request, the rest after
+                clusters = cluster_titles([event.title for event in events],
+                                          max_cluster=self.CHUNK_SIZE)
+                grouped = clusters['duplicates'] + clusters['ambiguous']
+                seen = {idx for block in grouped for idx in block}
+                blocks = grouped + [[idx for idx in range(len(events)) if idx not in seen]]
+
+        chunks = pack_chunks(blocks, self.CHUNK_SIZE, self.CHUNK_OVERLAP)
+        if len(chunks) > 1:
+            print(f"  Splitting into {len(chunks)} requests of up to {self.CHUNK_SIZE} titles")
+
+        prompts = [self._build_prompt([events[idx] for idx in chunk]) for chunk in chunks]
+        responses = map_concurrently(self._request, prompts, max_workers=self.max_workers)
+
+        if calls is not None:
+            calls['made'] += len(chunks)
+            calls['titles_sent'] += sum(len(chunk) for chunk in chunks)
+
+        # Cost logging and parsing happen here, on the thread owning the DBs
+        groups = []
+        for chunk, response in zip(chunks, responses):
+            for group in self._parse_response(response):
+                groups.append([chunk[i] for i in group if 0 <= i < len(chunk)])
+
+        return merge_groups(groups, len(events))
+
+    def _build_prompt(self, events: List[Event]) -> str:
+        """Build the duplicate-grouping prompt for a list of titles"""
         # Build prompt with event titles
         titles_text = ""
         for idx, event in enumerate(events):
             titles_text += f"{idx}. {event.title}\n"
 
-        prompt = f"""You are analyzing news headlines to identify semantic duplicates. Different headlines may report the SAME underlying event with different wording.
+        return f"""You are analyzing news headlines to identify semantic duplicates. Different headlines may report the SAME underlying event with different wording.
 
 Here are headlines from the same day:
 
@@ -174,72 +274,88 @@ If no duplicates found, return:
 {{"duplicate_groups": [], "reasoning": "no semantic duplicates found"}}
 """
 
+    def _request(self, prompt: str):
+        """Send one prompt (runs in pool threads - no DB access here)"""
+        request = {
+            'model': "claude-3-5-haiku-20241022",  # Cheap, fast model for this task
+            'max_tokens': 1000,
+            'messages': [{"role": "user", "content": prompt}],
+        }
+
+        # Every attempt, retries included, waits for the rate limiter
+        def call():
+            return with_retry(lambda: self.client.messages.create(**request),
+                              limiter=self.rate_limiter)
+
         try:
-            response = self.client.messages.create(
-                model="claude-3-5-haiku-20241022",  # Cheap, fast model for this task
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            if self.cache:
+                return self.cache.get_or_call(request, call)
+            return call()
+        except Exception as e:
+            print(f"  ✗ Error calling Claude API: {e}")
+            return None
 
-            # Track cost
-            if self.cost_tracker:
-                self.cost_tracker.log_anthropic_call(
-                    response,
-                    operation='semantic_deduplication',
-                    event_id=None
-                )
+    def _parse_response(self, response) -> List[List[int]]:
+        """
+        Log the cost of a reply and parse its duplicate groups.
 
-            # Parse response
-            response_text = response.content[0].text.strip()
+        Returns:
+            Duplicate groups as indices into the prompt's titles
+        """
+        if response is None:
+            return []
 
-            # Extract JSON - find first { and last }
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}')
+        # Track cost
+        if self.cost_tracker:
+            self.cost_tracker.log_anthropic_call(
+                response,
+                operation='semantic_deduplication',
+                event_id=None
+            )
 
-            if json_start != -1 and json_end != -1 and json_end > json_start:
-                response_text = response_text[json_start:json_end+1]
-            else:
-                # Try markdown code blocks as fallback
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    response_text = response_text[json_start:json_end].strip()
-
-            try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                print(f"  ✗ Error parsing Claude response: {e}")
-                print(f"  Response was: {response_text[:200]}...")
-                return []
-
-            duplicate_groups = result.get('duplicate_groups', [])
-            reasoning = result.get('reasoning', 'no reasoning provided')
-
-            # Convert string indices to integers (Claude may return either format)
-            try:
-                duplicate_groups = [[int(idx) for idx in group] for group in duplicate_groups]
-            except (ValueError, TypeError) as e:
-                print(f"  ✗ Error converting duplicate group indices to integers: {e}")
-                print(f"  Groups were: {duplicate_groups}")
-                return []
-
-            if duplicate_groups:
-                print(f"  Claude reasoning: {reasoning}")
-
-            return duplicate_groups
+        # Parse response
+        response_text = response.content[0].text.strip()
+
+        # Extract JSON - find first { and last }
+        json_start = response_text.find('{')
+        json_end = response_text.rfind('}')
+
+        if json_start != -1 and json_end != -1 and json_end > json_start:
+            response_text = response_text[json_start:json_end+1]
+        else:
+            # Try markdown code blocks as fallback
+            if "```json" in response_text:
+                json_start = response_text.find("```json") + 7
+                json_end = response_text.find("```", json_start)
+                response_text = response_text[json_start:json_end].strip()
+            elif "```" in response_text:
+                json_start = response_text.find("```") + 3
+                json_end = response_text.find("```", json_start)
+                response_text = response_text[json_start:json_end].strip()
 
+        try:
+            result = json.loads(response_text)
         except json.JSONDecodeError as e:
             print(f"  ✗ Error parsing Claude response: {e}")
             print(f"  Response was: {response_text[:200]}...")
             return []
-        except Exception as e:
-            print(f"  ✗ Error calling Claude API: {e}")
+
+        duplicate_groups = result.get('duplicate_groups', [])
+        reasoning = result.get('reasoning', 'no reasoning provided')
+
+        # Convert string indices to integers (Claude may return either format)
+        try:
+            duplicate_groups = [[int(idx) for idx in group] for group in duplicate_groups]
+        except (ValueError, TypeError) as e:
+            print(f"  ✗ Error converting duplicate group indices to integers: {e}")
+            print(f"  Groups were: {duplicate_groups}")
             return []
 
+        if duplicate_groups:
+            print(f"  Claude reasoning: {reasoning}")
+
+        return duplicate_groups
+
     def _ensure_column_exists(self):
         """Add is_semantic_duplicate column if it doesn't exist"""
         cursor = self.db.conn.cursor()
@@ -272,6 +388,8 @@ if __name__ == "__main__":
                        help='Days back to check (default: 7)')
     parser.add_argument('--db', type=str, default='ai_pulse.db',
                        help='Database path (default: ai_pulse.db)')
+    parser.add_argument('--prefilter', action='store_true',
+                       help='Pre-cluster titles locally and only send ambiguous clusters to Claude')
 
     args = parser.parse_args()
 
@@ -282,5 +400,5 @@ if __name__ == "__main__":
         print("Get key at: https://console.anthropic.com/")
         sys.exit(1)
 
-    with SemanticDeduplicator(db_path=args.db) as deduplicator:
+    with SemanticDeduplicator(db_path=args.db, prefilter=args.prefilter) as deduplicator:
         deduplicator.find_semantic_duplicates(days_back=args.days)
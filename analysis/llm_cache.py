@@ -0,0 +1,198 @@
+"""
+On-disk cache of Claude responses.
+
+Re-running the analyzer (reanalyze_low_scores), the retroactive semantic
+dedup or a retried workflow sends prompts Claude has already answered.
+ResponseCache stores each reply under a SHA-256 of the request (model,
+max_tokens, messages) in a small SQLite file, so an identical request is
+answered from disk.
+
+- Entries expire after ttl_days
+- The file is kept under max_mb by evicting least-recently-used entries
+- Cached replies come back as CachedResponse (cached = True), which
+  CostTracker logs as a zero-cost call so hit rate shows in cost reports
+
+Safe to share between the analysis pool's threads.
+"""
+
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.connection import close_connection, connect
+
+
+class CachedResponse:
+    """Stands in for an anthropic Message replayed from the cache"""
+
+    cached = True
+
+    def __init__(self, text: str, model: str, input_tokens: int, output_tokens: int):
+        self.content = [SimpleNamespace(type='text', text=text)]
+        self.model = model
+        self.usage = SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens)
+
+
+class ResponseCache:
+    """
+    Content-addressed cache for messages.create calls.
+
+    Usage:
+        cache = ResponseCache()
+        response = cache.create(client, model=..., max_tokens=..., messages=[...])
+        response = cache.get_or_call(request, lambda: with_retry(...))
+    """
+
+    def __init__(self, db_path: str = "llm_cache.db", ttl_days: float = 30, max_mb: float = 100):
+        """
+        Args:
+            db_path: Path to the cache database
+            ttl_days: Days before an entry is considered stale
+            max_mb: Size limit for stored responses (LRU eviction beyond it)
+        """
+        self.db_path = db_path
+        self.ttl = timedelta(days=ttl_days)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.conn = connect(db_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create cache schema if it doesn't exist"""
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_used TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_responses_last_used
+                ON responses(last_used)
+            """)
+            self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, messages: list, **params) -> str:
+        """Hash of everything that determines the reply"""
+        request = {'model': model, 'max_tokens': max_tokens, 'messages': messages, **params}
+        encoded = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a fresh entry, marking it recently used"""
+        now = datetime.utcnow()
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT model, text, input_tokens, output_tokens, created_at
+                FROM responses WHERE key = ?
+            """, (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            model, text, input_tokens, output_tokens, created_at = row
+            if datetime.fromisoformat(created_at) < now - self.ttl:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                return None
+
+            self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?",
+                              (now.isoformat(), key))
+            self.conn.commit()
+
+        return CachedResponse(text, model, input_tokens, output_tokens)
+
+    def put(self, key: str, response):
+        """Store a response, evicting LRU entries if over the size limit"""
+        text = ''.join(getattr(block, 'text', '') for block in response.content)
+        now = datetime.utcnow().isoformat()
+
+        with self._lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO responses (
+                    key, model, text, input_tokens, output_tokens, size, created_at, last_used
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, response.model, text, response.usage.input_tokens,
+                  response.usage.output_tokens, len(text.encode('utf-8')), now, now))
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until under max_bytes (lock held)"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def get_or_call(self, request: dict, call: Callable[[], Any]):
+        """
+        Answer request from the cache, or make it with call and store the reply.
+
+        Args:
+            request: The messages.create keyword arguments (used for the key)
+            call: Makes the live request (e.g. wrapped in retries/rate limiting)
+
+        Returns:
+            CachedResponse on a hit, otherwise the live response
+        """
+        key = self.make_key(**request)
+
+        cached = self.get(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        response = call()
+        with self._lock:
+            self.misses += 1
+        self.put(key, response)
+        return response
+
+    def create(self, client, **request):
+        """Drop-in for client.messages.create that answers repeats from the cache"""
+        return self.get_or_call(request, lambda: client.messages.create(**request))
+
+    def stats(self) -> dict:
+        """Hit/miss counts for this process plus what's on disk"""
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'bytes': size}
+
+    def close(self):
+        """Close database connection"""
+        close_connection(self.conn)
+
+    def __enter__(self):
+        """Context manager support"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close connection when exiting context"""
+        self.close()
@@ -0,0 +1,143 @@
+"""
+Concurrency helpers for Claude API calls.
+
+Anthropic clients are thread-safe, so independent prompts can be sent from
+a thread pool. The pool only makes the HTTP calls - results come back to
+the calling thread in input order, so anything that touches SQLite (cost
+tracking, saving results) stays on the thread that owns the connection.
+
+with_retry re-sends a request that failed with a rate limit (429), an
+overload/server error (5xx) or a connection error, backing off
+exponentially with jitter (or as long as the API's retry-after asks).
+"""
+
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import anthropic
+
+
+# HTTP statuses worth retrying: timeout, conflict, rate limit, server errors, overloaded
+RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all pool workers.
+
+    Usage:
+        limiter = RateLimiter(rate=50, per=60)   # 50 requests/minute
+        limiter.acquire()                        # blocks until a token is free
+    """
+
+    def __init__(self, rate: float, per: float = 60.0, burst: Optional[int] = None):
+        """
+        Args:
+            rate: Requests allowed per `per` seconds
+            per: Window length in seconds
+            burst: Max requests sent back-to-back (default: rate)
+        """
+        self.interval = per / rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.interval
+
+            time.sleep(wait)
+
+
+def map_concurrently(fn: Callable[[Any], Any], items: List[Any], max_workers: int = 4,
+                     limiter: Optional[RateLimiter] = None) -> List[Any]:
+    """
+    Call fn on every item from a thread pool.
+
+    Args:
+        fn: Called once per item (must not touch SQLite connections)
+        items: Inputs
+        max_workers: Max calls in flight
+        limiter: Rate limit applied before each call
+
+    Returns:
+        Results in the same order as items. An exception raised by fn is
+        re-raised here.
+    """
+    def call(item):
+        if limiter:
+            limiter.acquire()
+        return fn(item)
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [call(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)),
+                            thread_name_prefix='llm') as executor:
+        return list(executor.map(call, items))
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed API call is worth sending again"""
+    if isinstance(error, anthropic.APIConnectionError):  # Includes timeouts
+        return True
+    return getattr(error, 'status_code', None) in RETRY_STATUSES
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait, if it said"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def with_retry(fn: Callable[[], Any], retries: int = 4, base_delay: float = 1.0,
+               max_delay: float = 30.0, limiter: Optional[RateLimiter] = None) -> Any:
+    """
+    Call fn, retrying retryable API errors with exponential backoff.
+
+    Args:
+        fn: Zero-argument callable making one API request
+        retries: Extra attempts after the first
+        base_delay: Delay before the first retry (doubles each time)
+        max_delay: Cap on any single delay
+        limiter: Rate limit applied before every attempt, retries included
+
+    Returns:
+        fn's result. The last error is raised once retries run out, and
+        non-retryable errors are raised immediately.
+    """
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+
+            delay = _retry_after(e)
+            if delay is None:
+                delay = base_delay * 2 ** attempt * random.uniform(0.5, 1.0)
+            delay = min(delay, max_delay)
+
+            status = getattr(e, 'status_code', None) or type(e).__name__
+            print(f"  ⚠ API error ({status}), retrying in {delay:.1f}s "
+                  f"[{attempt + 1}/{retries}]")
+            time.sleep(delay)
@@ -21,6 +21,8 @@ from typing import Optional
 from models.events import Event, EventType
 from datetime import datetime
 from cost_tracking.tracker import CostTracker
+from analysis.llm_pool import RateLimiter, map_concurrently, with_retry
+from analysis.llm_cache import ResponseCache
 
 
 class SignificanceAnalyzer:
@@ -38,13 +40,19 @@ class SignificanceAnalyzer:
     # Model for analysis - Haiku for beta (cheap), upgrade to Sonnet/Opus later
     ANALYSIS_MODEL = "claude-3-5-haiku-20241022"
 
-    def __init__(self, api_key: Optional[str] = None, enable_cost_tracking: bool = True):
+    def __init__(self, api_key: Optional[str] = None, enable_cost_tracking: bool = True,
+                 max_workers: int = 4, requests_per_minute: int = 50, max_retries: int = 4,
+                 use_cache: bool = True):
         """
         Initialize analyzer with Claude API.
 
         Args:
             api_key: Anthropic API key. If None, reads from ANTHROPIC_API_KEY env var
             enable_cost_tracking: Whether to track API costs (default: True)
+            max_workers: Events analyzed concurrently by analyze_batch (1 = one at a time)
+            requests_per_minute: Rate limit across all analysis requests
+            max_retries: Retries per event on 429/5xx/connection errors
+            use_cache: Answer repeated prompts from the on-disk response cache
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         if not self.api_key:
@@ -53,11 +61,20 @@ class SignificanceAnalyzer:
                 "or pass api_key parameter. Get key at: https://console.anthropic.com/"
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # with_retry is the only retry layer (SDK retries would skip the rate limiter)
+        self.client = Anthropic(api_key=self.api_key, max_retries=0)
 
         # Initialize cost tracker
         self.cost_tracker = CostTracker() if enable_cost_tracking else None
 
+        # Concurrency settings for analyze_batch
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(rate=requests_per_minute, per=60, burst=max_workers)
+
+        # Re-analysis of unchanged events is answered from disk
+        self.cache = ResponseCache() if use_cache else None
+
     def analyze_event(self, event: Event) -> dict:
         """
         Analyze an event's significance using Claude.
@@ -76,21 +93,43 @@ class SignificanceAnalyzer:
             - affected_parties: Who cares?
         """
 
+        response = self._request_analysis(event)
+        return self._finish_analysis(event, response)
+
+    def _request_analysis(self, event: Event):
+        """
+        Send the analysis request for an event, retrying transient errors.
+
+        Safe to call from pool threads - it never touches a database.
+        """
         # Build context for Claude
         prompt = self._build_analysis_prompt(event)
 
-        # Ask Claude to reason about significance
-        response = self.client.messages.create(
-            model=self.ANALYSIS_MODEL,
-            max_tokens=1500,
-            messages=[
+        request = {
+            'model': self.ANALYSIS_MODEL,
+            'max_tokens': 1500,
+            'messages': [
                 {
                     "role": "user",
                     "content": prompt
                 }
-            ]
-        )
+            ],
+        }
+
+        # Ask Claude to reason about significance
+        def call():
+            return with_retry(
+                lambda: self.client.messages.create(**request),
+                retries=self.max_retries,
+                limiter=self.rate_limiter,
+            )
+
+        if self.cache:
+            return self.cache.get_or_call(request, call)
+        return call()
 
+    def _finish_analysis(self, event: Event, response) -> dict:
+        """Log the cost of an analysis response and parse it"""
         # Track cost
         if self.cost_tracker:
             cost = self.cost_tracker.log_anthropic_call(
@@ -244,10 +283,21 @@ and broader AI sector trends."""
 
         return result
 
+    def _request_outcome(self, event: Event) -> tuple:
+        """Pool worker: (response, None) on success, (None, error) on failure"""
+        try:
+            return self._request_analysis(event), None
+        except Exception as e:
+            return None, e
+
     def analyze_batch(self, events: list[Event], max_analyze: int = 10) -> dict:
         """
         Analyze multiple events using Haiku (beta mode - cost optimized).
 
+        Up to max_workers requests are in flight at once (rate limited, with
+        retries). Results are returned in priority order whatever order the
+        responses arrive in.
+
         Args:
             events: List of events to analyze
             max_analyze: Maximum number to analyze
@@ -278,30 +328,47 @@ and broader AI sector trends."""
 
         analyzed = []
         skipped = []
+        queue = list(enumerate(sorted_events, 1))
 
-        for i, event in enumerate(sorted_events):
-            if len(analyzed) >= max_analyze:
-                skipped.append(event)
-                continue
+        if self.max_workers > 1:
+            print(f"Running up to {self.max_workers} requests at a time")
 
-            print(f"\n[{i+1}/{len(sorted_events)}] Analyzing: {event.title[:70]}...")
+        # Requests run concurrently; responses are handled here in priority
+        # order. Events that fail are replaced by the next ones in the queue
+        # until max_analyze succeed or the queue runs out.
+        while queue and len(analyzed) < max_analyze:
+            batch = queue[:max_analyze - len(analyzed)]
+            queue = queue[len(batch):]
+
+            outcomes = map_concurrently(self._request_outcome, [event for _, event in batch],
+                                        max_workers=self.max_workers)
+
+            for (i, event), (response, error) in zip(batch, outcomes):
+                print(f"\n[{i}/{len(sorted_events)}] Analyzing: {event.title[:70]}...")
+
+                if error:
+                    print(f"  ✗ Error analyzing event: {error}")
+                    skipped.append(event)
+                    continue
+
+                try:
+                    analysis = self._finish_analysis(event, response)
 
-            try:
-                analysis = self.analyze_event(event)
+                    analyzed.append({
+                        'event': event,
+                        'analysis': analysis,
+                    })
 
-                analyzed.append({
-                    'event': event,
-                    'analysis': analysis,
-                })
+                    # Show score
+                    score = analysis['significance_score']
+                    sentiment = analysis['sentiment']
+                    print(f"  → Score: {score}/100 | Sentiment: {sentiment}")
 
-                # Show score
-                score = analysis['significance_score']
-                sentiment = analysis['sentiment']
-                print(f"  → Score: {score}/100 | Sentiment: {sentiment}")
+                except Exception as e:
+                    print(f"  ✗ Error analyzing event: {e}")
+                    skipped.append(event)
 
-            except Exception as e:
-                print(f"  ✗ Error analyzing event: {e}")
-                skipped.append(event)
+        skipped.extend(event for _, event in queue)
 
         print("\n" + "=" * 80)
         print(f"Analysis complete: {len(analyzed)} analyzed, {len(skipped)} skipped (limit)")
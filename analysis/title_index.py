@@ -0,0 +1,216 @@
+"""
+Candidate pruning for near-duplicate title detection.
+
+String deduplication compares titles with difflib.SequenceMatcher, which is
+slow per pair (~0.3ms) and was run against every earlier title of the same
+day. TitleIndex returns only the earlier titles that *can* reach the
+similarity the caller needs, using two upper bounds on
+SequenceMatcher.ratio() = 2 * matches / total length:
+
+- character counts: matches can't exceed the characters the titles have in
+  common (quick_ratio's bound), computed for every indexed title at once
+  with numpy
+- longest common subsequence: matching blocks are in order in both titles,
+  so matches can't exceed the LCS, computed bit-parallel (Hyyro) for all
+  survivors at once - one numpy step per character position
+
+Both are exact upper bounds, so pruning never changes a decision: a title
+left out could not have passed the caller's check. Titles that share a tag
+(a company) can be given a lower ratio floor, matching the 0.6 +
+shared-company rule. The exact check and thresholds stay with the caller.
+benchmarks/title_dedup.py checks agreement with the brute-force loop.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Too common in headlines to say anything about whether two are the same story
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has',
+    'have', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this',
+    'to', 'was', 'will', 'with', 'new', 'says', 'after', 'over', 'how', 'why',
+})
+
+# Character buckets (1 + code point mod BUCKETS - 1; 0 pads stored titles).
+# Printable ASCII gets a bucket per character; other characters share
+# buckets, which only loosens the bounds.
+BUCKETS = 128
+
+# Bits per word of the LCS bit vectors
+WORD = 64
+
+# Set bits per byte value, for popcounts over uint64 arrays
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title the same way the similarity check does"""
+    return (title or '').lower().strip()
+
+
+def content_tokens(normalized: str) -> List[str]:
+    """Words of a normalized title, minus stopwords"""
+    return [t for t in _TOKEN_RE.findall(normalized) if t not in STOPWORDS]
+
+
+def char_codes(normalized: str) -> np.ndarray:
+    """Bucket code (1..BUCKETS-1) of each character of a normalized title"""
+    codes = np.frombuffer(normalized.encode('utf-32-le'), dtype=np.uint32)
+    return (codes % (BUCKETS - 1) + 1).astype(np.uint8)
+
+
+def char_counts(normalized: str) -> np.ndarray:
+    """Character counts of a normalized title, by bucket"""
+    return np.bincount(char_codes(normalized), minlength=BUCKETS).astype(np.uint8)
+
+
+def lcs_lengths(title: str, others: np.ndarray) -> np.ndarray:
+    """
+    Longest common subsequence of a title with each of many titles (by bucket).
+
+    Bit-parallel (Hyyro), with the bits over title's positions and one
+    vectorized step per position of the others - split into 64-bit words,
+    with the carry of the addition passed up between words.
+
+    Args:
+        title: Normalized title
+        others: Bucket codes of the other titles, one row each (0-padded)
+
+    Returns:
+        LCS length per row
+    """
+    codes = char_codes(title)
+    length = len(codes)
+    words = max(1, -(-length // WORD))
+
+    # masks[word, bucket]: bits of title's positions holding that bucket
+    masks = np.zeros((words, BUCKETS), dtype=np.uint64)
+    for position, code in enumerate(codes.tolist()):
+        masks[position // WORD, code] |= np.uint64(1 << (position % WORD))
+    masks[:, 0] = 0
+
+    full = np.full(words, np.uint64(2 ** WORD - 1))
+    if length % WORD:
+        full[-1] = np.uint64((1 << (length % WORD)) - 1)
+    if not length:
+        full[:] = 0
+
+    columns = np.ascontiguousarray(others.T)
+    rows = np.repeat(full[:, None], len(others), axis=1)
+    if words == 1:
+        # Titles up to 64 characters - no carries to pass
+        row, mask, ones = rows[0], masks[0], full[0]
+        for column in columns:
+            matched = row & mask[column]
+            row = ((row + matched) | (row - matched)) & ones
+        rows[0] = row
+    else:
+        for column in columns:
+            carry = np.zeros(len(others), dtype=np.uint64)
+            for word in range(words):
+                row = rows[word]
+                matched = row & masks[word][column]
+                total = row + matched
+                overflow = total < row
+                total += carry
+                carry = (overflow | (total < carry)).astype(np.uint64)
+                # row - matched is row & ~matched (matched is a subset of row)
+                rows[word] = (total | (row & ~matched)) & full[word]
+
+    remaining = _POPCOUNT[rows.T.copy().view(np.uint8)].reshape(len(others), -1).sum(axis=1)
+    return length - remaining
+
+
+class TitleIndex:
+    """
+    Earlier titles, with exact pruning for SequenceMatcher ratio thresholds.
+
+    Usage:
+        index = TitleIndex()
+        for event in events:
+            for earlier in index.candidates(event.title, 0.75, tags=event.companies, tag_ratio=0.6):
+                ...exact similarity check...
+            index.add(event, event.title, tags=event.companies)
+    """
+
+    def __init__(self):
+        self._items = []                     # row -> item
+        self._lengths = np.zeros(16, dtype=np.int64)
+        self._counts = np.zeros((16, BUCKETS), dtype=np.uint8)
+        self._codes = np.zeros((16, 0), dtype=np.uint8)   # row -> bucket codes, 0-padded
+        self._tagged = defaultdict(list)     # tag -> rows
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: Any, title: str, tags: Iterable[str] = ()):
+        """Index a title, returning item from later candidate lookups"""
+        normalized = normalize_title(title)
+        codes = char_codes(normalized)
+        row = len(self._items)
+
+        if row == len(self._lengths):
+            self._lengths = np.resize(self._lengths, 2 * row)
+            self._counts = np.resize(self._counts, (2 * row, BUCKETS))
+            self._codes = np.pad(self._codes, ((0, row), (0, 0)))
+        if len(codes) > self._codes.shape[1]:
+            self._codes = np.pad(self._codes, ((0, 0), (0, len(codes) - self._codes.shape[1])))
+
+        self._items.append(item)
+        self._lengths[row] = len(normalized)
+        self._counts[row] = char_counts(normalized)
+        self._codes[row, :len(codes)] = codes
+        for tag in set(tags or ()):
+            self._tagged[tag].append(row)
+
+    def candidates(self, title: str, min_ratio: float, tags: Iterable[str] = (),
+                   tag_ratio: Optional[float] = None) -> List[Any]:
+        """
+        Get indexed items whose similarity to title could reach the threshold.
+
+        Args:
+            title: Title to look up
+            min_ratio: Similarity an item must be able to reach
+            tags: The title's tags (e.g. companies)
+            tag_ratio: Lower floor for items sharing one of those tags
+
+        Returns:
+            Items in the order they were added (earliest first). Every item
+            whose SequenceMatcher ratio with title reaches its threshold is
+            included.
+        """
+        count = len(self._items)
+        if not count:
+            return []
+
+        normalized = normalize_title(title)
+        length = len(normalized)
+
+        thresholds = np.full(count, min_ratio)
+        if tag_ratio is not None:
+            for tag in set(tags or ()):
+                rows = self._tagged.get(tag)
+                if rows:
+                    thresholds[rows] = min(min_ratio, tag_ratio)
+
+        # Bound 1: characters in common, for every indexed title at once
+        totals = self._lengths[:count] + length
+        common = np.minimum(self._counts[:count], char_counts(normalized)).sum(axis=1, dtype=np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bounds = np.where(totals > 0, 2.0 * common / totals, 1.0)
+        rows = np.nonzero(bounds >= thresholds)[0]
+        if not len(rows):
+            return []
+
+        # Bound 2: longest common subsequence, for the survivors at once
+        others = self._codes[rows, :int(self._lengths[rows].max())]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bounds = np.where(totals[rows] > 0, 2.0 * lcs_lengths(normalized, others) / totals[rows], 1.0)
+
+        return [self._items[row] for row in rows[bounds >= thresholds[rows]].tolist()]
@@ -0,0 +1,230 @@
+"""
+Local TF-IDF clustering of headlines ahead of semantic deduplication.
+
+SemanticDeduplicator used to send every title of a day to Claude. Most
+titles have no plausible duplicate at all, and some pairs are near-identical
+rewordings that don't need a model to judge. cluster_titles splits a day's
+titles into:
+
+- duplicates: groups linked by very high cosine similarity - merged locally
+- ambiguous: clusters of related-looking titles that still need Claude
+- everything else: singletons, never sent anywhere
+
+Vectors are TF-IDF over content words and adjacent word pairs, fitted on
+the day's titles, so this runs fully offline.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+
+from analysis.title_index import content_tokens, normalize_title
+
+
+def title_features(title: str) -> List[str]:
+    """Content words and adjacent word pairs of a title"""
+    tokens = content_tokens(normalize_title(title))
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def tfidf_matrix(titles: List[str]) -> np.ndarray:
+    """
+    Build L2-normalized TF-IDF vectors for titles.
+
+    Returns:
+        Array of shape (len(titles), vocabulary size); all-zero rows for
+        titles with no features
+    """
+    features = [title_features(title) for title in titles]
+
+    vocabulary = {}
+    doc_freq = Counter()
+    for feats in features:
+        for feat in set(feats):
+            if feat not in vocabulary:
+                vocabulary[feat] = len(vocabulary)
+            doc_freq[feat] += 1
+
+    matrix = np.zeros((len(titles), max(1, len(vocabulary))), dtype=np.float32)
+    n = len(titles)
+    for row, feats in enumerate(features):
+        for feat, count in Counter(feats).items():
+            # Smoothed idf, as in scikit-learn
+            idf = math.log((1 + n) / (1 + doc_freq[feat])) + 1
+            matrix[row, vocabulary[feat]] = count * idf
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 (path halving, union by size)"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+    def groups(self) -> List[List[int]]:
+        """Sets with more than one member, each sorted, ordered by first member"""
+        members = {}
+        for x in range(len(self.parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return sorted((m for m in members.values() if len(m) > 1), key=lambda m: m[0])
+
+
+def merge_groups(groups: List[List[int]], n: int) -> List[List[int]]:
+    """
+    Merge overlapping index groups (e.g. local and LLM results).
+
+    Indices outside 0..n-1 are ignored.
+
+    Returns:
+        Disjoint groups, each sorted so the earliest index comes first
+    """
+    sets = UnionFind(n)
+    for group in groups:
+        valid = [idx for idx in group if 0 <= idx < n]
+        for idx in valid[1:]:
+            sets.union(valid[0], idx)
+    return sets.groups()
+
+
+def _split_cluster(similarity: np.ndarray, group: List[int], threshold: float,
+                   max_size: int, ceiling: float) -> List[List[int]]:
+    """
+    Break an oversized cluster into tighter ones by raising the threshold.
+
+    Members left without a neighbour at the tighter threshold are returned
+    together as one extra block, so nobody is dropped.
+    """
+    threshold += 0.05
+    if len(group) <= max_size or threshold >= ceiling:
+        return [group]
+
+    local = UnionFind(len(group))
+    sub = similarity[np.ix_(group, group)]
+    rows, cols = np.nonzero(np.triu(sub >= threshold, k=1))
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        local.union(i, j)
+
+    parts = []
+    linked = set()
+    for members in local.groups():
+        linked.update(members)
+        part = [group[m] for m in members]
+        parts.extend(_split_cluster(similarity, part, threshold, max_size, ceiling))
+
+    leftovers = [idx for m, idx in enumerate(group) if m not in linked]
+    if leftovers:
+        parts.append(leftovers)
+    return parts
+
+
+def cluster_titles(titles: List[str], candidate_threshold: float = 0.25,
+                   duplicate_threshold: float = 0.85,
+                   max_cluster: int = None) -> Dict[str, List[List[int]]]:
+    """
+    Pre-cluster a day's titles by TF-IDF cosine similarity.
+
+    Args:
+        titles: Titles from the same day
+        candidate_threshold: Similarity at which two titles might be the
+            same story and need a closer look
+        duplicate_threshold: Similarity at which two titles are treated as
+            the same story without asking Claude (their numbers must match too)
+        max_cluster: Ambiguous clusters larger than this are split into
+            tighter clusters (e.g. to fit one request)
+
+    Returns:
+        {'duplicates': [[i, j, ...], ...], 'ambiguous': [[i, j, ...], ...]}
+        with indices into titles. A candidate cluster is ambiguous unless
+        all of it is one confident duplicate group. Oversized clusters are
+        returned as their parts, next to each other.
+    """
+    n = len(titles)
+    if n < 2:
+        return {'duplicates': [], 'ambiguous': []}
+
+    vectors = tfidf_matrix(titles)
+    similarity = vectors @ vectors.T
+
+    # "$5B" vs "$6B" can be two different stories however similar the rest
+    numbers = [{t for t in content_tokens(normalize_title(title)) if any(c.isdigit() for c in t)}
+               for title in titles]
+
+    candidates = UnionFind(n)
+    duplicates = UnionFind(n)
+    rows, cols = np.nonzero(np.triu(similarity >= candidate_threshold, k=1))
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        candidates.union(i, j)
+        if similarity[i, j] >= duplicate_threshold and numbers[i] == numbers[j]:
+            duplicates.union(i, j)
+
+    confident = duplicates.groups()
+    confident_sets = {tuple(group) for group in confident}
+    ambiguous = []
+    for group in candidates.groups():
+        if tuple(group) in confident_sets:
+            continue
+        if max_cluster:
+            ambiguous.extend(_split_cluster(similarity, group, candidate_threshold,
+                                            max_cluster, duplicate_threshold))
+        else:
+            ambiguous.append(group)
+
+    return {'duplicates': confident, 'ambiguous': ambiguous}
+
+
+def pack_chunks(blocks: List[List[int]], size: int, overlap: int) -> List[List[int]]:
+    """
+    Pack index blocks into prompts of at most size titles.
+
+    Blocks (e.g. candidate clusters) are kept together where they fit.
+    A block larger than size is cut into windows that overlap by overlap
+    titles, so a duplicate pair straddling a cut still lands in one window.
+
+    Returns:
+        List of index chunks, each at most size long
+    """
+    chunks = []
+    current = []
+    step = max(1, size - overlap)
+
+    for block in blocks:
+        if len(block) > size:
+            if current:
+                chunks.append(current)
+                current = []
+            start = 0
+            while True:
+                chunks.append(list(block[start:start + size]))
+                if start + size >= len(block):
+                    break
+                start += step
+        elif len(current) + len(block) > size:
+            chunks.append(current)
+            current = list(block)
+        else:
+            current.extend(block)
+
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,75 @@
+"""
+Move old events out of the live database into monthly archive files.
+
+Whole months of events collected before the horizon go to
+archive/ai_pulse_YYYY-MM.db (see storage/archive.py). Queries that reach
+back past the live table read those files transparently.
+
+The moved events exist only in archive/ afterwards, so commit it together
+with ai_pulse.db (the scheduled workflows add both on every run).
+
+Usage:
+    python archive_events.py                  # archive months older than 180 days
+    python archive_events.py --days 90 --vacuum
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from datetime import datetime, timedelta
+from storage.db import EventDatabase
+
+
+def archive_events(db_path: str = "ai_pulse.db", days: int = 180, vacuum: bool = False):
+    """
+    Archive events older than the horizon.
+
+    Args:
+        db_path: Database path
+        days: Keep at least this many days of events live
+        vacuum: VACUUM afterwards to return the freed pages to the filesystem
+    """
+    print("=" * 80)
+    print("EVENT ARCHIVAL")
+    print("=" * 80)
+
+    db = EventDatabase(db_path)
+    before = datetime.utcnow() - timedelta(days=days)
+
+    print(f"\nArchiving whole months collected before {before.strftime('%Y-%m')}-01...")
+    stats = db.archive.archive(before)
+    print(f"✓ Moved {stats['events']} events ({stats['months']} months)")
+
+    if vacuum and stats['events']:
+        print("\nVacuuming live database...")
+        db.conn.execute("VACUUM")
+        print("✓ Done")
+
+    partitions = db.archive.partitions()
+    if partitions:
+        print(f"\nArchive ({len(partitions)} months):")
+        for partition in partitions:
+            print(f"  {partition['month']}: {partition['events']:>8} events  {partition['path']}")
+        print(f"Live table starts: {db.archive.horizon().strftime('%Y-%m-%d')}")
+        print("Commit archive/ with ai_pulse.db - archived events are not kept anywhere else")
+
+    db.close()
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Move old events into monthly archive files')
+    parser.add_argument('--days', type=int, default=180,
+                       help='Keep at least this many days live (default: 180)')
+    parser.add_argument('--vacuum', action='store_true',
+                       help='VACUUM the live database afterwards')
+    parser.add_argument('--db', type=str, default='ai_pulse.db',
+                       help='Database path (default: ai_pulse.db)')
+
+    args = parser.parse_args()
+
+    archive_events(db_path=args.db, days=args.days, vacuum=args.vacuum)
@@ -0,0 +1,122 @@
+"""
+Benchmark: sequential vs concurrent SignificanceAnalyzer.analyze_batch.
+
+Runs analyze_batch against a fake Anthropic client that sleeps to simulate
+request latency and fails a share of requests with 429/529/500 errors.
+Checks that every worker count analyzes the same events in the same order
+with the same results, and reports wall time. Runs fully offline.
+
+Usage:
+    python benchmarks/analysis_pool.py
+    python benchmarks/analysis_pool.py --events 50 --latency 1.0 --error-rate 0.2
+"""
+
+import io
+import sys
+import time
+import random
+import threading
+import contextlib
+from types import SimpleNamespace
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analysis.significance import SignificanceAnalyzer
+from models.events import Event, EventSource, EventType
+
+
+class FakeAPIError(Exception):
+    """Looks like an anthropic.APIStatusError to the retry logic"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeClient:
+    """Stands in for Anthropic() - latency, transient errors, deterministic replies"""
+
+    def __init__(self, latency: float, error_rate: float, seed: int = 3):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.messages = self
+        self._lock = threading.Lock()
+
+    def create(self, model, max_tokens, messages):
+        prompt = messages[0]['content']
+        with self._lock:
+            self.requests += 1
+            fail = self.rng.random() < self.error_rate
+            status = self.rng.choice([429, 529, 500])
+            if fail:
+                self.errors += 1
+
+        time.sleep(self.latency)
+        if fail:
+            raise FakeAPIError(status)
+
+        # Score derived from the title so every run gives the same answer
+        title = prompt.split('Title: ', 1)[1].split('\n', 1)[0]
+        score = sum(map(ord, title)) % 101
+        text = f"SIGNIFICANCE SCORE: {score}\nSENTIMENT: neutral\n\nREASONING:\n{title}\n"
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], model=model,
+                               usage=SimpleNamespace(input_tokens=500, output_tokens=200))
+
+
+def make_events(count: int) -> list:
+    types = [EventType.NEWS, EventType.PRODUCT_LAUNCH, EventType.FUNDING, EventType.RESEARCH]
+    return [Event(id=i, source=EventSource.MANUAL, source_id=str(i),
+                  title=f"Synthetic headline number {i} about AI",
+                  event_type=types[i % len(types)])
+            for i in range(count)]
+
+
+def run(events: int, latency: float, error_rate: float, worker_counts: list):
+    print("=" * 80)
+    print(f"ANALYSIS POOL BENCHMARK: {events} events, {latency}s latency, "
+          f"{error_rate:.0%} transient errors")
+    print("=" * 80)
+
+    baseline = None
+    for workers in worker_counts:
+        analyzer = SignificanceAnalyzer(api_key='offline', enable_cost_tracking=False,
+                                        max_workers=workers, requests_per_minute=6000,
+                                        max_retries=4, use_cache=False)
+        analyzer.client = FakeClient(latency, error_rate)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = analyzer.analyze_batch(make_events(events), max_analyze=events)
+        elapsed = time.perf_counter() - start
+
+        outcome = [(item['event'].id, item['analysis']['significance_score'])
+                   for item in result['analyzed']]
+        if baseline is None:
+            baseline = outcome
+        same = "✓ same results" if outcome == baseline else "✗ results differ"
+
+        print(f"  workers={workers:<3} {elapsed:7.2f}s  {len(result['analyzed'])} analyzed, "
+              f"{analyzer.client.requests} requests ({analyzer.client.errors} retried)  {same}")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark concurrent event analysis')
+    parser.add_argument('--events', type=int, default=50,
+                       help='Events to analyze (default: 50)')
+    parser.add_argument('--latency', type=float, default=0.5,
+                       help='Simulated seconds per request (default: 0.5)')
+    parser.add_argument('--error-rate', type=float, default=0.1,
+                       help='Share of requests failing with 429/5xx (default: 0.1)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8],
+                       help='Worker counts to compare (default: 1 4 8)')
+
+    args = parser.parse_args()
+
+    run(args.events, args.latency, args.error_rate, args.workers)
@@ -0,0 +1,96 @@
+"""
+Benchmark: per-row vs batched event inserts.
+
+Inserts synthetic Events into a temporary database twice - once through
+save_event (one INSERT + commit per row) and once through save_events
+(executemany in a single transaction) - then re-inserts the batch to
+check duplicate counting.
+
+Usage:
+    python benchmarks/bulk_insert.py
+    python benchmarks/bulk_insert.py --rows 100000 --per-row-rows 10000
+"""
+
+import sys
+import time
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase
+from models.events import Event, EventSource, EventType
+
+
+def make_events(count: int, prefix: str = "bench") -> list:
+    """Build synthetic events with unique source ids"""
+    now = datetime.utcnow()
+    return [
+        Event(
+            source=EventSource.HACKER_NEWS,
+            source_id=f"{prefix}-{i}",
+            source_url=f"https://example.com/{prefix}/{i}",
+            title=f"Synthetic AI headline number {i} about NVIDIA and OpenAI",
+            content="Lorem ipsum dolor sit amet. " * 8,
+            event_type=EventType.NEWS,
+            companies=["NVIDIA", "OpenAI"],
+            published_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def run(rows: int, per_row_rows: int):
+    print("=" * 80)
+    print(f"BULK INSERT BENCHMARK: {rows:,} events (per-row path: {per_row_rows:,})")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Per-row path: one commit per event
+        if per_row_rows:
+            events = make_events(per_row_rows, prefix="single")
+            with EventDatabase(str(Path(tmp) / "per_row.db")) as db:
+                start = time.perf_counter()
+                for event in events:
+                    db.save_event(event)
+                elapsed = time.perf_counter() - start
+            per_row_rate = per_row_rows / elapsed
+            print(f"  save_event loop:  {elapsed:8.2f}s  {per_row_rate:>10,.0f} rows/s")
+
+        # Bulk path: single transaction
+        events = make_events(rows, prefix="bulk")
+        with EventDatabase(str(Path(tmp) / "bulk.db")) as db:
+            start = time.perf_counter()
+            result = db.save_events(events)
+            elapsed = time.perf_counter() - start
+            bulk_rate = rows / elapsed
+            print(f"  save_events:      {elapsed:8.2f}s  {bulk_rate:>10,.0f} rows/s  {result}")
+
+            # Re-insert: everything should be reported as a duplicate
+            start = time.perf_counter()
+            again = db.save_events(events[: rows // 2] + make_events(10, prefix="fresh"))
+            elapsed_again = time.perf_counter() - start
+            print(f"  re-insert half:   {elapsed_again:8.2f}s  {again}")
+
+            expected = {'saved': 10, 'duplicates': rows // 2}
+            status = "✓" if again == expected and result['saved'] == rows else "✗"
+            print(f"\n  {status} counts exact (expected {expected})")
+
+        if per_row_rows:
+            print(f"  Speedup: {bulk_rate / per_row_rate:.1f}x")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark batched event inserts')
+    parser.add_argument('--rows', type=int, default=100_000,
+                       help='Events for the bulk path (default: 100000)')
+    parser.add_argument('--per-row-rows', type=int, default=10_000,
+                       help='Events for the per-row path, 0 to skip (default: 10000)')
+
+    args = parser.parse_args()
+
+    run(args.rows, args.per_row_rows)
@@ -0,0 +1,175 @@
+"""
+Benchmark: shared feed date parser vs the per-source strptime helpers.
+
+Parses a realistic mix of feed timestamps - RFC 822 with numeric offsets
+and with zone names (RSS pubDate), ISO 8601 (Atom updated) - with:
+
+- legacy: the old TechRSSSource._parse_date (strptime formats in turn,
+  then fromisoformat), rebuilt here, and the Company IR variant
+- parse_date: sources.dates.parse_date without its LRU cache (every
+  string parsed) and with it (cache cleared first)
+
+Timestamps repeat the way feed polling repeats them: every run re-reads the
+same feeds, so each distinct timestamp is parsed --repeats times.
+
+Also counts timestamps each helper gets wrong against the UTC instant
+(offsets dropped) or can't read at all (legacy falls back to utcnow).
+
+Usage:
+    python benchmarks/date_parser.py
+    python benchmarks/date_parser.py --dates 20000 --repeats 10
+"""
+
+import sys
+import time
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sources.dates import parse_date, _parse
+
+
+def legacy_tech_rss(date_str: str):
+    """The old TechRSSSource._parse_date"""
+    if not date_str:
+        return None
+
+    formats = [
+        '%a, %d %b %Y %H:%M:%S %z',  # RFC 822
+        '%a, %d %b %Y %H:%M:%S %Z',  # RFC 822 with timezone name
+        '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601
+        '%Y-%m-%d',                   # Simple date
+    ]
+
+    for fmt in formats:
+        try:
+            parsed = datetime.strptime(date_str.strip(), fmt)
+            if parsed.tzinfo is not None:
+                parsed = parsed.replace(tzinfo=None)
+            return parsed
+        except:
+            continue
+
+    try:
+        parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        if parsed.tzinfo is not None:
+            parsed = parsed.replace(tzinfo=None)
+        return parsed
+    except:
+        return datetime.utcnow()
+
+
+def legacy_company_ir(date_str: str):
+    """The old CompanyIRSource._parse_date (aware results, no zone names)"""
+    if not date_str:
+        return None
+
+    formats = [
+        '%a, %d %b %Y %H:%M:%S %z',  # RFC 822
+        '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601
+        '%Y-%m-%d',                   # Simple date
+    ]
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str.strip(), fmt)
+        except:
+            continue
+
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except:
+        return datetime.utcnow()
+
+
+def make_dates(count: int, seed: int = 5) -> list:
+    """(text, true naive UTC instant) pairs in feed formats"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    zones = [('+0000', 0), ('-0500', -300), ('+0100', 60), ('GMT', 0), ('EST', -300), ('PDT', -420)]
+    dates = []
+
+    for i in range(count):
+        instant = base + timedelta(seconds=rng.randrange(300 * 86400))
+        kind = i % 3
+        if kind == 2:
+            offset = rng.choice((0, -300, 330))
+            local = instant + timedelta(minutes=offset)
+            sign = '+' if offset >= 0 else '-'
+            suffix = 'Z' if offset == 0 else f"{sign}{abs(offset) // 60:02d}:{abs(offset) % 60:02d}"
+            text = local.strftime('%Y-%m-%dT%H:%M:%S') + suffix
+        else:
+            zone, offset = rng.choice(zones)
+            local = instant + timedelta(minutes=offset)
+            text = local.strftime('%a, %d %b %Y %H:%M:%S ') + zone
+        dates.append((text, instant))
+
+    return dates
+
+
+def as_naive_utc(value):
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def timed(parse, texts: list) -> tuple:
+    start = time.perf_counter()
+    results = [parse(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def run(distinct: int, repeats: int):
+    dates = make_dates(distinct) * repeats
+    texts = [text for text, _ in dates]
+    count = len(texts)
+
+    print("=" * 80)
+    print(f"FEED DATE PARSER BENCHMARK: {distinct:,} timestamps x {repeats} runs (RFC 822 + ISO 8601)")
+    print("=" * 80)
+
+    uncached = _parse.__wrapped__
+    parsers = (
+        ('legacy (tech_rss)', legacy_tech_rss),
+        ('legacy (company_ir)', legacy_company_ir),
+        ('parse_date (no cache)', lambda text: uncached(text.strip())),
+        ('parse_date', parse_date),
+    )
+
+    rows = []
+    _parse.cache_clear()
+    for name, parse in parsers:
+        seconds, results = timed(parse, texts)
+        rows.append((name, seconds, results))
+
+    baseline = rows[0][1]
+    print(f"\n  {'parser':<22} {'time (ms)':>10} {'µs/date':>8} {'speedup':>8} {'wrong':>8} {'unread':>8}")
+    for name, seconds, results in rows:
+        wrong = unread = 0
+        for (text, instant), value in zip(dates, results):
+            value = as_naive_utc(value)
+            # Legacy helpers return utcnow() for text they can't read
+            if value is None or abs(value - datetime.utcnow()) < timedelta(minutes=1):
+                unread += 1
+            elif value != instant:
+                wrong += 1
+        print(f"  {name:<22} {seconds * 1000:>10.1f} {seconds / count * 1e6:>8.2f} "
+              f"{baseline / seconds:>7.2f}x {wrong:>8,} {unread:>8,}")
+
+    print("\n  wrong = parsed to the wrong UTC instant; unread = not parsed")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the shared feed date parser')
+    parser.add_argument('--dates', type=int, default=2000,
+                       help='Distinct timestamps, about one run of every feed (default: 2,000)')
+    parser.add_argument('--repeats', type=int, default=50,
+                       help='Times each timestamp is parsed (default: 50)')
+
+    args = parser.parse_args()
+
+    run(args.dates, args.repeats)
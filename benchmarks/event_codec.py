@@ -0,0 +1,170 @@
+"""
+Benchmark: Event memory footprint and row (de)serialization.
+
+Compares the slotted Event and its tuple codec (to_row / from_row) with
+the previous model - a plain dataclass with a per-instance __dict__ and
+the dict codec that called EventSource(...)/EventType(...) per field -
+rebuilt here as LegacyEvent. Both sides get the same synthetic events;
+the round trips are checked to produce equal events.
+
+Usage:
+    python benchmarks/event_codec.py
+    python benchmarks/event_codec.py --events 100000
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import Event, EventSource, EventType, EVENT_COLUMNS
+
+
+# The model before slots: same fields and defaults, with a __dict__
+LegacyEvent = dataclass(type('LegacyEvent', (), {
+    '__annotations__': {f.name: f.type for f in fields(Event)},
+    **{f.name: f.default for f in fields(Event)},
+    '__post_init__': Event.__post_init__,
+}))
+
+
+def legacy_to_dict(event) -> dict:
+    """The previous Event.to_dict"""
+    return {
+        'id': event.id,
+        'source': event.source.value,
+        'source_id': event.source_id,
+        'source_url': event.source_url,
+        'title': event.title,
+        'content': event.content,
+        'summary': event.summary,
+        'event_type': event.event_type.value,
+        'companies': ','.join(event.companies) if event.companies else None,
+        'products': ','.join(event.products) if event.products else None,
+        'people': ','.join(event.people) if event.people else None,
+        'published_at': event.published_at.isoformat() if event.published_at else None,
+        'collected_at': event.collected_at.isoformat() if event.collected_at else None,
+        'significance_score': event.significance_score,
+        'sentiment': event.sentiment,
+        'analysis': event.analysis,
+        'implications': event.implications,
+        'affected_parties': event.affected_parties,
+        'investment_relevance': event.investment_relevance,
+        'key_context': event.key_context,
+    }
+
+
+def legacy_from_dict(data: dict):
+    """The previous Event.from_dict"""
+    return LegacyEvent(
+        id=data.get('id'),
+        source=EventSource(data['source']) if data.get('source') else EventSource.UNKNOWN,
+        source_id=data.get('source_id'),
+        source_url=data.get('source_url', ''),
+        title=data.get('title', ''),
+        content=data.get('content'),
+        summary=data.get('summary'),
+        event_type=EventType(data['event_type']) if data.get('event_type') else EventType.UNKNOWN,
+        companies=data.get('companies').split(',') if data.get('companies') else [],
+        products=data.get('products').split(',') if data.get('products') else [],
+        people=data.get('people').split(',') if data.get('people') else [],
+        published_at=datetime.fromisoformat(data['published_at']) if data.get('published_at') else None,
+        collected_at=datetime.fromisoformat(data['collected_at']) if data.get('collected_at') else None,
+        significance_score=data.get('significance_score'),
+        sentiment=data.get('sentiment'),
+        analysis=data.get('analysis'),
+        implications=data.get('implications'),
+        affected_parties=data.get('affected_parties'),
+        investment_relevance=data.get('investment_relevance'),
+        key_context=data.get('key_context'),
+        is_duplicate=bool(data.get('is_duplicate', 0)),
+        is_semantic_duplicate=bool(data.get('is_semantic_duplicate', 0)),
+    )
+
+
+def make_rows(count: int) -> list:
+    """Stored rows as SELECT <EVENT_COLUMNS> returns them"""
+    base = datetime(2025, 11, 20, 12, 0)
+    sources = [s.value for s in EventSource]
+    types = [t.value for t in EventType]
+    return [
+        (i, sources[i % len(sources)], str(i), f"https://example.com/{i}",
+         f"Headline {i}", None, "Short summary", types[i % len(types)],
+         "NVIDIA,OpenAI" if i % 3 else None, "H100" if i % 5 == 0 else None, None,
+         (base - timedelta(minutes=i)).isoformat(), base.isoformat(),
+         float(i % 100), 'positive', None, None, None, 'Material', None, 0, 0)
+        for i in range(count)
+    ]
+
+
+def measure_memory(build) -> tuple:
+    """(bytes per object, objects) for the objects build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(objects), objects
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def run(count: int):
+    print("=" * 80)
+    print(f"EVENT CODEC BENCHMARK: {count:,} events")
+    print("=" * 80)
+
+    rows = make_rows(count)
+    dicts = [dict(zip(EVENT_COLUMNS, row)) for row in rows]
+
+    # Decode: stored row -> event (memory measured on the decoded events,
+    # which includes their datetimes and entity lists)
+    legacy_decode, legacy_events = timed(lambda: [legacy_from_dict(d) for d in dicts])
+    new_decode, new_events = timed(lambda: [Event.from_row(row) for row in rows])
+
+    legacy_mem, _ = measure_memory(lambda: [legacy_from_dict(d) for d in dicts[:100_000]])
+    new_mem, _ = measure_memory(lambda: [Event.from_row(row) for row in rows[:100_000]])
+
+    # Encode: event -> insert parameters
+    legacy_encode, legacy_out = timed(lambda: [legacy_to_dict(e) for e in legacy_events])
+    new_encode, new_out = timed(lambda: [e.to_row() for e in new_events])
+
+    # Round trips must agree field for field
+    same = all(
+        tuple(out.values())[1:] == row
+        for out, row in zip(legacy_out[:10_000], new_out[:10_000])
+    ) and all(
+        Event.from_dict(legacy_to_dict(old)) == new
+        for old, new in zip(legacy_events[:10_000], new_events[:10_000])
+    )
+
+    print(f"\n  {'':<22} {'before':>14} {'after':>14} {'change':>10}")
+    print(f"  {'bytes per event':<22} {legacy_mem:>14,.0f} {new_mem:>14,.0f} "
+          f"{new_mem / legacy_mem:>9.2f}x")
+    print(f"  {'decode (events/s)':<22} {count / legacy_decode:>14,.0f} {count / new_decode:>14,.0f} "
+          f"{legacy_decode / new_decode:>9.2f}x")
+    print(f"  {'encode (events/s)':<22} {count / legacy_encode:>14,.0f} {count / new_encode:>14,.0f} "
+          f"{legacy_encode / new_encode:>9.2f}x")
+    print(f"\n  Memory sampled over {min(count, 100_000):,} events (tracemalloc)")
+    print(f"  {'✓' if same else '✗'} round trips {'match' if same else 'DIFFER'}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark Event memory and row codec')
+    parser.add_argument('--events', type=int, default=1_000_000,
+                       help='Events to encode/decode (default: 1,000,000)')
+
+    args = parser.parse_args()
+
+    run(args.events)
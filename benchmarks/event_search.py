@@ -0,0 +1,133 @@
+"""
+Benchmark: full-text search vs LIKE scans.
+
+Fills a temporary database with synthetic events (default 1M) through
+save_events - so the FTS index is built by the insert triggers, as in
+production - then times EventDatabase.search against the equivalent
+LIKE '%word%' scan over title, content, analysis and implications, and
+checks both find the same events.
+
+Usage:
+    python benchmarks/event_search.py
+    python benchmarks/event_search.py --rows 100000
+"""
+
+import sys
+import time
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase
+from models.events import Event, EventSource, EventType
+
+
+COMPANIES = ['OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
+             'NVIDIA', 'AMD', 'Intel', 'Apple', 'Oracle', 'Mistral']
+VERBS = ['announces', 'delays', 'expands', 'cuts', 'launches', 'licenses', 'tests', 'ships']
+THINGS = ['data center', 'chip', 'model', 'assistant', 'partnership', 'robotics lab',
+          'export deal', 'pricing', 'safety team', 'cloud region', 'earnings call']
+FILLER = ['analysts', 'expect', 'the', 'move', 'to', 'affect', 'supply', 'margins', 'demand',
+          'investors', 'regulators', 'customers', 'growth', 'quarter', 'market', 'share']
+RARE = ['quantization', 'sovereign', 'photonics', 'tokamak', 'liquidation']
+
+# (query, word for the LIKE baseline)
+QUERIES = [('photonics', 'photonics'), ('tokamak', 'tokamak'), ('NVIDIA', 'NVIDIA'),
+           ('sovereign', 'sovereign')]
+
+
+def make_events(rng: random.Random, count: int, offset: int) -> list:
+    """Synthetic events; rare words appear in roughly 1 in 2000 texts"""
+    now = datetime.utcnow()
+    events = []
+    for i in range(offset, offset + count):
+        words = [rng.choice(FILLER) for _ in range(30)]
+        if rng.random() < 0.0005:
+            words.insert(rng.randrange(len(words)), rng.choice(RARE))
+        events.append(Event(
+            source=EventSource.MANUAL,
+            source_id=str(i),
+            title=f"{rng.choice(COMPANIES)} {rng.choice(VERBS)} {rng.choice(THINGS)}",
+            content=' '.join(words),
+            event_type=EventType.NEWS,
+            published_at=now - timedelta(minutes=i),
+            significance_score=rng.randint(0, 100),
+        ))
+    return events
+
+
+def like_scan(db: EventDatabase, word: str, limit: int) -> set:
+    """The pre-FTS way: substring scan over every text column"""
+    pattern = f"%{word}%"
+    cursor = db.conn.execute("""
+        SELECT id FROM events
+        WHERE title LIKE ? OR unpack_text(content) LIKE ? OR unpack_text(analysis) LIKE ?
+           OR implications LIKE ?
+    """, (pattern,) * 4)
+    return {row[0] for row in cursor.fetchall()}
+
+
+def run(rows: int, batch: int, limit: int):
+    rng = random.Random(5)
+
+    print("=" * 80)
+    print(f"FULL-TEXT SEARCH BENCHMARK: {rows:,} events")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with EventDatabase(str(Path(tmp) / "search.db")) as db:
+            start = time.perf_counter()
+            for offset in range(0, rows, batch):
+                db.save_events(make_events(rng, min(batch, rows - offset), offset))
+            print(f"  insert (with FTS triggers): {time.perf_counter() - start:8.2f}s")
+
+            mismatches = 0
+            for query, word in QUERIES:
+                start = time.perf_counter()
+                scanned = like_scan(db, word, limit)
+                like_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                results = db.search(query, limit=len(scanned) + 1)
+                fts_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                top = db.search(query, limit=limit)
+                top_time = time.perf_counter() - start
+
+                found = {result['event'].id for result in results}
+                if found != scanned:
+                    mismatches += 1
+
+                print(f"\n  '{query}': {len(scanned):,} matches")
+                print(f"    LIKE scan:        {like_time * 1000:9.1f}ms")
+                print(f"    search (all):     {fts_time * 1000:9.1f}ms")
+                print(f"    search (top {limit}): {top_time * 1000:9.1f}ms")
+                if top:
+                    print(f"    best: {' '.join(top[0]['snippet'].split())[:70]}")
+
+            print()
+            if mismatches:
+                print(f"  ✗ {mismatches} queries found different events than the LIKE scan")
+            else:
+                print(f"  ✓ search found the same events as the LIKE scan for every query")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark FTS5 search against LIKE scans')
+    parser.add_argument('--rows', type=int, default=1_000_000,
+                       help='Synthetic events to insert (default: 1,000,000)')
+    parser.add_argument('--batch', type=int, default=50_000,
+                       help='Events per save_events call (default: 50,000)')
+    parser.add_argument('--limit', type=int, default=20,
+                       help='Results per ranked search (default: 20)')
+
+    args = parser.parse_args()
+
+    run(args.rows, args.batch, args.limit)
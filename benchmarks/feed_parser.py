@@ -0,0 +1,159 @@
+"""
+Benchmark: streaming feed parser vs the old ET.fromstring parsers.
+
+Builds multi-MB RSS 2.0 and Atom fixtures (newest entry first, one every
+ten minutes, as real feeds are) and parses each with:
+
+- legacy:    the sources' old approach - ET.fromstring, walk every <item>,
+             then walk again for Atom <entry>s if there were no items
+- streaming: sources.feed_parser.parse_feed (one iterparse pass, entries
+             cleared as they end, stops once the feed is past the cutoff)
+
+for a short window (stops early) and a window covering the whole feed.
+Both use the same date parser, so the difference is parsing alone.
+
+Usage:
+    python benchmarks/feed_parser.py
+    python benchmarks/feed_parser.py --entries 50000
+"""
+
+import sys
+import time
+import random
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sources.dates import parse_date
+from sources.feed_parser import parse_feed
+
+
+WORDS = ['NVIDIA', 'OpenAI', 'model', 'chips', 'training', 'inference', 'data', 'center',
+         'launch', 'funding', 'the', 'a', 'of', 'and', 'to', 'new', 'AI', 'research']
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+
+
+def make_feed(kind: str, entries: int, seed: int = 7) -> bytes:
+    """Synthetic feed, newest entry first, one entry every ten minutes"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    parts = []
+
+    for i in range(entries):
+        published = now - timedelta(minutes=10 * i)
+        title = ' '.join(rng.choices(WORDS, k=10))
+        description = ' '.join(rng.choices(WORDS, k=60))
+        if kind == 'rss':
+            parts.append(
+                f"<item><title>{title}</title><link>https://example.com/{i}</link>"
+                f"<pubDate>{published.strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate>"
+                f"<description>{description}</description></item>"
+            )
+        else:
+            parts.append(
+                f"<entry><title>{title}</title><link rel=\"alternate\" href=\"https://example.com/{i}\"/>"
+                f"<updated>{published.strftime('%Y-%m-%dT%H:%M:%S')}+00:00</updated>"
+                f"<summary>{description}</summary></entry>"
+            )
+
+    if kind == 'rss':
+        document = f"<rss version=\"2.0\"><channel><title>Bench</title>{''.join(parts)}</channel></rss>"
+    else:
+        document = f"<feed xmlns=\"{ATOM_NS}\"><title>Bench</title>{''.join(parts)}</feed>"
+    return document.encode('utf-8')
+
+
+def legacy_parse(content: bytes, parse_date, cutoff: datetime) -> list:
+    """The pre-streaming parser (TechRSSSource._parse_rss_feed)"""
+    root = ET.fromstring(content)
+    items = []
+
+    for item in root.findall('.//item'):
+        title_elem = item.find('title')
+        link_elem = item.find('link')
+        pubdate_elem = item.find('pubDate')
+        description_elem = item.find('description')
+        if title_elem is None or link_elem is None:
+            continue
+
+        published = parse_date(pubdate_elem.text if pubdate_elem is not None else "") or datetime.utcnow()
+        if published < cutoff:
+            continue
+        items.append({'title': title_elem.text, 'link': link_elem.text,
+                      'description': description_elem.text if description_elem is not None else "",
+                      'published': published})
+
+    if not items:
+        ns = {'atom': ATOM_NS}
+        for entry in root.findall('atom:entry', ns):
+            title_elem = entry.find('atom:title', ns)
+            link_elem = entry.find('atom:link', ns)
+            updated_elem = entry.find('atom:updated', ns)
+            summary_elem = entry.find('atom:summary', ns)
+            if title_elem is None or link_elem is None:
+                continue
+
+            published = parse_date(updated_elem.text if updated_elem is not None else "") or datetime.utcnow()
+            if published < cutoff:
+                continue
+            items.append({'title': title_elem.text, 'link': link_elem.get('href'),
+                          'description': summary_elem.text if summary_elem is not None else "",
+                          'published': published})
+
+    return items
+
+
+def measure(parse, repeats: int) -> tuple:
+    """Best-of-N seconds, peak traced memory, entries returned"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = parse()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, len(result)
+
+
+def run(entries: int, repeats: int):
+    print("=" * 80)
+    print(f"FEED PARSER BENCHMARK: {entries:,} entries per feed")
+    print("=" * 80)
+    print(f"\n  {'feed':<6} {'window':<8} {'parser':<10} {'entries':>8} {'time (ms)':>10} "
+          f"{'peak MB':>8} {'speedup':>8}")
+
+    for kind in ('rss', 'atom'):
+        content = make_feed(kind, entries)
+        print(f"\n  {kind} fixture: {len(content) / 1e6:.1f} MB")
+
+        for label, days in (('1 day', 1), ('all', 3650)):
+            cutoff = datetime.utcnow() - timedelta(days=days)
+            legacy = measure(lambda: legacy_parse(content, parse_date, cutoff), repeats)
+            streaming = measure(lambda: parse_feed(content, parse_date, cutoff), repeats)
+
+            for name, (seconds, peak, count) in (('legacy', legacy), ('streaming', streaming)):
+                speedup = f"{legacy[0] / seconds:7.2f}x" if name == 'streaming' else ''
+                print(f"  {kind:<6} {label:<8} {name:<10} {count:>8,} {seconds * 1000:>10.1f} "
+                      f"{peak / 1e6:>8.1f} {speedup:>8}")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the streaming feed parser')
+    parser.add_argument('--entries', type=int, default=20_000,
+                       help='Entries per synthetic feed (default: 20,000)')
+    parser.add_argument('--repeats', type=int, default=3,
+                       help='Timed runs per case, best is reported (default: 3)')
+
+    args = parser.parse_args()
+
+    run(args.entries, args.repeats)
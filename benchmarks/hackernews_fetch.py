@@ -0,0 +1,126 @@
+"""
+Benchmark: serial vs concurrent Hacker News story fetching.
+
+Spins up a local stub of the HN Firebase API (with artificial per-request
+latency) and runs HackerNewsSource.fetch_ai_stories against it with
+different worker caps. No network access needed.
+
+Usage:
+    python benchmarks/hackernews_fetch.py
+    python benchmarks/hackernews_fetch.py --stories 200 --latency-ms 80 --workers 1 4 8 16
+"""
+
+import sys
+import io
+import json
+import re
+import time
+import threading
+import contextlib
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sources.hackernews import HackerNewsSource
+
+
+def make_stub_server(num_stories: int, latency: float, ai_every: int = 5) -> ThreadingHTTPServer:
+    """Create a stub HN API server (not started) on a free local port"""
+    story_ids = list(range(1000, 1000 + num_stories))
+
+    def item(story_id: int) -> dict:
+        n = story_id - 1000
+        if n % ai_every == 0:
+            title = f"OpenAI releases new LLM benchmark #{n}"
+        else:
+            title = f"Show HN: A tiny static site generator #{n}"
+        return {
+            'id': story_id,
+            'type': 'story',
+            'title': title,
+            'url': f"https://example.com/{story_id}",
+            'time': 1732000000 + n,
+        }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+
+            if self.path.endswith('/topstories.json'):
+                body = story_ids
+            else:
+                match = re.search(r'/item/(\d+)\.json$', self.path)
+                if not match:
+                    self.send_error(404)
+                    return
+                body = item(int(match.group(1)))
+
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128  # Default backlog of 5 resets bursts of connections
+
+    return Server(('127.0.0.1', 0), Handler)
+
+
+def run(num_stories: int, latency_ms: float, limit: int, workers: list):
+    server = make_stub_server(num_stories, latency_ms / 1000)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v0"
+
+    print("=" * 80)
+    print(f"HN FETCH BENCHMARK: {num_stories} stories, {latency_ms:.0f}ms latency, limit={limit}")
+    print("=" * 80)
+
+    baseline_ids = None
+    baseline_time = None
+
+    for max_workers in workers:
+        source = HackerNewsSource(max_workers=max_workers, base_url=base_url)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            events = source.fetch_ai_stories(limit=limit, top_n=num_stories)
+        elapsed = time.perf_counter() - start
+
+        ids = [e.source_id for e in events]
+        if baseline_ids is None:
+            baseline_ids, baseline_time = ids, elapsed
+
+        same = "✓ same order" if ids == baseline_ids else "✗ ORDER DIFFERS"
+        speedup = baseline_time / elapsed if elapsed else 0
+        print(f"  workers={max_workers:<3} {elapsed:7.2f}s  {len(events):>3} events  "
+              f"{speedup:5.1f}x  {same}")
+
+    # Let requests abandoned by early cancellation drain before stopping
+    time.sleep(latency_ms / 1000 * 2)
+    server.shutdown()
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark HN concurrent fetch against a local stub')
+    parser.add_argument('--stories', type=int, default=200,
+                       help='Top stories served by the stub (default: 200)')
+    parser.add_argument('--latency-ms', type=float, default=50,
+                       help='Artificial latency per request (default: 50)')
+    parser.add_argument('--limit', type=int, default=20,
+                       help='AI stories to collect before stopping (default: 20)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16],
+                       help='Worker caps to compare; first is the baseline (default: 1 4 8 16)')
+
+    args = parser.parse_args()
+
+    run(args.stories, args.latency_ms, args.limit, args.workers)
@@ -0,0 +1,111 @@
+"""
+Benchmark: Hacker News collection rerun with and without the seen-item lookup.
+
+Uses the local HN API stub from hackernews_fetch.py and a temporary events
+database, and runs the collector's Hacker News path (fetch, then save) twice
+in a row - the second run is what a rerun minutes later costs:
+
+- full scan:   no SeenItems - every top story's details are fetched again
+- incremental: SeenItems - stored and rejected stories are skipped before
+               any item request
+
+Reports item requests made and wall time per run. No network access needed.
+
+Usage:
+    python benchmarks/incremental_fetch.py
+    python benchmarks/incremental_fetch.py --stories 500 --latency-ms 80
+"""
+
+import sys
+import io
+import time
+import tempfile
+import threading
+import contextlib
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.hackernews_fetch import make_stub_server
+from sources.hackernews import HackerNewsSource
+from sources.seen_items import SeenItems
+from storage.db import EventDatabase
+
+
+def counting_server(num_stories: int, latency: float):
+    """Stub HN server plus a counter of item requests served"""
+    server = make_stub_server(num_stories, latency)
+    counts = {'items': 0}
+    lock = threading.Lock()
+    handler = server.RequestHandlerClass
+
+    class CountingHandler(handler):
+        def do_GET(self):
+            if '/item/' in self.path:
+                with lock:
+                    counts['items'] += 1
+            super().do_GET()
+
+    server.RequestHandlerClass = CountingHandler
+    return server, counts
+
+
+def collect(base_url: str, db_path: str, seen_path: str, incremental: bool, limit: int, top_n: int):
+    """One collector-style Hacker News run: fetch, then save"""
+    db = EventDatabase(db_path)
+    seen = SeenItems(db_path=seen_path, events_db_path=db_path) if incremental else None
+    source = HackerNewsSource(base_url=base_url, seen=seen)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            events = source.fetch_ai_stories(limit=limit, top_n=top_n)
+        saved = db.save_events(events)['saved']
+    finally:
+        db.close()
+        if seen:
+            seen.close()
+    return saved
+
+
+def run(num_stories: int, latency_ms: float, limit: int):
+    server, counts = counting_server(num_stories, latency_ms / 1000)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v0"
+
+    print("=" * 80)
+    print(f"INCREMENTAL FETCH BENCHMARK: {num_stories} top stories, {latency_ms:.0f}ms latency, "
+          f"limit={limit}")
+    print("=" * 80)
+    print(f"\n  {'mode':<12} {'run':<8} {'item requests':>14} {'saved':>6} {'time (s)':>9}")
+
+    for mode, incremental in (('full scan', False), ('incremental', True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / 'events.db')
+            seen_path = str(Path(tmp) / 'seen.db')
+
+            for run_name in ('first', 'rerun'):
+                counts['items'] = 0
+                start = time.perf_counter()
+                saved = collect(base_url, db_path, seen_path, incremental, limit, num_stories)
+                elapsed = time.perf_counter() - start
+                print(f"  {mode:<12} {run_name:<8} {counts['items']:>14,} {saved:>6} {elapsed:>9.2f}")
+
+    # Let requests abandoned by early cancellation drain before stopping
+    time.sleep(latency_ms / 1000 * 2)
+    server.shutdown()
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark incremental HN fetching against a local stub')
+    parser.add_argument('--stories', type=int, default=200,
+                       help='Top stories served by the stub (default: 200)')
+    parser.add_argument('--latency-ms', type=float, default=50,
+                       help='Artificial latency per request (default: 50)')
+    parser.add_argument('--limit', type=int, default=50,
+                       help='AI stories to collect per run (default: 50)')
+
+    args = parser.parse_args()
+
+    run(args.stories, args.latency_ms, args.limit)
@@ -0,0 +1,186 @@
+"""
+Benchmark: compiled keyword matcher vs per-keyword substring scans.
+
+Generates synthetic headlines (mostly ordinary words, some AI/company
+terms, and words that contain keywords without being them - "said",
+"email", "intelligence", "metadata") and runs two workloads:
+
+- hn:   Hacker News relevance filter + event type
+        (legacy: is_ai_related loop + classify_event_type any() chains)
+- news: Tech RSS / Google News event type + company tags
+        (legacy: classify_article any() chains + extract_companies loop)
+
+Each is timed for the legacy code (rebuilt here) and the sources' compiled
+KeywordMatcher, and the headlines they disagree on are counted. The hn
+legacy loop stops at its first substring hit, so it is also timed on the
+headlines without an 'ai' substring, where it can't stop early.
+
+Usage:
+    python benchmarks/keyword_matcher.py
+    python benchmarks/keyword_matcher.py --headlines 100000
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import EventType
+from sources.hackernews import HackerNewsSource
+from sources.keywords import NEWS_MATCHER
+
+
+FILLER = (
+    "the a of to in for on with new how why what is are was we you it this that from "
+    "show ask hn building year data company market users open source code rust python "
+    "linux web app team release version server database says report week city power "
+    "said email again maintain detail paint mail rain brain explain certain email "
+    "intelligence metadata flaw lawn federal interior applied deals court-side"
+).split()
+
+TERMS = (
+    "AI OpenAI Anthropic NVIDIA Google Microsoft Meta Intel GPT-4 LLM LLMs Claude "
+    "llama GPUs transformer raises funding launches releases unveils paper research "
+    "acquisition partnership regulation court lawsuit series valuation"
+).split() + ["machine learning", "language model", "Hugging Face", "Stability AI", "generative AI"]
+
+
+def make_headlines(count: int, seed: int = 3) -> list:
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(6, 12))
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(TERMS))
+        headlines.append(' '.join(words).capitalize())
+    return headlines
+
+
+def legacy_hn(title: str, url: str = ""):
+    """The old HackerNewsSource.is_ai_related + classify_event_type"""
+    text = (title + " " + url).lower()
+    relevant = False
+    for keyword in LEGACY_AI_KEYWORDS:
+        if keyword in text:
+            relevant = True
+            break
+
+    if any(word in text for word in ['announces', 'launches', 'releases', 'unveils', 'introduces']):
+        event_type = EventType.PRODUCT_LAUNCH
+    elif any(word in text for word in ['raises', 'funding', 'investment', 'series', 'valuation']):
+        event_type = EventType.FUNDING
+    elif 'arxiv' in text or 'paper' in text or 'research' in text:
+        event_type = EventType.RESEARCH
+    else:
+        event_type = EventType.NEWS
+    return relevant, event_type
+
+
+LEGACY_AI_KEYWORDS = [
+    'ai', 'artificial intelligence', 'machine learning', 'ml',
+    'gpt', 'claude', 'gemini', 'llm', 'language model',
+    'openai', 'anthropic', 'google ai', 'deepmind',
+    'nvidia', 'nvda', 'gpu', 'neural', 'transformer',
+    'chatgpt', 'copilot', 'bard', 'llama',
+    'dall-e', 'midjourney', 'stable diffusion',
+    'agi', 'generative ai', 'foundation model',
+]
+
+LEGACY_COMPANIES = [
+    'OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
+    'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle',
+    'Hugging Face', 'Stability AI', 'Cohere', 'Mistral',
+]
+
+
+def legacy_news(title: str, description: str):
+    """The old classify_article + extract_companies (Tech RSS, Google News)"""
+    text = (title + " " + description).lower()
+
+    if any(word in text for word in ['funding', 'raises', 'investment', 'valuation', 'ipo']):
+        event_type = EventType.FUNDING
+    elif any(word in text for word in ['launches', 'releases', 'unveils', 'announces new']):
+        event_type = EventType.PRODUCT_LAUNCH
+    elif any(word in text for word in ['partnership', 'collaboration', 'deal', 'acquisition']):
+        event_type = EventType.PARTNERSHIP
+    elif any(word in text for word in ['regulation', 'policy', 'law', 'legal', 'court']):
+        event_type = EventType.REGULATION
+    elif any(word in text for word in ['research', 'paper', 'study', 'breakthrough']):
+        event_type = EventType.RESEARCH
+    else:
+        event_type = EventType.NEWS
+
+    mentions = title + " " + description
+    companies = [company for company in LEGACY_COMPANIES if company.lower() in mentions.lower()]
+    return event_type, companies
+
+
+def compiled_hn(title: str, url: str = ""):
+    hit = HackerNewsSource.MATCHER.match(title, url)
+    return hit.relevant, hit.label or EventType.NEWS
+
+
+def compiled_news(title: str, description: str):
+    hit = NEWS_MATCHER.match(title, description)
+    return hit.label or EventType.NEWS, hit.entities
+
+
+def timed(function, headlines: list) -> tuple:
+    start = time.perf_counter()
+    results = [function(headline, "") for headline in headlines]
+    return time.perf_counter() - start, results
+
+
+def run(count: int):
+    headlines = make_headlines(count)
+
+    print("=" * 80)
+    print(f"KEYWORD MATCHER BENCHMARK: {count:,} headlines")
+    print("=" * 80)
+    print(f"\n  {'workload':<8} {'matcher':<10} {'time (s)':>9} {'headlines/s':>12} {'speedup':>8}")
+
+    for name, legacy, compiled in (('hn', legacy_hn, compiled_hn), ('news', legacy_news, compiled_news)):
+        legacy_seconds, legacy_results = timed(legacy, headlines)
+        compiled_seconds, compiled_results = timed(compiled, headlines)
+
+        print(f"  {name:<8} {'legacy':<10} {legacy_seconds:>9.2f} {count / legacy_seconds:>12,.0f}")
+        print(f"  {name:<8} {'compiled':<10} {compiled_seconds:>9.2f} {count / compiled_seconds:>12,.0f} "
+              f"{legacy_seconds / compiled_seconds:>7.2f}x")
+
+        differ = sum(1 for a, b in zip(legacy_results, compiled_results) if a != b)
+        print(f"  {'':<8} results differ on {differ:,} headlines ({differ / count:.1%}) - "
+              f"substring hits inside other words")
+
+        # Show a few disagreements
+        shown = 0
+        for headline, a, b in zip(headlines, legacy_results, compiled_results):
+            if a != b and shown < 3:
+                print(f"    {headline[:60]!r}: legacy {a} vs compiled {b}")
+                shown += 1
+
+        if name == 'hn':
+            # The legacy relevance loop checks 'ai' first and stops at the
+            # first substring hit - usually "said", "email", "rain"... Time
+            # the headlines where it has to scan its whole keyword list.
+            scanned = [headline for headline in headlines if 'ai' not in headline.lower()]
+            legacy_seconds, _ = timed(legacy, scanned)
+            compiled_seconds, _ = timed(compiled, scanned)
+            print(f"  {'':<8} without an 'ai' substring ({len(scanned):,} headlines): "
+                  f"legacy {legacy_seconds:.2f}s, compiled {compiled_seconds:.2f}s "
+                  f"({legacy_seconds / compiled_seconds:.2f}x)")
+        print()
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the compiled keyword matcher')
+    parser.add_argument('--headlines', type=int, default=1_000_000,
+                       help='Synthetic headlines to classify (default: 1,000,000)')
+
+    args = parser.parse_args()
+
+    run(args.headlines)
@@ -0,0 +1,186 @@
+"""
+Benchmark: semantic dedup with and without local pre-clustering.
+
+Builds synthetic days of headlines in which some stories are reported
+several times with different wording, then runs
+SemanticDeduplicator's per-date step both ways against a fake Claude
+client. The fake client answers from the hidden story labels, so the
+comparison is of API calls, titles sent and prompt size - and whether the
+groups found still match the labels. The fake client sleeps per request,
+so wall time shows the effect of chunked, concurrent requests on big days.
+Runs fully offline.
+
+Usage:
+    python benchmarks/semantic_prefilter.py
+    python benchmarks/semantic_prefilter.py --days 10 --events-per-day 300
+    python benchmarks/semantic_prefilter.py --days 3 --events-per-day 1000 --latency 2
+"""
+
+import sys
+import json
+import time
+import random
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.semantic_deduplicator import SemanticDeduplicator
+from models.events import Event, EventSource
+
+
+COMPANIES = ['OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
+             'NVIDIA', 'AMD', 'Intel', 'Apple', 'SoftBank', 'Oracle', 'Mistral', 'Cohere']
+PRODUCTS = ['chip', 'model', 'data center', 'assistant', 'cloud deal', 'robot',
+            'search tool', 'coding agent', 'GPU cluster', 'license', 'stake', 'lab']
+# Ways different outlets phrase the same story: {c} company, {p} product, {n} amount
+PHRASINGS = [
+    "{c} unveils new {p} worth ${n}B",
+    "{c} announces ${n}B {p}",
+    "{c}'s new ${n}B {p} revealed",
+    "{c} reveals {p} in ${n}B move",
+    "Report: {c} plans ${n}B {p}",
+]
+# Unrelated one-off stories are built from these
+SUBJECTS = ['shares', 'investors', 'regulators', 'engineers', 'researchers', 'customers',
+            'unions', 'analysts', 'lawmakers', 'startups', 'schools', 'hospitals']
+ACTIONS = ['question', 'welcome', 'probe', 'adopt', 'criticise', 'test', 'ban', 'fund',
+           'delay', 'review', 'copy', 'debate']
+TOPICS = ['training data', 'energy use', 'pricing', 'safety rules', 'hiring plans',
+          'export limits', 'open weights', 'earnings', 'privacy policy', 'chip supply',
+          'copyright', 'outage', 'benchmark results', 'ad business', 'layoffs']
+PLACES = ['in Europe', 'in Japan', 'in India', 'in Texas', 'in Brazil', 'in Canada',
+          'in Korea', 'in Germany', 'in France', 'in Singapore', '', '']
+
+
+def make_day(rng: random.Random, count: int, repeat_share: float = 0.2) -> tuple:
+    """One day of events and the hidden story label of each"""
+    events, labels = [], []
+    stories = []
+
+    while len(events) < count:
+        if stories and rng.random() < repeat_share:
+            story = rng.randrange(len(stories))
+            company, product, amount = stories[story]
+            title = rng.choice(PHRASINGS).format(c=company, p=product, n=amount)
+        elif rng.random() < 0.5:
+            company, product, amount = rng.choice(COMPANIES), rng.choice(PRODUCTS), rng.randint(1, 90)
+            story = len(stories)
+            stories.append((company, product, amount))
+            title = rng.choice(PHRASINGS).format(c=company, p=product, n=amount)
+        else:
+            story = None
+            title = (f"{rng.choice(SUBJECTS).capitalize()} {rng.choice(ACTIONS)} "
+                     f"{rng.choice(COMPANIES)} {rng.choice(TOPICS)} {rng.choice(PLACES)}").strip()
+
+        events.append(Event(source=EventSource.MANUAL, source_id=str(len(events)), title=title,
+                            published_at=datetime(2025, 11, 20, 12, 0)))
+        labels.append(story if story is not None else f"solo-{len(events)}")
+
+    return events, labels
+
+
+class FakeClaude:
+    """Stands in for Anthropic().messages - groups prompt lines by story label"""
+
+    def __init__(self, label_by_title: dict, latency: float = 0.0):
+        self.label_by_title = label_by_title
+        self.latency = latency
+        self.calls = 0
+        self.prompt_chars = 0
+        self.messages = self
+        self._lock = threading.Lock()
+
+    def create(self, model, max_tokens, messages):
+        prompt = messages[0]['content']
+        with self._lock:
+            self.calls += 1
+            self.prompt_chars += len(prompt)
+        time.sleep(self.latency)
+
+        groups = {}
+        for line in prompt.splitlines():
+            idx, sep, title = line.partition('. ')
+            if sep and idx.isdigit() and title in self.label_by_title:
+                groups.setdefault(self.label_by_title[title], []).append(int(idx))
+
+        reply = {'duplicate_groups': [g for g in groups.values() if len(g) > 1],
+                 'reasoning': 'labels'}
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(reply))])
+
+
+def canonical(groups: list, events: list) -> set:
+    """Groups as frozensets of source_ids, for comparing runs"""
+    return {frozenset(events[i].source_id for i in group) for group in groups}
+
+
+def run(days: int, events_per_day: int, latency: float, workers: int):
+    rng = random.Random(11)
+
+    print("=" * 80)
+    print(f"SEMANTIC DEDUP PREFILTER: {days} days x {events_per_day} events")
+    print("=" * 80)
+
+    totals = {mode: {'calls': 0, 'chars': 0, 'seconds': 0.0} for mode in ('full', 'prefilter')}
+    calls = {'made': 0, 'avoided': 0, 'titles_sent': 0}
+    differ = 0
+
+    for day in range(days):
+        events, labels = make_day(rng, events_per_day)
+        # Titles repeat across stories only by accident; first label wins
+        label_by_title = {}
+        for event, label in zip(events, labels):
+            label_by_title.setdefault(event.title, label)
+
+        results = {}
+        for mode in ('full', 'prefilter'):
+            deduplicator = SemanticDeduplicator.__new__(SemanticDeduplicator)
+            deduplicator.client = FakeClaude(label_by_title, latency)
+            deduplicator.cost_tracker = None
+            deduplicator.max_workers = workers
+            deduplicator.rate_limiter = None
+            deduplicator.cache = None
+
+            start = time.perf_counter()
+            if mode == 'full':
+                groups = deduplicator._find_duplicates_for_date(events)
+            else:
+                groups = deduplicator._prefiltered_duplicates_for_date(events, calls)
+            totals[mode]['seconds'] += time.perf_counter() - start
+
+            results[mode] = canonical(groups, events)
+            totals[mode]['calls'] += deduplicator.client.calls
+            totals[mode]['chars'] += deduplicator.client.prompt_chars
+
+        differ += len(results['full'] ^ results['prefilter'])
+
+    print("\n" + "=" * 80)
+    for mode, stats in totals.items():
+        print(f"  {mode:<10} {stats['calls']:4d} calls, {stats['chars']:>9,} prompt chars, "
+              f"{stats['seconds']:6.2f}s")
+    print(f"  Calls avoided by prefilter: {calls['avoided']} of {days}")
+    print(f"  Titles sent: {calls['titles_sent']:,} of {days * events_per_day:,}")
+    if differ:
+        print(f"  ✗ {differ} duplicate groups differ between the two runs")
+    else:
+        print(f"  ✓ same duplicate groups in both runs")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark local pre-clustering for semantic dedup')
+    parser.add_argument('--days', type=int, default=10,
+                       help='Synthetic days to run (default: 10)')
+    parser.add_argument('--events-per-day', type=int, default=100,
+                       help='Events per day (default: 100)')
+    parser.add_argument('--latency', type=float, default=0.5,
+                       help='Simulated seconds per Claude request (default: 0.5)')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Concurrent requests (default: 4)')
+
+    args = parser.parse_args()
+
+    run(args.days, args.events_per_day, args.latency, args.workers)
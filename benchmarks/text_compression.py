@@ -0,0 +1,141 @@
+"""
+Benchmark: database size and scan speed with compressed content/analysis.
+
+Fills a database through save_events (so content and analysis are stored
+compressed, as in production) with synthetic articles and analyses, then
+makes an uncompressed copy by decoding both columns in SQL and VACUUMing.
+Compares file size, a metadata scan that never reads the text columns
+(rows are shorter, so fewer pages), and a full hydration of every event
+(which pays for decompression).
+
+Usage:
+    python benchmarks/text_compression.py
+    python benchmarks/text_compression.py --rows 20000
+"""
+
+import sys
+import time
+import random
+import shutil
+import tempfile
+from itertools import accumulate
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase, event_from_row
+from storage.connection import connect
+from models.events import Event, EventSource, EventType, EVENT_COLUMNS
+
+
+# Zipf-ish vocabulary - natural text compresses roughly like this
+VOCABULARY = [f"w{i}" for i in range(3000)] + [
+    'the', 'of', 'and', 'to', 'in', 'a', 'is', 'for', 'that', 'on', 'with', 'as', 'by',
+    'NVIDIA', 'OpenAI', 'Microsoft', 'chips', 'model', 'revenue', 'investors', 'market',
+]
+CUM_WEIGHTS = list(accumulate([1 / (rank + 1) for rank in range(len(VOCABULARY))][::-1]))
+
+
+def make_text(rng: random.Random, words: int) -> str:
+    sentence = rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=words)
+    return ' '.join(sentence).capitalize() + '.'
+
+
+def make_events(rng: random.Random, count: int, offset: int) -> list:
+    now = datetime.utcnow()
+    return [
+        Event(
+            source=EventSource.MANUAL,
+            source_id=str(i),
+            title=make_text(rng, 10),
+            content=make_text(rng, 500),
+            event_type=EventType.NEWS,
+            published_at=now - timedelta(minutes=i),
+            significance_score=rng.randint(0, 100),
+            sentiment=rng.choice(['positive', 'negative', 'neutral', 'mixed']),
+            analysis=make_text(rng, 250),
+        )
+        for i in range(offset, offset + count)
+    ]
+
+
+def measure(path: str, repeats: int = 3) -> dict:
+    """File size and best-of-N scan times for one database"""
+    conn = connect(path)
+    size = Path(path).stat().st_size
+    text = conn.execute("""
+        SELECT SUM(length(CAST(content AS BLOB))) + SUM(length(CAST(analysis AS BLOB))) FROM events
+    """).fetchone()[0]
+
+    metadata, hydrate = float('inf'), float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        conn.execute("""
+            SELECT id, title, significance_score FROM events
+            WHERE sentiment = 'positive' AND significance_score >= 50
+        """).fetchall()
+        metadata = min(metadata, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for row in conn.execute(f"SELECT {', '.join(EVENT_COLUMNS)} FROM events"):
+            event_from_row(row)
+        hydrate = min(hydrate, time.perf_counter() - start)
+
+    conn.close()
+    return {'size': size, 'text': text, 'metadata': metadata, 'hydrate': hydrate}
+
+
+def run(rows: int, batch: int):
+    rng = random.Random(11)
+
+    print("=" * 80)
+    print(f"TEXT COMPRESSION BENCHMARK: {rows:,} events")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        packed_path = str(Path(tmp) / "packed.db")
+        plain_path = str(Path(tmp) / "plain.db")
+
+        start = time.perf_counter()
+        with EventDatabase(packed_path) as db:
+            for offset in range(0, rows, batch):
+                db.save_events(make_events(rng, min(batch, rows - offset), offset))
+            db.conn.execute("VACUUM")
+        print(f"  insert (compressing): {time.perf_counter() - start:8.2f}s")
+
+        # Same rows, text stored plain
+        shutil.copy(packed_path, plain_path)
+        conn = connect(plain_path)
+        conn.execute("UPDATE events SET content = unpack_text(content), analysis = unpack_text(analysis)")
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+
+        plain = measure(plain_path)
+        packed = measure(packed_path)
+
+    print(f"\n  {'':<26} {'plain':>12} {'compressed':>12} {'change':>9}")
+    print(f"  {'database size (MB)':<26} {plain['size'] / 1e6:>12.1f} {packed['size'] / 1e6:>12.1f} "
+          f"{packed['size'] / plain['size']:>8.2f}x")
+    print(f"  {'content + analysis (MB)':<26} {plain['text'] / 1e6:>12.1f} {packed['text'] / 1e6:>12.1f} "
+          f"{packed['text'] / plain['text']:>8.2f}x")
+    print(f"  {'metadata scan (ms)':<26} {plain['metadata'] * 1000:>12.1f} {packed['metadata'] * 1000:>12.1f} "
+          f"{packed['metadata'] / plain['metadata']:>8.2f}x")
+    print(f"  {'full hydration (ms)':<26} {plain['hydrate'] * 1000:>12.1f} {packed['hydrate'] * 1000:>12.1f} "
+          f"{packed['hydrate'] / plain['hydrate']:>8.2f}x")
+    print("\n  (sizes include the full-text index, which is the same in both)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark compressed content/analysis storage')
+    parser.add_argument('--rows', type=int, default=100_000,
+                       help='Synthetic events to insert (default: 100,000)')
+    parser.add_argument('--batch', type=int, default=10_000,
+                       help='Events per save_events call (default: 10,000)')
+
+    args = parser.parse_args()
+
+    run(args.rows, args.batch)
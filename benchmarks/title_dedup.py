@@ -0,0 +1,141 @@
+"""
+Benchmark: indexed vs brute-force string deduplication.
+
+Generates a synthetic day of headlines (with a share of reworded
+near-duplicates), compares the events DataCollector.deduplicate_events
+keeps with the old all-pairs loop on a sample (they must agree exactly),
+then times the indexed version on the full day.
+
+Usage:
+    python benchmarks/title_dedup.py
+    python benchmarks/title_dedup.py --titles 10000 --parity-titles 2000
+"""
+
+import sys
+import time
+import random
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.collector import DataCollector
+from models.events import Event, EventSource
+
+
+COMPANIES = ['OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
+             'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle', 'Mistral', 'Cohere']
+VERBS = ['launches', 'unveils', 'releases', 'announces', 'raises', 'acquires',
+         'partners with', 'sues', 'delays', 'cuts prices for', 'expands', 'tests']
+REWORDINGS = ['', ' - report', ' (update)', ': sources', ' | Reuters', ' - Bloomberg']
+
+
+def make_vocabulary(rng: random.Random, size: int = 4000) -> list:
+    """Pronounceable pseudo-words so unrelated headlines rarely look alike"""
+    consonants, vowels = 'bcdfghklmnprstvz', 'aeiou'
+    words = set()
+    while len(words) < size:
+        syllables = rng.randint(2, 4)
+        words.add(''.join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)))
+    return sorted(words)
+
+
+def make_events(count: int, dup_share: float = 0.15, seed: int = 7) -> list:
+    """Build one day of synthetic headlines, some of them reworded repeats"""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    published = datetime(2025, 11, 20, 12, 0)
+    events = []
+
+    for i in range(count):
+        if events and rng.random() < dup_share:
+            # Same story from another outlet: maybe a word dropped, a suffix added
+            base = rng.choice(events)
+            words = base.title.split()
+            if len(words) > 5 and rng.random() < 0.5:
+                del words[rng.randrange(1, len(words))]
+            title = ' '.join(words) + rng.choice(REWORDINGS)
+            companies = list(base.companies)
+        else:
+            company = rng.choice(COMPANIES)
+            subject = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(3, 7)))
+            title = f"{company} {rng.choice(VERBS)} {subject}"
+            companies = [company]
+
+        events.append(Event(source=EventSource.MANUAL, source_id=str(i), title=title,
+                            companies=companies, published_at=published))
+
+    return events
+
+
+def brute_force(events: list, similarity_threshold: float = 0.75) -> list:
+    """The original all-pairs deduplication loop (kept events only)"""
+    kept = []
+    for event1 in events:
+        is_duplicate = False
+        for event2 in kept:
+            similarity = SequenceMatcher(None, event1.title.lower().strip(),
+                                         event2.title.lower().strip()).ratio()
+            companies_match = bool(set(event1.companies) & set(event2.companies))
+            if similarity >= similarity_threshold or (similarity >= 0.6 and companies_match):
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            kept.append(event1)
+    return kept
+
+
+def run(titles: int, parity_titles: int):
+    # deduplicate_events only needs the similarity helper, not sources/DB
+    collector = DataCollector.__new__(DataCollector)
+
+    print("=" * 80)
+    print(f"TITLE DEDUP BENCHMARK: {titles:,} titles/day (parity sample: {parity_titles:,})")
+    print("=" * 80)
+
+    sample = make_events(parity_titles)
+
+    start = time.perf_counter()
+    expected = brute_force(sample)
+    brute_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept, removed = collector.deduplicate_events(sample)
+    index_time = time.perf_counter() - start
+
+    expected_ids = {e.source_id for e in expected}
+    kept_ids = {e.source_id for e in kept}
+    differ = len(expected_ids ^ kept_ids)
+    print(f"  Sample brute force: {brute_time:8.2f}s  kept {len(expected):,}")
+    print(f"  Sample indexed:     {index_time:8.2f}s  kept {len(kept):,} ({removed:,} removed)")
+    if differ:
+        print(f"  ✗ {differ} of {len(sample):,} decisions differ from brute force")
+    else:
+        print(f"  ✓ identical decisions on all {len(sample):,} titles")
+    # The index only prunes pairs that can't reach the threshold
+    assert differ == 0, "indexed deduplication must decide exactly like brute force"
+
+    events = make_events(titles)
+    start = time.perf_counter()
+    kept, removed = collector.deduplicate_events(events)
+    full_time = time.perf_counter() - start
+
+    # Brute force is quadratic in kept events - extrapolate from the sample
+    estimate = brute_time * (len(kept) / max(1, len(expected))) ** 2
+    print(f"\n  Full day indexed:   {full_time:8.2f}s  kept {len(kept):,} ({removed:,} removed)")
+    print(f"  Full day brute force (extrapolated): ~{estimate:,.0f}s")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark indexed title deduplication')
+    parser.add_argument('--titles', type=int, default=50_000,
+                       help='Titles in the synthetic day (default: 50000)')
+    parser.add_argument('--parity-titles', type=int, default=1_000,
+                       help='Sample size for the brute-force parity check (default: 1000)')
+
+    args = parser.parse_args()
+
+    run(args.titles, args.parity_titles)
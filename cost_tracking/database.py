@@ -8,6 +8,10 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.connection import close_connection, connect
 
 
 class CostDatabase:
@@ -27,7 +31,7 @@ class CostDatabase:
 
     def _connect(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
 
     def _create_tables(self):
@@ -47,10 +51,16 @@ class CostDatabase:
                 total_tokens INTEGER NOT NULL,
                 estimated_cost REAL NOT NULL,
                 event_id INTEGER,
-                success BOOLEAN DEFAULT 1
+                success BOOLEAN DEFAULT 1,
+                cached INTEGER DEFAULT 0
             )
         """)
 
+        # Older databases predate response caching
+        cursor.execute("PRAGMA table_info(api_calls)")
+        if 'cached' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE api_calls ADD COLUMN cached INTEGER DEFAULT 0")
+
         # Daily summary table - aggregated daily stats
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS daily_summary (
@@ -90,7 +100,7 @@ class CostDatabase:
     def log_api_call(self, service: str, model: str, operation: str,
                      input_tokens: int, output_tokens: int,
                      estimated_cost: float, event_id: Optional[int] = None,
-                     success: bool = True) -> int:
+                     success: bool = True, cached: bool = False) -> int:
         """
         Log an API call.
 
@@ -103,6 +113,7 @@ class CostDatabase:
             estimated_cost: Estimated cost in USD
             event_id: Related event ID (optional)
             success: Whether call succeeded
+            cached: Answered from the response cache (no API request made)
 
         Returns:
             Database ID of logged call
@@ -116,12 +127,12 @@ class CostDatabase:
             INSERT INTO api_calls (
                 timestamp, service, model, operation,
                 input_tokens, output_tokens, total_tokens,
-                estimated_cost, event_id, success
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                estimated_cost, event_id, success, cached
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             timestamp, service, model, operation,
             input_tokens, output_tokens, total_tokens,
-            estimated_cost, event_id, success
+            estimated_cost, event_id, success, int(cached)
         ))
 
         self.conn.commit()
@@ -162,7 +173,8 @@ class CostDatabase:
                 SUM(input_tokens) as input_tokens,
                 SUM(output_tokens) as output_tokens,
                 SUM(total_tokens) as total_tokens,
-                SUM(estimated_cost) as total_cost
+                SUM(estimated_cost) as total_cost,
+                SUM(cached) as cache_hits
             FROM api_calls
             WHERE DATE(timestamp) = ?
         """, (date,))
@@ -176,6 +188,7 @@ class CostDatabase:
             'output_tokens': row['output_tokens'] or 0,
             'total_tokens': row['total_tokens'] or 0,
             'total_cost': row['total_cost'] or 0.0,
+            'cache_hits': row['cache_hits'] or 0,
         }
 
     def _get_date_range_stats(self, start_date: str, end_date: str) -> Dict:
@@ -188,7 +201,8 @@ class CostDatabase:
                 SUM(input_tokens) as input_tokens,
                 SUM(output_tokens) as output_tokens,
                 SUM(total_tokens) as total_tokens,
-                SUM(estimated_cost) as total_cost
+                SUM(estimated_cost) as total_cost,
+                SUM(cached) as cache_hits
             FROM api_calls
             WHERE DATE(timestamp) BETWEEN ? AND ?
         """, (start_date, end_date))
@@ -203,6 +217,7 @@ class CostDatabase:
             'output_tokens': row['output_tokens'] or 0,
             'total_tokens': row['total_tokens'] or 0,
             'total_cost': row['total_cost'] or 0.0,
+            'cache_hits': row['cache_hits'] or 0,
         }
 
     def get_breakdown_by_operation(self, days: int = 30) -> List[Dict]:
@@ -217,7 +232,8 @@ class CostDatabase:
                 COUNT(*) as calls,
                 SUM(total_tokens) as tokens,
                 SUM(estimated_cost) as cost,
-                AVG(estimated_cost) as avg_cost
+                AVG(estimated_cost) as avg_cost,
+                SUM(cached) as cache_hits
             FROM api_calls
             WHERE timestamp >= ?
             GROUP BY operation
@@ -323,7 +339,7 @@ class CostDatabase:
     def close(self):
         """Close database connection"""
         if self.conn:
-            self.conn.close()
+            close_connection(self.conn)
 
     def __enter__(self):
         return self
@@ -64,6 +64,9 @@ class CostTracker:
         """
         Log an Anthropic API call from response object.
 
+        Responses replayed from the response cache (response.cached) are
+        logged as zero-token, zero-cost calls flagged as cache hits.
+
         Args:
             response: Anthropic API response object
             operation: Operation type (e.g., 'event_analysis')
@@ -74,8 +77,13 @@ class CostTracker:
             Estimated cost in USD
         """
         model = response.model
-        input_tokens = response.usage.input_tokens
-        output_tokens = response.usage.output_tokens
+        cached = getattr(response, 'cached', False)
+
+        if cached:
+            input_tokens = output_tokens = 0
+        else:
+            input_tokens = response.usage.input_tokens
+            output_tokens = response.usage.output_tokens
 
         cost = self.calculate_cost('anthropic', model, input_tokens, output_tokens)
 
@@ -87,7 +95,8 @@ class CostTracker:
             output_tokens=output_tokens,
             estimated_cost=cost,
             event_id=event_id,
-            success=success
+            success=success,
+            cached=cached
         )
 
         return cost
@@ -225,6 +234,7 @@ if __name__ == "__main__":
             print(f"  Total Tokens:     {stats['total_tokens']:,}")
             print(f"  Input Tokens:     {stats['input_tokens']:,}")
             print(f"  Output Tokens:    {stats['output_tokens']:,}")
+            print(f"  Cache Hits:       {stats['cache_hits']}")
             print(f"  Estimated Cost:   ${stats['total_cost']:.4f}")
             print()
 
@@ -255,11 +265,12 @@ if __name__ == "__main__":
             breakdown = tracker.get_breakdown(days=args.days)
 
             if breakdown:
-                print(f"{'Operation':<25} {'Calls':<10} {'Tokens':<15} {'Cost':<12} {'Avg/Call':<12}")
-                print("-" * 80)
+                print(f"{'Operation':<25} {'Calls':<10} {'Cached':<8} {'Tokens':<15} {'Cost':<12} {'Avg/Call':<12}")
+                print("-" * 88)
                 for item in breakdown:
                     print(f"{item['operation']:<25} "
                           f"{item['calls']:<10} "
+                          f"{item['cache_hits'] or 0:<8} "
                           f"{item['tokens']:>14,} "
                           f"${item['cost']:>10.4f} "
                           f"${item['avg_cost']:>10.6f}")
@@ -322,17 +333,17 @@ if __name__ == "__main__":
             # Today
             today = tracker.get_today_summary()
             print(f"\nTODAY:")
-            print(f"  Calls: {today['total_calls']} | Tokens: {today['total_tokens']:,} | Cost: ${today['total_cost']:.4f}")
+            print(f"  Calls: {today['total_calls']} ({today['cache_hits']} cached) | Tokens: {today['total_tokens']:,} | Cost: ${today['total_cost']:.4f}")
 
             # Week
             week = tracker.get_week_summary()
             print(f"\nTHIS WEEK:")
-            print(f"  Calls: {week['total_calls']} | Tokens: {week['total_tokens']:,} | Cost: ${week['total_cost']:.4f}")
+            print(f"  Calls: {week['total_calls']} ({week['cache_hits']} cached) | Tokens: {week['total_tokens']:,} | Cost: ${week['total_cost']:.4f}")
 
             # Month
             month = tracker.get_month_summary()
             print(f"\nTHIS MONTH:")
-            print(f"  Calls: {month['total_calls']} | Tokens: {month['total_tokens']:,} | Cost: ${month['total_cost']:.4f}")
+            print(f"  Calls: {month['total_calls']} ({month['cache_hits']} cached) | Tokens: {month['total_tokens']:,} | Cost: ${month['total_cost']:.4f}")
 
             # Budget
             status = tracker.check_budget()
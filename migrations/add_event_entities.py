@@ -0,0 +1,70 @@
+"""
+Build the event_entities index for events saved before it existed.
+
+Companies, products and people used to live only in comma-joined TEXT
+columns on events. EventDatabase now also writes one event_entities row per
+mention (and backfills automatically the first time it creates the table);
+this script re-runs the backfill and reports what is indexed.
+
+Run once:
+    python3.9 migrations/add_event_entities.py
+
+What it does:
+    - Creates event_entities and its (kind, name_key, published_at) index if missing
+    - Indexes entities of any event that has none indexed yet (safe to re-run)
+    - Prints the most-mentioned companies as a check
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase
+
+
+def add_event_entities(db_path: str = "ai_pulse.db"):
+    """Backfill event_entities from the comma-joined entity columns"""
+
+    print("=" * 80)
+    print("MIGRATION: Build event_entities index")
+    print("=" * 80)
+
+    db = EventDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    print("\n1. Indexing entities of existing events...")
+    added = db.backfill_entities()
+    print(f"   ✓ {added} entity rows added")
+
+    print("\n2. Verifying index...")
+    cursor.execute("SELECT kind, COUNT(*), COUNT(DISTINCT event_id) FROM event_entities GROUP BY kind")
+    rows = cursor.fetchall()
+    if not rows:
+        print("   (no entities found)")
+    for kind, mentions, events in rows:
+        print(f"   - {kind}: {mentions} mentions across {events} events")
+
+    top = db.get_entity_counts('company', limit=5)
+    if top:
+        print("\n   Most-mentioned companies:")
+        for row in top:
+            print(f"   - {row['name']}: {row['events']} events")
+
+    db.close()
+
+    print("\n" + "=" * 80)
+    print("MIGRATION COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build event_entities index for existing events')
+    parser.add_argument('--db', type=str, default='ai_pulse.db', help='Database path')
+
+    args = parser.parse_args()
+
+    add_event_entities(args.db)
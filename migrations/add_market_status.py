@@ -12,13 +12,14 @@ What it does:
     - Market-close workflow will set status based on data collection success
 """
 
-import sqlite3
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+from storage.connection import connect
+
 
 def add_market_status_column(db_path: str = "ai_pulse.db"):
     """Add market_status column to predictions table"""
@@ -27,7 +28,7 @@ def add_market_status_column(db_path: str = "ai_pulse.db"):
     print("MIGRATION: Add market_status column to predictions table")
     print("=" * 80)
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Check if column already exists
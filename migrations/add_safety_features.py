@@ -13,6 +13,9 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).parent.parent))
+from storage.connection import connect
+
 def migrate(db_path: str = "ai_pulse.db"):
     """Run migration to add safety features"""
 
@@ -20,7 +23,7 @@ def migrate(db_path: str = "ai_pulse.db"):
     print("MIGRATION: Adding Safety Features")
     print("=" * 80)
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # 1. Add columns to predictions table
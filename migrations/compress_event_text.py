@@ -0,0 +1,116 @@
+"""
+Compress content and analysis of events stored before compression existed.
+
+EventDatabase now writes events.content and events.analysis zlib-compressed
+(storage/compression.py) and decodes them on read. Older rows hold plain
+TEXT, which still reads fine - this script packs them to reclaim the space.
+
+Run once:
+    python3.9 migrations/compress_event_text.py --vacuum
+
+What it does:
+    - Rebuilds the full-text index over the events_text view if it predates it
+      (happens when EventDatabase opens the database)
+    - Packs plain-text content/analysis in batches (safe to re-run - packed
+      and short values are skipped)
+    - Optionally VACUUMs so the freed pages are returned to the filesystem
+    - Prints the stored size of both columns before and after
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase
+from storage.compression import MIN_LENGTH, pack_text
+
+
+def stored_bytes(db: EventDatabase) -> int:
+    """Bytes held by content + analysis across all events"""
+    cursor = db.conn.execute("""
+        SELECT COALESCE(SUM(length(CAST(content AS BLOB))), 0)
+             + COALESCE(SUM(length(CAST(analysis AS BLOB))), 0)
+        FROM events
+    """)
+    return cursor.fetchone()[0]
+
+
+def file_size(db: EventDatabase) -> int:
+    page_count = db.conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = db.conn.execute("PRAGMA page_size").fetchone()[0]
+    return page_count * page_size
+
+
+def compress_event_text(db_path: str = "ai_pulse.db", batch_size: int = 2000, vacuum: bool = False):
+    """Pack plain-text content/analysis of existing events"""
+
+    print("=" * 80)
+    print("MIGRATION: Compress event content and analysis")
+    print("=" * 80)
+
+    db = EventDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    before = stored_bytes(db)
+    print(f"\n1. Stored text: {before / 1e6:.1f} MB (database file {file_size(db) / 1e6:.1f} MB)")
+
+    # The decoded text doesn't change, so the full-text index (fed by
+    # EventDatabase, not by triggers) stays valid as rows are packed
+    print("\n2. Compressing...")
+    packed = 0
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT id, content, analysis FROM events
+            WHERE id > ?
+              AND ((typeof(content) = 'text' AND length(content) >= ?)
+                OR (typeof(analysis) = 'text' AND length(analysis) >= ?))
+            ORDER BY id
+            LIMIT ?
+        """, (last_id, MIN_LENGTH, MIN_LENGTH, batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+
+        updates = [(pack_text(content) if isinstance(content, str) else content,
+                    pack_text(analysis) if isinstance(analysis, str) else analysis,
+                    event_id)
+                   for event_id, content, analysis in rows]
+        with db.conn:
+            db.conn.executemany("UPDATE events SET content = ?, analysis = ? WHERE id = ?", updates)
+
+        packed += len(rows)
+        last_id = rows[-1][0]
+        print(f"   ✓ {packed} events packed")
+
+    after = stored_bytes(db)
+    print(f"\n3. Stored text: {after / 1e6:.1f} MB "
+          f"({(1 - after / before) * 100 if before else 0:.0f}% smaller)")
+
+    if vacuum:
+        print("\n4. Vacuuming...")
+        db.conn.execute("VACUUM")
+        print(f"   ✓ Database file {file_size(db) / 1e6:.1f} MB")
+    else:
+        print("\n   Run with --vacuum (or VACUUM) to shrink the database file")
+
+    db.close()
+
+    print("\n" + "=" * 80)
+    print("MIGRATION COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compress content/analysis of existing events')
+    parser.add_argument('--db', type=str, default='ai_pulse.db', help='Database path')
+    parser.add_argument('--batch', type=int, default=2000, help='Events per transaction')
+    parser.add_argument('--vacuum', action='store_true', help='VACUUM afterwards')
+
+    args = parser.parse_args()
+
+    compress_event_text(args.db, batch_size=args.batch, vacuum=args.vacuum)
@@ -0,0 +1,66 @@
+"""
+Recount daily_sentiment from events.
+
+daily_sentiment used to be written once per publish as a 24h-window
+snapshot; it is now kept current by triggers on events, counting each
+publish day's non-duplicate events with a sentiment (the signal
+prediction_logger predicts from). Opening the database recounts the table
+automatically whenever those triggers are missing or change, so this is
+only needed to force a recount (e.g. after editing events by hand with the
+triggers dropped).
+
+Run:
+    python3.9 migrations/rebuild_daily_sentiment.py
+
+What it does:
+    - Copies daily_sentiment to daily_sentiment_backup_<timestamp> first
+    - Replaces every row with a publish-day recount from live and archived events
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from storage.db import EventDatabase
+
+
+def rebuild_daily_sentiment(db_path: str = "ai_pulse.db"):
+    """Back up daily_sentiment, then recount every date"""
+
+    print("=" * 80)
+    print("MIGRATION: Rebuild daily_sentiment from events")
+    print("=" * 80)
+
+    db = EventDatabase(db_path)
+    cursor = db.conn.cursor()
+
+    print("\n1. Backing up and recounting every date from events...")
+    result = db.rebuild_daily_sentiment()
+    if result['backup']:
+        print(f"   ✓ Previous rows copied to {result['backup']}")
+    else:
+        print("   (nothing to back up)")
+    print(f"   ✓ {result['dates']} dates written")
+
+    cursor.execute("SELECT COUNT(*), MIN(date), MAX(date) FROM daily_sentiment")
+    rows, first, last = cursor.fetchone()
+    print(f"\n2. daily_sentiment now has {rows} dates ({first} to {last})")
+
+    db.close()
+
+    print("\n" + "=" * 80)
+    print("MIGRATION COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Recount daily_sentiment from events')
+    parser.add_argument('--db', type=str, default='ai_pulse.db', help='Database path')
+
+    args = parser.parse_args()
+
+    rebuild_daily_sentiment(args.db)
@@ -9,7 +9,7 @@ An Event represents any piece of information we collect about the AI sector:
 - Social media posts
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
@@ -45,6 +45,27 @@ class EventSource(Enum):
     UNKNOWN = "unknown"
 
 
+# Stored value -> member; a dict lookup is much cheaper than EventType(value)
+EVENT_TYPES = {member.value: member for member in EventType}
+EVENT_SOURCES = {member.value: member for member in EventSource}
+
+
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ (what dataclass(slots=True) does on 3.10+).
+
+    Instances then carry no per-instance __dict__, which roughly halves
+    their size. Defaults live in the generated __init__, so the class
+    attributes that held them can go.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class Event:
     """
@@ -105,46 +126,33 @@ class Event:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database storage"""
-        return {
-            'id': self.id,
-            'source': self.source.value,
-            'source_id': self.source_id,
-            'source_url': self.source_url,
-            'title': self.title,
-            'content': self.content,
-            'summary': self.summary,
-            'event_type': self.event_type.value,
-            'companies': ','.join(self.companies) if self.companies else None,
-            'products': ','.join(self.products) if self.products else None,
-            'people': ','.join(self.people) if self.people else None,
-            'published_at': self.published_at.isoformat() if self.published_at else None,
-            'collected_at': self.collected_at.isoformat() if self.collected_at else None,
-            'significance_score': self.significance_score,
-            'sentiment': self.sentiment,
-            'analysis': self.analysis,
-            'implications': self.implications,
-            'affected_parties': self.affected_parties,
-            'investment_relevance': self.investment_relevance,
-            'key_context': self.key_context,
-        }
+        return dict(zip(EVENT_COLUMNS[:20], (self.id,) + self.to_row()))
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Event':
         """Create Event from database row"""
+        source = data.get('source')
+        event_type = data.get('event_type')
+        companies = data.get('companies')
+        products = data.get('products')
+        people = data.get('people')
+        published_at = data.get('published_at')
+        collected_at = data.get('collected_at')
+
         return cls(
             id=data.get('id'),
-            source=EventSource(data['source']) if data.get('source') else EventSource.UNKNOWN,
+            source=EVENT_SOURCES[source] if source else EventSource.UNKNOWN,
             source_id=data.get('source_id'),
             source_url=data.get('source_url', ''),
             title=data.get('title', ''),
             content=data.get('content'),
             summary=data.get('summary'),
-            event_type=EventType(data['event_type']) if data.get('event_type') else EventType.UNKNOWN,
-            companies=data.get('companies').split(',') if data.get('companies') else [],
-            products=data.get('products').split(',') if data.get('products') else [],
-            people=data.get('people').split(',') if data.get('people') else [],
-            published_at=datetime.fromisoformat(data['published_at']) if data.get('published_at') else None,
-            collected_at=datetime.fromisoformat(data['collected_at']) if data.get('collected_at') else None,
+            event_type=EVENT_TYPES[event_type] if event_type else EventType.UNKNOWN,
+            companies=companies.split(',') if companies else [],
+            products=products.split(',') if products else [],
+            people=people.split(',') if people else [],
+            published_at=datetime.fromisoformat(published_at) if published_at else None,
+            collected_at=datetime.fromisoformat(collected_at) if collected_at else None,
             significance_score=data.get('significance_score'),
             sentiment=data.get('sentiment'),
             analysis=data.get('analysis'),
@@ -156,5 +164,168 @@ class Event:
             is_semantic_duplicate=bool(data.get('is_semantic_duplicate', 0)),
         )
 
+    def to_row(self) -> tuple:
+        """
+        Values for INSERT_COLUMNS, in order - for positional SQLite binding.
+
+        Same conversions as to_dict, without building a dict per event.
+        """
+        published_at = self.published_at
+        collected_at = self.collected_at
+        return (
+            self.source.value,
+            self.source_id,
+            self.source_url,
+            self.title,
+            self.content,
+            self.summary,
+            self.event_type.value,
+            ','.join(self.companies) if self.companies else None,
+            ','.join(self.products) if self.products else None,
+            ','.join(self.people) if self.people else None,
+            published_at.isoformat() if published_at else None,
+            collected_at.isoformat() if collected_at else None,
+            self.significance_score,
+            self.sentiment,
+            self.analysis,
+            self.implications,
+            self.affected_parties,
+            self.investment_relevance,
+            self.key_context,
+        )
+
+    @classmethod
+    def from_row(cls, row) -> 'Event':
+        """
+        Create Event from a row selected as EVENT_COLUMNS (tuple or sqlite3.Row).
+
+        Positional counterpart of from_dict for "SELECT <EVENT_COLUMNS>".
+        """
+        (id_, source, source_id, source_url, title, content, summary, event_type,
+         companies, products, people, published_at, collected_at, significance_score,
+         sentiment, analysis, implications, affected_parties, investment_relevance,
+         key_context, is_duplicate, is_semantic_duplicate) = row[:22]
+
+        return cls(
+            id_,
+            EVENT_SOURCES[source] if source else EventSource.UNKNOWN,
+            source_id,
+            source_url,
+            title,
+            content,
+            summary,
+            EVENT_TYPES[event_type] if event_type else EventType.UNKNOWN,
+            companies.split(',') if companies else [],
+            products.split(',') if products else [],
+            people.split(',') if people else [],
+            datetime.fromisoformat(published_at) if published_at else None,
+            datetime.fromisoformat(collected_at) if collected_at else None,
+            significance_score,
+            sentiment,
+            analysis,
+            implications,
+            affected_parties,
+            investment_relevance,
+            key_context,
+            bool(is_duplicate),
+            bool(is_semantic_duplicate),
+        )
+
     def __repr__(self):
         return f"Event(source={self.source.value}, title='{self.title[:50]}...', type={self.event_type.value})"
+
+
+# Columns of the events table that map onto Event fields, in Event field
+# order (the order from_row expects)
+EVENT_COLUMNS = (
+    'id', 'source', 'source_id', 'source_url', 'title', 'content', 'summary',
+    'event_type', 'companies', 'products', 'people', 'published_at', 'collected_at',
+    'significance_score', 'sentiment', 'analysis', 'implications', 'affected_parties',
+    'investment_relevance', 'key_context', 'is_duplicate', 'is_semantic_duplicate',
+)
+
+# Columns written on insert, in to_row order (id is assigned by SQLite and
+# the duplicate flags are set later by the dedup passes)
+INSERT_COLUMNS = EVENT_COLUMNS[1:20]
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    return value.split(',') if value else []
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+# Column value -> Event attribute, same conversions as Event.from_dict
+# (columns not listed are used as stored)
+_FIELD_PARSERS = {
+    'source': lambda value: EVENT_SOURCES[value] if value else EventSource.UNKNOWN,
+    'event_type': lambda value: EVENT_TYPES[value] if value else EventType.UNKNOWN,
+    'companies': _split_list,
+    'products': _split_list,
+    'people': _split_list,
+    'published_at': _parse_datetime,
+    'collected_at': _parse_datetime,
+    'is_duplicate': bool,
+    'is_semantic_duplicate': bool,
+}
+
+
+class EventRow:
+    """
+    Read-only view of a (possibly partial) events row.
+
+    Reads like an Event, but only holds the columns that were selected and
+    converts each one on first access - listing paths that touch a title and
+    a score don't pay for parsing dates, splitting entity lists or loading
+    content. Reading a column that wasn't selected raises AttributeError.
+
+    Usage:
+        rows = db.get_recent_events(fields=('title', 'significance_score'))
+        rows[0].title
+        rows[0].to_event()   # full Event (only selected columns filled)
+    """
+
+    __slots__ = ('_row', '_values')
+
+    # Column -> conversion applied on first access
+    _PARSERS = _FIELD_PARSERS
+
+    def __init__(self, row):
+        """
+        Args:
+            row: sqlite3.Row (or dict) from an events query
+        """
+        self._row = row
+        self._values = {}
+
+    def __getattr__(self, name: str):
+        # Only called for names that aren't slots
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        try:
+            value = self._row[name]
+        except (KeyError, IndexError):
+            raise AttributeError(f"EventRow has no column '{name}' (not selected)") from None
+
+        parser = self._PARSERS.get(name)
+        if parser is not None:
+            value = parser(value)
+        self._values[name] = value
+        return value
+
+    def keys(self) -> List[str]:
+        """Selected column names"""
+        return list(self._row.keys())
+
+    def to_event(self) -> Event:
+        """Hydrate a full Event from the selected columns"""
+        return Event.from_dict({key: self._row[key] for key in self._row.keys()})
+
+    def __repr__(self):
+        title = self._row['title'][:50] if 'title' in self.keys() and self._row['title'] else ''
+        return f"EventRow(id={getattr(self, 'id', None)}, title='{title}...')"
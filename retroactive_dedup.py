@@ -10,10 +10,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from storage.db import EventDatabase
-from models.events import Event
+from analysis.title_index import TitleIndex
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from collections import defaultdict
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -53,55 +52,53 @@ def find_duplicates(db_path: str = "ai_pulse.db", days_back: int = 30, similarit
     cutoff = datetime.utcnow() - timedelta(days=days_back)
     print(f"\nFinding duplicates in events from last {days_back} days...")
 
-    cursor.execute("""
-        SELECT * FROM events
-        WHERE collected_at >= ?
-        ORDER BY collected_at DESC
-    """, (cutoff.isoformat(),))
-
-    all_events = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
-    print(f"Found {len(all_events)} events to check")
-
-    # Group by date
-    by_date = defaultdict(list)
-    for event in all_events:
-        date = event.published_at.date() if event.published_at else event.collected_at.date()
-        by_date[date].append(event)
-
     total_duplicates = 0
     duplicate_ids = set()
+    checked = 0
+
+    # Stream one date at a time (oldest first) - only titles and companies
+    # are compared, so the rest of each row isn't loaded
+    days = db.iter_events(
+        "collected_at >= ?", (cutoff.isoformat(),),
+        fields=('title', 'companies'), since=cutoff,
+    )
 
     # Process each date
-    for date, date_events in sorted(by_date.items()):
+    for date, date_events in days:
+        checked += len(date_events)
         print(f"\nChecking {date}: {len(date_events)} events")
         date_duplicates = 0
 
-        # Mark duplicates within this date
-        for i in range(len(date_events)):
-            if date_events[i].id in duplicate_ids:
-                continue
-
-            for j in range(i + 1, len(date_events)):
-                if date_events[j].id in duplicate_ids:
-                    continue
+        # Mark duplicates within this date: each event is checked against the
+        # earlier non-duplicate events the title index offers as candidates
+        index = TitleIndex()
 
+        for later in date_events:
+            # Titles sharing a company only need 0.6
+            candidates = index.candidates(later.title, similarity_threshold,
+                                          tags=later.companies, tag_ratio=0.6)
+            for original in candidates:
                 # Calculate similarity
-                similarity = calculate_similarity(date_events[i].title, date_events[j].title)
+                similarity = calculate_similarity(original.title, later.title)
 
                 # Check companies match
                 companies_match = False
-                if date_events[i].companies and date_events[j].companies:
-                    common = set(date_events[i].companies) & set(date_events[j].companies)
+                if original.companies and later.companies:
+                    common = set(original.companies) & set(later.companies)
                     companies_match = len(common) > 0
 
                 # Mark as duplicate if criteria met
                 if similarity >= similarity_threshold or (similarity >= 0.6 and companies_match):
-                    # Mark the later one (j) as duplicate
-                    duplicate_ids.add(date_events[j].id)
+                    # Mark the later one as duplicate
+                    duplicate_ids.add(later.id)
                     date_duplicates += 1
                     print(f"  ✓ Duplicate found (similarity: {similarity:.2f})")
-                    print(f"    Original: {date_events[i].title[:70]}...")
-                    print(f"    Duplicate: {date_events[j].title[:70]}...")
+                    print(f"    Original: {original.title[:70]}...")
+                    print(f"    Duplicate: {later.title[:70]}...")
+                    break
+
+            if later.id not in duplicate_ids:
+                index.add(later, later.title, tags=later.companies)
 
         if date_duplicates > 0:
             print(f"  → {date_duplicates} duplicates on {date}")
@@ -110,68 +107,23 @@ def find_duplicates(db_path: str = "ai_pulse.db", days_back: int = 30, similarit
     # Mark duplicates in database
     if duplicate_ids:
         print(f"\nMarking {len(duplicate_ids)} events as duplicates in database...")
+        marked = 0
         for event_id in duplicate_ids:
             cursor.execute("UPDATE events SET is_duplicate = 1 WHERE id = ?", (event_id,))
+            marked += cursor.rowcount
         db.conn.commit()
         print("✓ Database updated")
+        if marked < len(duplicate_ids):
+            # Archive partitions are read-only here (and daily_sentiment
+            # triggers only see the live table)
+            print(f"⚠ {len(duplicate_ids) - marked} duplicates are archived and were left unmarked")
 
-    # Recalculate daily sentiment aggregates
-    print("\nRecalculating daily sentiment aggregates...")
-
-    # Get all dates that need recalculation
-    dates_to_recalc = set()
-    for event_id in duplicate_ids:
-        cursor.execute("SELECT published_at, collected_at FROM events WHERE id = ?", (event_id,))
-        row = cursor.fetchone()
-        if row:
-            pub_date = row[0]
-            col_date = row[1]
-            date_str = pub_date.split('T')[0] if pub_date else col_date.split('T')[0]
-            dates_to_recalc.add(date_str)
-
-    # Recalculate for each affected date
-    for date_str in sorted(dates_to_recalc):
-        print(f"  Recalculating {date_str}...")
-
-        # Get non-duplicate, analyzed events for this date
-        cursor.execute("""
-            SELECT sentiment FROM events
-            WHERE (DATE(published_at) = ? OR DATE(collected_at) = ?)
-              AND significance_score IS NOT NULL
-              AND (is_duplicate IS NULL OR is_duplicate = 0)
-        """, (date_str, date_str))
-
-        sentiments = [row[0] for row in cursor.fetchall() if row[0]]
-
-        # Count sentiments
-        sentiment_counts = {}
-        for sent in sentiments:
-            sentiment_counts[sent] = sentiment_counts.get(sent, 0) + 1
-
-        # Update or insert daily sentiment
-        cursor.execute("DELETE FROM daily_sentiment WHERE date = ?", (date_str,))
-
-        if sentiment_counts:
-            cursor.execute("""
-                INSERT INTO daily_sentiment (date, positive, negative, neutral, mixed, total_analyzed, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                date_str,
-                sentiment_counts.get('positive', 0),
-                sentiment_counts.get('negative', 0),
-                sentiment_counts.get('neutral', 0),
-                sentiment_counts.get('mixed', 0),
-                len(sentiments),
-                datetime.utcnow().isoformat()
-            ))
-            print(f"    ✓ {date_str}: {len(sentiments)} events")
-
+    # (daily_sentiment counts follow the is_duplicate updates via triggers)
     db.conn.commit()
     db.close()
 
     print("\n" + "=" * 80)
-    print(f"COMPLETE: {total_duplicates} duplicates marked")
-    print(f"Recalculated sentiment for {len(dates_to_recalc)} dates")
+    print(f"COMPLETE: {total_duplicates} duplicates marked ({checked} events checked)")
     print("=" * 80)
 
 
@@ -1,8 +1,8 @@
 """
 Retroactive semantic deduplication for already-analyzed events.
 
-Finds semantic duplicates in historical data and marks them,
-then recalculates sentiment to ensure accuracy.
+Finds semantic duplicates in historical data and marks them. Daily
+sentiment counts are adjusted by the triggers on events as flags change.
 """
 
 import sys
@@ -15,10 +15,9 @@ from dotenv import load_dotenv
 from anthropic import Anthropic
 from datetime import datetime, timedelta
 from storage.db import EventDatabase
-from models.events import Event
 from typing import List, Dict
 from cost_tracking.tracker import CostTracker
-from collections import defaultdict
+from analysis.llm_cache import ResponseCache
 
 
 def find_semantic_duplicates_retroactive(db_path: str = "ai_pulse.db", days_back: int = 7):
@@ -39,6 +38,7 @@ def find_semantic_duplicates_retroactive(db_path: str = "ai_pulse.db", days_back
     client = Anthropic(api_key=api_key)
     db = EventDatabase(db_path)
     cost_tracker = CostTracker()
+    cache = ResponseCache()
 
     print("=" * 80)
     print("RETROACTIVE SEMANTIC DEDUPLICATION")
@@ -58,34 +58,21 @@ def find_semantic_duplicates_retroactive(db_path: str = "ai_pulse.db", days_back
     # Get analyzed events from recent days
     cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-    cursor.execute("""
-        SELECT * FROM events
-        WHERE significance_score IS NOT NULL
-          AND collected_at >= ?
-          AND (is_duplicate IS NULL OR is_duplicate = 0)
-        ORDER BY published_at DESC
-    """, (cutoff.isoformat(),))
-
-    events = [Event.from_dict(dict(row)) for row in cursor.fetchall()]
-
-    if not events:
-        print("\n✓ No events found")
-        db.close()
-        return
-
-    print(f"\nFound {len(events)} analyzed events to check")
-
-    # Group by date
-    by_date = defaultdict(list)
-    for event in events:
-        date = event.published_at.date() if event.published_at else event.collected_at.date()
-        by_date[date].append(event)
+    # Stream one date at a time (oldest first); prompts only need titles
+    days = db.iter_events("""
+        significance_score IS NOT NULL
+        AND collected_at >= ?
+        AND (is_duplicate IS NULL OR is_duplicate = 0)
+    """, (cutoff.isoformat(),), fields=('title',), order='published_at DESC', since=cutoff)
 
     total_duplicates = 0
+    unmarked = 0
     dates_affected = set()
+    checked = 0
 
     # Process each date
-    for date, date_events in sorted(by_date.items()):
+    for date, date_events in days:
+        checked += len(date_events)
         if len(date_events) < 2:
             print(f"\n{date}: Only 1 event, skipping")
             continue
@@ -119,7 +106,9 @@ If no duplicates, return:
 """
 
         try:
-            response = client.messages.create(
+            # Re-runs over the same days are answered from the response cache
+            response = cache.create(
+                client,
                 model="claude-3-5-haiku-20241022",
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
@@ -170,6 +159,11 @@ If no duplicates, return:
                             "UPDATE events SET is_semantic_duplicate = 1 WHERE id = ?",
                             (event.id,)
                         )
+                        if not cursor.rowcount:
+                            # Archived - partitions are read-only here
+                            print(f"    DUP (archived, left unmarked):  {event.title[:70]}...")
+                            unmarked += 1
+                            continue
                         print(f"    DUP:  {event.title[:70]}...")
                         total_duplicates += 1
 
@@ -182,52 +176,16 @@ If no duplicates, return:
 
     db.conn.commit()
 
-    # Recalculate sentiment for affected dates
-    if dates_affected:
-        print(f"\n\nRecalculating sentiment for {len(dates_affected)} affected dates...")
-
-        for date_str in sorted(dates_affected):
-            cursor.execute("""
-                SELECT sentiment FROM events
-                WHERE (DATE(published_at) = ? OR DATE(collected_at) = ?)
-                  AND significance_score IS NOT NULL
-                  AND (is_duplicate IS NULL OR is_duplicate = 0)
-                  AND (is_semantic_duplicate IS NULL OR is_semantic_duplicate = 0)
-            """, (date_str, date_str))
-
-            sentiments = [row[0] for row in cursor.fetchall() if row[0]]
-
-            if not sentiments:
-                continue
-
-            sentiment_counts = {}
-            for sent in sentiments:
-                sentiment_counts[sent] = sentiment_counts.get(sent, 0) + 1
-
-            # Update daily_sentiment
-            cursor.execute("DELETE FROM daily_sentiment WHERE date = ?", (date_str,))
-            cursor.execute("""
-                INSERT INTO daily_sentiment (date, positive, negative, neutral, mixed, total_analyzed, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                date_str,
-                sentiment_counts.get('positive', 0),
-                sentiment_counts.get('negative', 0),
-                sentiment_counts.get('neutral', 0),
-                sentiment_counts.get('mixed', 0),
-                len(sentiments),
-                datetime.utcnow().isoformat()
-            ))
-
-            print(f"  ✓ {date_str}: {len(sentiments)} unique events")
-
-        db.conn.commit()
+    # (daily_sentiment counts follow the is_semantic_duplicate updates via triggers)
 
     db.close()
+    cache.close()
 
     print("\n" + "=" * 80)
-    print(f"COMPLETE: {total_duplicates} semantic duplicates marked")
-    print(f"Sentiment recalculated for {len(dates_affected)} dates")
+    print(f"COMPLETE: {total_duplicates} semantic duplicates marked ({checked} events checked)")
+    print(f"Duplicates found on {len(dates_affected)} dates")
+    if unmarked:
+        print(f"⚠ {unmarked} duplicates are archived and were left unmarked")
     print("=" * 80)
 
 
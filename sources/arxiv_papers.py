@@ -16,6 +16,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.http_cache import HTTPCache, fetch_feed
 
 
 class ArXivSource:
@@ -42,8 +43,14 @@ class ArXivSource:
         'stat.ML',  # Machine Learning (Statistics)
     ]
 
-    def __init__(self):
-        """Initialize ArXiv source"""
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        """
+        Initialize ArXiv source.
+
+        Args:
+            cache: Conditional-GET cache (unchanged category feeds are skipped)
+        """
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-Pulse/1.0 (AI sector intelligence bot)'
@@ -74,8 +81,9 @@ class ArXivSource:
                 # Use RSS feed - it actually returns recent papers
                 rss_url = f"{self.RSS_BASE}{category}"
 
-                response = self.session.get(rss_url, timeout=30)
-                response.raise_for_status()
+                response = fetch_feed(self.session, rss_url, self.cache, 'arxiv', timeout=30)
+                if response is None:
+                    continue  # Unchanged since the last fetch
 
                 # Parse RSS XML
                 root = ET.fromstring(response.content)
@@ -16,6 +16,7 @@ import os
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.keywords import NEWS_MATCHER
 
 
 class BingNewsSource:
@@ -108,41 +109,16 @@ class BingNewsSource:
 
     def classify_article(self, title: str, description: str) -> EventType:
         """Classify article type"""
-        text = (title + " " + description).lower()
-
-        if any(word in text for word in ['funding', 'raises', 'investment', 'valuation', 'ipo']):
-            return EventType.FUNDING
-        elif any(word in text for word in ['launches', 'releases', 'unveils', 'announces new']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in text for word in ['partnership', 'collaboration', 'deal', 'acquisition']):
-            return EventType.PARTNERSHIP
-        elif any(word in text for word in ['regulation', 'policy', 'law', 'legal', 'court']):
-            return EventType.REGULATION
-        elif any(word in text for word in ['research', 'paper', 'study', 'breakthrough']):
-            return EventType.RESEARCH
-        else:
-            return EventType.NEWS
+        return NEWS_MATCHER.match(title, description).label or EventType.NEWS
 
     def extract_companies(self, title: str, description: str) -> List[str]:
         """Extract company mentions"""
-        text = title + " " + description
-        companies = []
-
-        company_names = [
-            'OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
-            'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle',
-            'Hugging Face', 'Stability AI', 'Cohere', 'Mistral',
-        ]
-
-        for company in company_names:
-            if company.lower() in text.lower():
-                companies.append(company)
-
-        return companies
+        return list(NEWS_MATCHER.match(title, description).entities)
 
     def item_to_event(self, item: dict) -> Event:
         """Convert news item to Event object"""
-        companies = self.extract_companies(item['title'], item['description'])
+        # Event type and companies from one pass over the text
+        hit = NEWS_MATCHER.match(item['title'], item['description'])
 
         event = Event(
             source=EventSource.BING_NEWS,
@@ -151,8 +127,8 @@ class BingNewsSource:
             title=item['title'],
             content=item['description'],
             summary=item['description'][:200] if len(item['description']) > 200 else item['description'],
-            event_type=self.classify_article(item['title'], item['description']),
-            companies=companies,
+            event_type=hit.label or EventType.NEWS,
+            companies=list(hit.entities),
             published_at=item['published'],
         )
 
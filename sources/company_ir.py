@@ -8,7 +8,6 @@ Examples: Earnings, product launches, strategic partnerships, acquisitions.
 """
 
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Optional
 import sys
@@ -16,6 +15,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.dates import parse_date
+from sources.feed_parser import parse_feed
+from sources.http_cache import HTTPCache, fetch_feed
+from sources.keywords import KeywordMatcher
 
 
 class CompanyIRSource:
@@ -42,8 +45,26 @@ class CompanyIRSource:
         'Anthropic': 'https://www.anthropic.com/news/rss',  # If available
     }
 
-    def __init__(self):
-        """Initialize Company IR source"""
+    # Press release keyword groups, in priority order (whole words; * = any ending).
+    # 'product' only qualifies a launch, so it comes last.
+    RELEASE_KEYWORDS = [
+        ('earnings', ['earnings', 'quarterly', 'result*', 'revenue*', 'profit*']),
+        ('launch', ['launch*', 'introduces', 'announces', 'unveils', 'releases']),
+        ('partnership', ['partnership*', 'collaboration*', 'agreement*', 'deal*']),
+        ('acquisition', ['acquisition*', 'acquires', 'merger*']),
+        ('product', ['chip*', 'gpu*', 'product*', 'platform*']),
+    ]
+
+    MATCHER = KeywordMatcher(RELEASE_KEYWORDS)
+
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        """
+        Initialize Company IR source.
+
+        Args:
+            cache: Conditional-GET cache (unchanged feeds are skipped)
+        """
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-Pulse/1.0 Investment Research',
@@ -62,123 +83,49 @@ class CompanyIRSource:
             List of news items
         """
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            response = fetch_feed(self.session, url, self.cache, 'company_ir', timeout=10)
+            if response is None:
+                return []  # Unchanged since the last fetch
 
-            items = self._parse_rss_feed(response.text, company, days_back)
+            items = self._parse_rss_feed(response.content, company, days_back)
             return items
 
         except Exception as e:
             print(f"Error fetching {company} RSS: {e}")
             return []
 
-    def _parse_rss_feed(self, xml_content: str, company: str, days_back: int) -> List[dict]:
+    def _parse_rss_feed(self, xml_content: bytes, company: str, days_back: int) -> List[dict]:
         """Parse RSS/Atom feed"""
         try:
-            root = ET.fromstring(xml_content)
-
-            items = []
             cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-            # Try RSS 2.0 format first
-            for item in root.findall('.//item'):
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pubdate_elem = item.find('pubDate')
-                description_elem = item.find('description')
-
-                if not all([title_elem, link_elem]):
-                    continue
-
-                title = title_elem.text
-                link = link_elem.text
-                description = description_elem.text if description_elem is not None else ""
-
-                # Parse date
-                published = self._parse_date(pubdate_elem.text if pubdate_elem is not None else "")
-                if not published or published < cutoff:
-                    continue
-
-                items.append({
+            # Undated entries are skipped
+            return [
+                {
                     'company': company,
-                    'title': title,
-                    'link': link,
-                    'description': description,
-                    'published': published,
-                })
-
-            # If no items, try Atom format
-            if not items:
-                ns = {'atom': 'http://www.w3.org/2005/Atom'}
-                for entry in root.findall('atom:entry', ns):
-                    title_elem = entry.find('atom:title', ns)
-                    link_elem = entry.find('atom:link', ns)
-                    updated_elem = entry.find('atom:updated', ns)
-                    summary_elem = entry.find('atom:summary', ns)
-
-                    if not all([title_elem, link_elem]):
-                        continue
-
-                    title = title_elem.text
-                    link = link_elem.get('href')
-                    description = summary_elem.text if summary_elem is not None else ""
-
-                    published = self._parse_date(updated_elem.text if updated_elem is not None else "")
-                    if not published or published < cutoff:
-                        continue
-
-                    items.append({
-                        'company': company,
-                        'title': title,
-                        'link': link,
-                        'description': description,
-                        'published': published,
-                    })
-
-            return items
+                    'title': entry['title'],
+                    'link': entry['link'],
+                    'description': entry['description'],
+                    'published': entry['published'],
+                }
+                for entry in parse_feed(xml_content, parse_date, cutoff)
+                if entry['published'] is not None
+            ]
 
         except Exception as e:
             print(f"Error parsing RSS feed: {e}")
             return []
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse various date formats"""
-        if not date_str:
-            return None
-
-        # Try various formats
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %z',  # RFC 822
-            '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601
-            '%Y-%m-%d',                   # Simple date
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except:
-                continue
-
-        # Try fromisoformat as fallback
-        try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except:
-            return datetime.utcnow()
-
     def classify_press_release(self, title: str, description: str) -> EventType:
         """Classify type of press release"""
-        text = (title + " " + description).lower()
+        hit = self.MATCHER.match(title, description)
 
-        if any(word in text for word in ['earnings', 'quarterly', 'results', 'revenue', 'profit']):
+        if hit.label == 'earnings':
             return EventType.NEWS
-        elif any(word in text for word in ['launch', 'introduces', 'announces', 'unveils', 'releases']):
-            if any(word in text for word in ['chip', 'gpu', 'product', 'platform']):
-                return EventType.PRODUCT_LAUNCH
-            else:
-                return EventType.NEWS
-        elif any(word in text for word in ['partnership', 'collaboration', 'agreement', 'deal']):
-            return EventType.PARTNERSHIP
-        elif any(word in text for word in ['acquisition', 'acquires', 'merger']):
+        elif hit.label == 'launch':
+            # Only hardware/product launches count as product launches
+            return EventType.PRODUCT_LAUNCH if 'product' in hit.labels else EventType.NEWS
+        elif hit.label in ('partnership', 'acquisition'):
             return EventType.PARTNERSHIP
         else:
             return EventType.NEWS
@@ -0,0 +1,113 @@
+"""
+Feed timestamp parser shared by the RSS/Atom sources.
+
+Each source used to try up to four strptime formats in turn (every miss
+raising and catching a ValueError), drop timezone offsets instead of
+applying them, and return utcnow() for anything it couldn't read.
+parse_date() instead:
+
+- sniffs the format from the first characters and matches one compiled
+  pattern - RFC 822 (RSS pubDate) or ISO 8601 (Atom updated/published)
+- converts every offset or zone name to UTC and returns a naive UTC
+  datetime, the convention used throughout the database
+- returns None for text it can't read, so the caller decides what an
+  undated item means
+- memoizes results in a small LRU cache (feeds repeat timestamps, and the
+  same feed is re-read every run)
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+
+# Distinct timestamp strings remembered
+CACHE_SIZE = 4096
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# RFC 822 zone names -> minutes east of UTC (unknown names are read as UTC)
+ZONES = {
+    'UT': 0, 'UTC': 0, 'GMT': 0, 'Z': 0,
+    'EST': -300, 'EDT': -240, 'CST': -360, 'CDT': -300,
+    'MST': -420, 'MDT': -360, 'PST': -480, 'PDT': -420,
+}
+
+# Fri, 16 Oct 2026 10:00:00 +0000   (weekday, seconds and zone optional)
+RFC822 = re.compile(
+    r'(?:[A-Za-z]+,?\s*)?(\d{1,2})\s+([A-Za-z]{3})[A-Za-z]*\.?\s+(\d{4}|\d{2})'
+    r'\s+(\d{1,2}):(\d{2})(?::(\d{2}))?'
+    r'\s*(?:([+-])(\d{2}):?(\d{2})|([A-Za-z]{1,5}))?\s*$'
+)
+
+# 2026-10-16T10:00:00.123-05:00   (time, fraction and offset optional)
+ISO8601 = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[Tt ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?'
+    r'\s*(?:([Zz])|([+-])(\d{2}):?(\d{2}))?\s*$'
+)
+
+
+def _offset(sign: Optional[str], hours: Optional[str], minutes: Optional[str]) -> int:
+    """Minutes east of UTC from a +HH:MM style offset"""
+    if not sign:
+        return 0
+    total = int(hours) * 60 + int(minutes)
+    return -total if sign == '-' else total
+
+
+def _from_rfc822(match) -> datetime:
+    day, month, year, hour, minute, second, sign, off_h, off_m, zone = match.groups()
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+
+    offset = ZONES.get(zone.upper(), 0) if zone else _offset(sign, off_h, off_m)
+    parsed = datetime(year, MONTHS[month.lower()], int(day), int(hour), int(minute), int(second or 0))
+    return parsed - timedelta(minutes=offset)
+
+
+def _from_iso8601(match) -> datetime:
+    year, month, day, hour, minute, second, fraction, zulu, sign, off_h, off_m = match.groups()
+    microsecond = int((fraction + '000000')[:6]) if fraction else 0
+
+    parsed = datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+                      int(second or 0), microsecond)
+    return parsed - timedelta(minutes=_offset(sign, off_h, off_m))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(text: str) -> Optional[datetime]:
+    # ISO 8601 starts YYYY-, RFC 822 with a weekday or day of month
+    patterns = ((ISO8601, _from_iso8601), (RFC822, _from_rfc822))
+    if not (text[:4].isdigit() and text[4:5] == '-'):
+        patterns = patterns[::-1]
+
+    for pattern, convert in patterns:
+        match = pattern.match(text)
+        if match:
+            try:
+                return convert(match)
+            except (KeyError, ValueError):
+                return None  # e.g. unknown month, day out of range
+    return None
+
+
+def parse_date(text: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an RSS/Atom timestamp.
+
+    Args:
+        text: RFC 822 ('Fri, 16 Oct 2026 10:00:00 -0500') or ISO 8601
+              ('2026-10-16T10:00:00Z', '2026-10-16') text
+
+    Returns:
+        Naive UTC datetime, or None if the text is empty or unreadable
+    """
+    if not text:
+        return None
+    return _parse(text.strip())
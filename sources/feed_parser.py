@@ -0,0 +1,147 @@
+"""
+Streaming RSS 2.0 / Atom parser shared by the feed sources.
+
+The sources used to build the whole document with ET.fromstring, walk every
+<item>, and walk it all again looking for Atom <entry>s when there were no
+items. parse_feed() makes one iterparse pass over the response bytes:
+
+- <item> and <entry> are recognised by local name, so RSS 2.0 and Atom (and
+  namespaced variants) come out of the same pass
+- each entry is reduced to a small dict and cleared as soon as it ends, so
+  only an empty element per entry stays in memory, not the whole document
+- feeds are normally newest-first; once STALE_RUN entries in a row are
+  older than the cutoff (and every dated entry so far has been in date
+  order), the rest of the document is not parsed
+
+Dates are parsed by the caller's parse_date; timezone-aware results are
+converted to naive UTC for the cutoff comparison. Entries without a usable
+date are kept with published = None - each source decides what that means.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Union
+
+
+# Tags (local names) that hold one feed entry
+ENTRY_TAGS = ('item', 'entry')
+
+# Child tags holding the entry's date, in order of preference
+DATE_TAGS = ('pubDate', 'updated', 'published', 'date')
+
+# Child tags holding the entry's summary, in order of preference
+DESCRIPTION_TAGS = ('description', 'summary')
+
+# Consecutive out-of-window entries that end a date-ordered feed
+STALE_RUN = 3
+
+
+# tag -> local name; feeds use a handful of tags, so this stays tiny
+_LOCAL_NAMES = {}
+
+
+def local_name(tag: str) -> str:
+    """Tag without its namespace ('{http://www.w3.org/2005/Atom}entry' -> 'entry')"""
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.rsplit('}', 1)[-1]
+    return name
+
+
+def _entry_fields(entry: ET.Element) -> dict:
+    """Text of an entry's children by local name (links keep the preferred href)"""
+    fields = {}
+    for child in entry:
+        name = local_name(child.tag)
+        if name == 'link':
+            # Atom: <link rel="alternate" href="..."/> (rel defaults to alternate)
+            # RSS:  <link>https://...</link>
+            href = child.get('href')
+            if href is None:
+                fields.setdefault('link', child.text)
+            elif child.get('rel', 'alternate') == 'alternate':
+                fields['link'] = href
+            else:
+                fields.setdefault('link', href)
+        elif name not in fields:
+            fields[name] = child.text
+    return fields
+
+
+def _first(fields: dict, names: tuple) -> Optional[str]:
+    for name in names:
+        value = fields.get(name)
+        if value:
+            return value
+    return None
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_feed(content: Union[bytes, str], parse_date: Callable[[str], Optional[datetime]],
+               cutoff: Optional[datetime] = None) -> List[dict]:
+    """
+    Parse an RSS 2.0 or Atom document into entries, newest window only.
+
+    Args:
+        content: Feed document (response.content, or text)
+        parse_date: Turns an entry's date text into a datetime (or None)
+        cutoff: Drop entries published before this (naive UTC); None keeps all
+
+    Returns:
+        List of dicts with title, link, description, published (naive UTC
+        or None) and source (RSS <source> text, or None), in feed order.
+        Entries missing a title or link are skipped.
+
+    Raises:
+        ET.ParseError: if the document is not well-formed XML
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    entries = []
+    stale = 0
+    ordered = True
+    previous = None
+
+    for _, elem in ET.iterparse(io.BytesIO(content)):
+        if local_name(elem.tag) not in ENTRY_TAGS:
+            continue
+
+        fields = _entry_fields(elem)
+        elem.clear()
+
+        title = fields.get('title')
+        link = fields.get('link')
+        if not title or not link:
+            continue
+
+        date_text = _first(fields, DATE_TAGS)
+        published = _naive_utc(parse_date(date_text)) if date_text else None
+
+        if published is not None:
+            if previous is not None and published > previous:
+                ordered = False
+            previous = published
+
+            if cutoff is not None and published < cutoff:
+                stale += 1
+                if ordered and stale >= STALE_RUN:
+                    break
+                continue
+            stale = 0
+
+        entries.append({
+            'title': title.strip(),
+            'link': link.strip(),
+            'description': _first(fields, DESCRIPTION_TAGS) or "",
+            'published': published,
+            'source': fields.get('source'),
+        })
+
+    return entries
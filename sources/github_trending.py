@@ -15,6 +15,8 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.keywords import KeywordMatcher
+from sources.seen_items import SeenItems
 
 
 class GitHubTrendingSource:
@@ -61,8 +63,22 @@ class GitHubTrendingSource:
         'apple',
     ]
 
-    def __init__(self):
-        """Initialize GitHub source"""
+    # Repo classification from name + description, in priority order
+    EVENT_KEYWORDS = [
+        (EventType.PRODUCT_LAUNCH, ['model*', 'gpt*', 'llm*', 'llama*']),
+        (EventType.RESEARCH, ['framework*', 'librar*', 'tool*']),
+    ]
+
+    MATCHER = KeywordMatcher(EVENT_KEYWORDS)
+
+    def __init__(self, seen: Optional[SeenItems] = None):
+        """
+        Initialize GitHub source.
+
+        Args:
+            seen: Skip repos already stored by earlier runs (None = fetch all)
+        """
+        self.seen = seen
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-Pulse/1.0',
@@ -134,12 +150,14 @@ class GitHubTrendingSource:
 
             cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-            for repo in repos:
-                # Check if repo has AI/ML topics
-                topics = repo.get('topics', [])
-                if not any(topic in self.AI_TOPICS for topic in topics):
-                    continue
+            # Only repos with AI/ML topics
+            repos = [repo for repo in repos
+                     if any(topic in self.AI_TOPICS for topic in repo.get('topics', []))]
 
+            # A stored repo can't be saved again, so don't ask for its release
+            repos = self._unseen(repos)
+
+            for repo in repos:
                 # Fetch latest release
                 release_url = f"{self.BASE_URL}/repos/{repo['full_name']}/releases/latest"
                 try:
@@ -165,17 +183,17 @@ class GitHubTrendingSource:
             print(f"Error fetching {org} releases: {e}")
             return []
 
+    def _unseen(self, repos: List[dict]) -> List[dict]:
+        """Drop repos whose events are already stored (one lookup)"""
+        if self.seen is None or not repos:
+            return repos
+
+        known = self.seen.known(EventSource.GITHUB, [repo['id'] for repo in repos])
+        return [repo for repo in repos if str(repo['id']) not in known]
+
     def classify_repo_type(self, repo: dict) -> EventType:
         """Classify repository significance"""
-        description = (repo.get('description') or '').lower()
-        name = repo.get('name', '').lower()
-
-        if any(word in description + name for word in ['model', 'gpt', 'llm', 'llama']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in description + name for word in ['framework', 'library', 'tool']):
-            return EventType.RESEARCH
-        else:
-            return EventType.NEWS
+        return self.MATCHER.match(repo.get('description'), repo.get('name')).label or EventType.NEWS
 
     def repo_to_event(self, repo: dict, release: Optional[dict] = None) -> Event:
         """Convert GitHub repo/release to Event object"""
@@ -243,7 +261,12 @@ class GitHubTrendingSource:
         repos = self.search_trending_repos(days_back=days_back, min_stars=min_stars)
         print(f"  Found {len(repos)} trending repositories")
 
-        for repo in repos[:10]:  # Limit to top 10
+        top = repos[:10]  # Limit to top 10
+        unseen = self._unseen(top)
+        if len(unseen) < len(top):
+            print(f"  Skipping {len(top) - len(unseen)} already stored")
+
+        for repo in unseen:
             event = self.repo_to_event(repo)
             events.append(event)
             print(f"  ✓ {event.title[:80]}")
@@ -8,14 +8,16 @@ Free, no API key required.
 """
 
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.dates import parse_date
+from sources.feed_parser import parse_feed
+from sources.keywords import NEWS_MATCHER
 
 
 class GoogleNewsSource:
@@ -70,115 +72,46 @@ class GoogleNewsSource:
             response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
-            items = self._parse_rss_feed(response.text, days_back)
+            items = self._parse_rss_feed(response.content, days_back)
             return items
 
         except Exception as e:
             print(f"Error fetching Google News for '{query}': {e}")
             return []
 
-    def _parse_rss_feed(self, xml_content: str, days_back: int) -> List[dict]:
+    def _parse_rss_feed(self, xml_content: bytes, days_back: int) -> List[dict]:
         """Parse Google News RSS feed"""
         try:
-            root = ET.fromstring(xml_content)
-
-            items = []
             cutoff = datetime.utcnow() - timedelta(days=days_back)
 
             # Google News uses RSS 2.0 format
-            for item in root.findall('.//item'):
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pubdate_elem = item.find('pubDate')
-                description_elem = item.find('description')
-                source_elem = item.find('source')
-
-                if not all([title_elem, link_elem]):
-                    continue
-
-                title = title_elem.text
-                link = link_elem.text
-                description = description_elem.text if description_elem is not None else ""
-                source_name = source_elem.text if source_elem is not None else "Google News"
-
-                # Parse date
-                published = self._parse_date(pubdate_elem.text if pubdate_elem is not None else "")
-                if not published:
-                    published = datetime.utcnow()
-
-                # Check if recent enough
-                if published < cutoff:
-                    continue
-
-                items.append({
-                    'title': title,
-                    'link': link,
-                    'description': description,
-                    'source_name': source_name,
-                    'published': published,
-                })
-
-            return items
+            return [
+                {
+                    'title': entry['title'],
+                    'link': entry['link'],
+                    'description': entry['description'],
+                    'source_name': entry['source'] or "Google News",
+                    'published': entry['published'] or datetime.utcnow(),
+                }
+                for entry in parse_feed(xml_content, parse_date, cutoff)
+            ]
 
         except Exception as e:
             print(f"Error parsing Google News RSS: {e}")
             return []
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse RFC 822 date format"""
-        if not date_str:
-            return None
-
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %z',  # RFC 822
-            '%a, %d %b %Y %H:%M:%S %Z',  # RFC 822 with timezone name
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except:
-                continue
-
-        return datetime.utcnow()
-
     def classify_article(self, title: str, description: str) -> EventType:
         """Classify article type"""
-        text = (title + " " + description).lower()
-
-        if any(word in text for word in ['funding', 'raises', 'investment', 'valuation', 'ipo']):
-            return EventType.FUNDING
-        elif any(word in text for word in ['launches', 'releases', 'unveils', 'announces new']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in text for word in ['partnership', 'collaboration', 'deal', 'acquisition']):
-            return EventType.PARTNERSHIP
-        elif any(word in text for word in ['regulation', 'policy', 'law', 'legal', 'court']):
-            return EventType.REGULATION
-        elif any(word in text for word in ['research', 'paper', 'study', 'breakthrough']):
-            return EventType.RESEARCH
-        else:
-            return EventType.NEWS
+        return NEWS_MATCHER.match(title, description).label or EventType.NEWS
 
     def extract_companies(self, title: str, description: str) -> List[str]:
         """Extract company mentions"""
-        text = title + " " + description
-        companies = []
-
-        company_names = [
-            'OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
-            'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle',
-            'Hugging Face', 'Stability AI', 'Cohere', 'Mistral',
-        ]
-
-        for company in company_names:
-            if company.lower() in text.lower():
-                companies.append(company)
-
-        return companies
+        return list(NEWS_MATCHER.match(title, description).entities)
 
     def item_to_event(self, item: dict) -> Event:
         """Convert news item to Event object"""
-        companies = self.extract_companies(item['title'], item['description'])
+        # Event type and companies from one pass over the text
+        hit = NEWS_MATCHER.match(item['title'], item['description'])
 
         event = Event(
             source=EventSource.GOOGLE_NEWS,
@@ -187,8 +120,8 @@ class GoogleNewsSource:
             title=item['title'],
             content=item['description'],
             summary=item['description'][:200] if len(item['description']) > 200 else item['description'],
-            event_type=self.classify_article(item['title'], item['description']),
-            companies=companies,
+            event_type=hit.label or EventType.NEWS,
+            companies=list(hit.entities),
             published_at=item['published'],
         )
 
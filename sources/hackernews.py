@@ -8,6 +8,9 @@ API Docs: https://github.com/HackerNews/API
 """
 
 import requests
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
@@ -15,6 +18,8 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.keywords import KeywordMatcher
+from sources.seen_items import SeenItems
 
 
 class HackerNewsSource:
@@ -23,30 +28,80 @@ class HackerNewsSource:
 
     Strategy:
     1. Get top stories IDs
-    2. Fetch details for each story
-    3. Filter for AI-related content (keywords in title)
-    4. Convert to Event objects
+    2. Drop IDs already stored or already rejected (one lookup, if seen is given)
+    3. Fetch details for each story (concurrently, bounded by max_workers)
+    4. Filter for AI-related content (keywords in title)
+    5. Convert to Event objects
+
+    Story details are one request per item, so the fetch is I/O bound.
+    With max_workers > 1 a small thread pool keeps a sliding window of
+    requests in flight; results are still consumed in top-stories order,
+    so the returned events are identical to a serial scan.
     """
 
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
 
-    # Keywords that indicate AI-related content
+    # Keywords that indicate AI-related content (whole words; * = any ending)
     AI_KEYWORDS = [
         'ai', 'artificial intelligence', 'machine learning', 'ml',
-        'gpt', 'claude', 'gemini', 'llm', 'language model',
+        'gpt*', 'claude', 'gemini', 'llm*', 'language model*',
         'openai', 'anthropic', 'google ai', 'deepmind',
-        'nvidia', 'nvda', 'gpu', 'neural', 'transformer',
-        'chatgpt', 'copilot', 'bard', 'llama',
+        'nvidia', 'nvda', 'gpu*', 'neural', 'transformer*',
+        'chatgpt', 'copilot', 'bard', 'llama*',
         'dall-e', 'midjourney', 'stable diffusion',
-        'agi', 'generative ai', 'foundation model',
+        'agi', 'generative ai', 'foundation model*',
     ]
 
-    def __init__(self):
-        """Initialize Hacker News source"""
-        self.session = requests.Session()
-        self.session.headers.update({
+    # Event type rules, in priority order
+    EVENT_KEYWORDS = [
+        (EventType.PRODUCT_LAUNCH, ['announces', 'launches', 'releases', 'unveils', 'introduces']),
+        (EventType.FUNDING, ['raises', 'funding', 'investment*', 'series', 'valuation*']),
+        (EventType.RESEARCH, ['arxiv', 'paper*', 'research*']),
+    ]
+
+    MATCHER = KeywordMatcher(EVENT_KEYWORDS, relevance=AI_KEYWORDS)
+
+    def __init__(self, max_workers: int = 8, request_timeout: float = 10,
+                 base_url: Optional[str] = None, seen: Optional[SeenItems] = None):
+        """
+        Initialize Hacker News source.
+
+        Args:
+            max_workers: Max concurrent item requests (1 = serial fetch)
+            request_timeout: Per-request timeout in seconds
+            base_url: Override API root (e.g. a local stub server for benchmarks)
+            seen: Skip stories stored or rejected by earlier runs (None = fetch all)
+        """
+        self.max_workers = max(1, max_workers)
+        self.request_timeout = request_timeout
+        self.seen = seen
+        if base_url:
+            self.BASE_URL = base_url.rstrip('/')
+
+        self.session = self._new_session()
+
+        # requests.Session is not guaranteed thread-safe, so each worker
+        # thread gets its own (connection pooling still applies per thread)
+        self._local = threading.local()
+
+    def _new_session(self) -> requests.Session:
+        """Create an HTTP session with our User-Agent"""
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'AI-Pulse/1.0 (AI sector intelligence bot)'
         })
+        return session
+
+    def _thread_session(self) -> requests.Session:
+        """Get the session for the current thread"""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
 
     def fetch_top_stories(self, limit: int = 100) -> List[int]:
         """
@@ -59,7 +114,7 @@ class HackerNewsSource:
             List of story IDs
         """
         url = f"{self.BASE_URL}/topstories.json"
-        response = self.session.get(url, timeout=10)
+        response = self.session.get(url, timeout=self.request_timeout)
         response.raise_for_status()
 
         story_ids = response.json()
@@ -77,7 +132,7 @@ class HackerNewsSource:
         """
         url = f"{self.BASE_URL}/item/{story_id}.json"
         try:
-            response = self.session.get(url, timeout=10)
+            response = self._thread_session().get(url, timeout=self.request_timeout)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -95,13 +150,7 @@ class HackerNewsSource:
         Returns:
             True if AI-related, False otherwise
         """
-        text = (title + " " + url).lower()
-
-        for keyword in self.AI_KEYWORDS:
-            if keyword in text:
-                return True
-
-        return False
+        return self.MATCHER.match(title, url).relevant
 
     def classify_event_type(self, title: str, url: str = "") -> EventType:
         """
@@ -109,16 +158,7 @@ class HackerNewsSource:
 
         This is basic heuristic matching - the agent will do better later.
         """
-        text = (title + " " + url).lower()
-
-        if any(word in text for word in ['announces', 'launches', 'releases', 'unveils', 'introduces']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in text for word in ['raises', 'funding', 'investment', 'series', 'valuation']):
-            return EventType.FUNDING
-        elif 'arxiv' in text or 'paper' in text or 'research' in text:
-            return EventType.RESEARCH
-        else:
-            return EventType.NEWS
+        return self.MATCHER.match(title, url).label or EventType.NEWS
 
     def story_to_event(self, story: dict) -> Event:
         """
@@ -159,37 +199,93 @@ class HackerNewsSource:
             top_n: Number of top stories to scan for AI content
 
         Returns:
-            List of Event objects
+            List of Event objects (in top-stories order)
         """
         print(f"Fetching top {top_n} stories from Hacker News...")
         story_ids = self.fetch_top_stories(limit=top_n)
 
+        if self.seen is not None:
+            known = self.seen.known(EventSource.HACKER_NEWS, story_ids)
+            if known:
+                story_ids = [story_id for story_id in story_ids if str(story_id) not in known]
+                print(f"Skipping {len(known)} stories seen in earlier runs")
+
         print(f"Scanning {len(story_ids)} stories for AI content...")
         ai_events = []
+        rejected = []
+
+        stories = self._iter_stories(story_ids)
+        try:
+            for story in stories:
+                if len(ai_events) >= limit:
+                    break
 
-        for story_id in story_ids:
-            if len(ai_events) >= limit:
-                break
+                if not story:
+                    continue
 
-            story = self.fetch_story(story_id)
-            if not story:
-                continue
+                # Skip jobs, polls, etc - only want stories
+                if story.get('type') != 'story':
+                    rejected.append(story.get('id'))
+                    continue
 
-            # Skip jobs, polls, etc - only want stories
-            if story.get('type') != 'story':
-                continue
+                title = story.get('title', '')
+                url = story.get('url', '')
 
-            title = story.get('title', '')
-            url = story.get('url', '')
+                if self.is_ai_related(title, url):
+                    event = self.story_to_event(story)
+                    ai_events.append(event)
+                    print(f"  ✓ Found: {title[:80]}")
+                else:
+                    rejected.append(story['id'])
+        finally:
+            stories.close()  # Cancels any outstanding requests
 
-            if self.is_ai_related(title, url):
-                event = self.story_to_event(story)
-                ai_events.append(event)
-                print(f"  ✓ Found: {title[:80]}")
+        if self.seen is not None:
+            self.seen.add(EventSource.HACKER_NEWS, [story_id for story_id in rejected if story_id])
 
         print(f"\nFound {len(ai_events)} AI-related stories")
         return ai_events
 
+    def _iter_stories(self, story_ids: List[int]):
+        """
+        Yield story details in the same order as story_ids.
+
+        Serial when max_workers is 1. Otherwise keeps at most
+        2 * max_workers requests in flight and yields them in order; when the
+        caller stops iterating (limit reached) queued requests are cancelled
+        and nothing further is submitted.
+        """
+        if self.max_workers <= 1 or len(story_ids) <= 1:
+            for story_id in story_ids:
+                yield self.fetch_story(story_id)
+            return
+
+        window = self.max_workers * 2
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix='hn-fetch')
+        pending = deque()
+        ids = iter(story_ids)
+
+        try:
+            for story_id in ids:
+                pending.append(executor.submit(self.fetch_story, story_id))
+                if len(pending) >= window:
+                    break
+
+            while pending:
+                story = pending.popleft().result()
+
+                next_id = next(ids, None)
+                if next_id is not None:
+                    pending.append(executor.submit(self.fetch_story, next_id))
+
+                yield story
+        finally:
+            # Early exit: drop queued requests, don't wait for in-flight ones
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
 
 # Test the source
 if __name__ == "__main__":
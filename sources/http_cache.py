@@ -0,0 +1,213 @@
+"""
+Conditional-GET cache for RSS/Atom feed requests.
+
+Tech RSS, Company IR, ArXiv and SEC EDGAR poll the same feeds every run,
+and most of the time nothing has changed. HTTPCache keeps each feed's
+validators (ETag, Last-Modified) and last body in a small SQLite file and
+sends them back as If-None-Match / If-Modified-Since:
+
+- 304 Not Modified: no body is transferred and the caller skips parsing
+  (everything in the feed was handled on the previous fetch)
+- 200 with the same body as last time (servers that send no validators):
+  also reported unchanged, so parsing is skipped
+- 200 with a new body: returned, with its validators and body held as
+  pending until the caller confirms the items it parsed were stored
+
+An unchanged feed yields nothing, so a new body must not be remembered
+before its items are saved. take() hands a source's pending entries back
+to the caller and confirm() writes them once the source's events are
+stored; entries that are never confirmed (the source failed, missed its
+deadline, or the save raised) are dropped, and the next run still sees the
+feed as changed and parses it again.
+
+Hits, misses and bytes saved are counted per source, so the collector can
+report them. Safe to share between the collector's source threads.
+"""
+
+import threading
+from datetime import datetime
+from typing import Optional
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+import requests
+
+from storage.connection import close_connection, connect
+
+
+class HTTPCache:
+    """
+    Validator + body store for conditional GETs.
+
+    Usage:
+        cache = HTTPCache()
+        response = cache.get(session, url, 'tech_rss', timeout=10)
+        if response is None:
+            ...  # unchanged since the last fetch
+        feeds = cache.take('tech_rss')   # after the source's fetch
+        ...store the events...
+        cache.confirm(feeds)
+    """
+
+    def __init__(self, db_path: str = "http_cache.db"):
+        """
+        Args:
+            db_path: Path to the cache database
+        """
+        self.db_path = db_path
+        self.counters = {}
+        self._pending = {}   # source -> {url key: (etag, last_modified, body, fetched_at)}
+
+        self._lock = threading.Lock()
+        self.conn = connect(db_path, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create cache schema if it doesn't exist"""
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS feeds (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    checked_at TEXT NOT NULL
+                )
+            """)
+            self.conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """Full request URL (query string included) identifying a feed"""
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def get(self, session: requests.Session, url: str, source: str,
+            params: Optional[dict] = None, **kwargs) -> Optional[requests.Response]:
+        """
+        Fetch a feed unless it is unchanged since the last fetch.
+
+        Args:
+            session: Session to send the request with (keeps the source's headers)
+            url: Feed URL
+            source: Source name the request is counted under
+            params: Query parameters
+            **kwargs: Passed through to session.get (e.g. timeout)
+
+        Returns:
+            The response if the feed changed (or is new), None if unchanged.
+            A changed feed is only remembered once confirmed (see take()).
+
+        Raises:
+            requests.RequestException: on network errors and error statuses
+        """
+        key = self.make_key(url, params)
+
+        with self._lock:
+            cached = self.conn.execute("""
+                SELECT etag, last_modified, body FROM feeds WHERE url = ?
+            """, (key,)).fetchone()
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = session.get(url, params=params, headers=headers, **kwargs)
+        now = datetime.utcnow().isoformat()
+
+        if response.status_code == 304 and cached:
+            with self._lock:
+                self._count(source, 'hits', saved=len(cached[2]))
+                self.conn.execute("UPDATE feeds SET checked_at = ? WHERE url = ?", (now, key))
+                self.conn.commit()
+            return None
+
+        response.raise_for_status()
+
+        body = response.content
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        unchanged = cached is not None and cached[2] == body
+
+        with self._lock:
+            self._count(source, 'unchanged' if unchanged else 'misses')
+            if unchanged:
+                # Same body as the stored (confirmed) one - its items are saved
+                self.conn.execute("""
+                    UPDATE feeds SET etag = ?, last_modified = ?, checked_at = ? WHERE url = ?
+                """, (etag, last_modified, now, key))
+                self.conn.commit()
+                return None
+
+            self._pending.setdefault(source, {})[key] = (etag, last_modified, body, now)
+
+        return response
+
+    def take(self, source: str) -> dict:
+        """
+        Remove and return a source's unconfirmed feeds.
+
+        Call from the thread that ran the source's fetch, once it returns
+        (or raises), and pass the result to confirm() after its events are
+        stored - feeds from a fetch whose results were thrown away are
+        simply never confirmed.
+
+        Returns:
+            {url key: (etag, last_modified, body, fetched_at)}
+        """
+        with self._lock:
+            return self._pending.pop(source, {})
+
+    def confirm(self, feeds: dict):
+        """Remember feeds returned by take() - their items have been stored"""
+        if not feeds:
+            return
+
+        with self._lock:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO feeds (url, etag, last_modified, body, fetched_at, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(key, etag, last_modified, body, fetched_at, fetched_at)
+                  for key, (etag, last_modified, body, fetched_at) in feeds.items()])
+            self.conn.commit()
+
+    def _count(self, source: str, outcome: str, saved: int = 0):
+        """Record one request's outcome for a source (lock held)"""
+        counters = self.counters.setdefault(
+            source, {'hits': 0, 'unchanged': 0, 'misses': 0, 'bytes_saved': 0}
+        )
+        counters[outcome] += 1
+        counters['bytes_saved'] += saved
+
+    def stats(self) -> dict:
+        """Per-source counts for this process: hits (304), unchanged, misses, bytes_saved"""
+        with self._lock:
+            return {source: dict(counters) for source, counters in self.counters.items()}
+
+    def close(self):
+        """Close database connection"""
+        close_connection(self.conn)
+
+
+def fetch_feed(session: requests.Session, url: str, cache: Optional[HTTPCache] = None,
+               source: str = '', **kwargs) -> Optional[requests.Response]:
+    """
+    GET a feed through the cache when there is one.
+
+    Returns:
+        The response, or None if the cache found the feed unchanged
+
+    Raises:
+        requests.RequestException: on network errors and error statuses
+    """
+    if cache is not None:
+        return cache.get(session, url, source, **kwargs)
+
+    response = session.get(url, **kwargs)
+    response.raise_for_status()
+    return response
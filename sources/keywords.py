@@ -0,0 +1,196 @@
+"""
+Compiled keyword matching for source relevance filters and classifiers.
+
+Sources used to test keywords with `word in text.lower()` - one substring
+scan per keyword, per rule, per item - and substrings match inside other
+words: 'ai' in "said", 'intel' in "intelligence", 'meta' in "metadata",
+'law' in "flaw". KeywordMatcher compiles all of a source's keywords into
+one regular expression and makes a single pass over the text:
+
+- keywords match whole words (case-insensitive); a trailing '*' matches
+  any ending ('launch*' -> launch, launches, launched)
+- spaces in a keyword match any run of whitespace
+- relevance keywords decide whether an item is on-topic at all (Hacker
+  News' AI filter)
+- group keywords carry a label (an EventType, 'earnings', ...); the first
+  group hit in declaration order is the old if/elif classifier result
+- entity keywords are names (companies) reported when mentioned
+- match() answers all three in one pass
+
+The pattern is laid out as a trie of the keywords (shared prefixes written
+once), so the regex engine checks one character set per text position
+rather than every keyword in turn. Each distinct matched string is resolved to
+its keywords once and remembered, including keywords nested inside it
+('stability ai' also hits 'ai'); results are shared per combination of hits.
+"""
+
+import re
+from typing import FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import EventType
+
+
+# Cap on remembered matched strings / results per matcher
+MAX_CACHED = 10000
+
+
+class KeywordMatch(NamedTuple):
+    """Result of one KeywordMatcher.match pass"""
+    relevant: bool              # Any relevance keyword hit
+    labels: FrozenSet           # Labels of every group with a hit
+    label: Optional[object]     # First group (in declaration order) with a hit
+    entities: List[str]         # Entities mentioned, in declaration order
+
+
+class KeywordMatcher:
+    """
+    One compiled pattern for a source's keyword groups and entities.
+
+    Usage:
+        matcher = KeywordMatcher(groups=[(EventType.FUNDING, ['raises', 'funding'])],
+                                 entities=['OpenAI', 'NVIDIA'])
+        hit = matcher.match(title, description)
+        hit.label or EventType.NEWS, hit.entities
+    """
+
+    def __init__(self, groups: Sequence[Tuple[object, Sequence[str]]] = (),
+                 entities: Sequence[str] = (), relevance: Sequence[str] = ()):
+        """
+        Args:
+            groups: (label, keywords) pairs, in priority order
+            entities: Names to report when mentioned (matched as keywords)
+            relevance: Keywords that make an item relevant
+        """
+        self.groups = [label for label, _ in groups]
+        self.entities = list(entities)
+
+        # keyword -> [('group', index) | ('entity', index)]; relevance is
+        # one more group bit, after the labelled ones
+        self._relevant_bit = 1 << len(self.groups)
+        targets = {}
+        for index, (_, keywords) in enumerate(list(groups) + [(None, relevance)]):
+            for keyword in keywords:
+                targets.setdefault(' '.join(keyword.lower().split()), []).append(('group', index))
+        for index, name in enumerate(self.entities):
+            targets.setdefault(' '.join(name.lower().split()), []).append(('entity', index))
+
+        self._keywords = [(re.compile(self._keyword_pattern(keyword)), hits)
+                          for keyword, hits in targets.items()]
+        self._found = {}      # matched string -> (group bits, entity bits)
+        self._results = {}    # (group bits, entity bits) -> KeywordMatch
+
+        trie = {}
+        for keyword in targets:
+            node = trie
+            for char in keyword.rstrip('*'):
+                node = node.setdefault(char, {})
+            node['*' if keyword.endswith('*') else ''] = True
+        self.pattern = re.compile(r'\b' + self._trie_pattern(trie, '')) if targets else None
+
+    @staticmethod
+    def _keyword_pattern(keyword: str) -> str:
+        """Regex for one keyword on its own"""
+        prefix = keyword.endswith('*')
+        word = keyword.rstrip('*')
+        pattern = r'\s+'.join(re.escape(part) for part in word.split())
+        if re.match(r'\w', word):
+            pattern = r'\b' + pattern
+        if prefix:
+            pattern += r'\w*'
+        elif re.search(r'\w$', word):
+            pattern += r'\b'
+        return pattern
+
+    @classmethod
+    def _trie_pattern(cls, node: dict, last: str) -> str:
+        """Regex matching every keyword in a trie node (longest alternatives first)"""
+        branches = []
+        for char in sorted(c for c in node if len(c) == 1 and c != '*'):
+            step = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(step + cls._trie_pattern(node[char], char))
+        if '*' in node:
+            branches.append(r'\w*')
+        elif '' in node:
+            branches.append(r'\b' if re.match(r'\w', last) else '')
+
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    def _bits(self, found: str) -> Tuple[int, int]:
+        """Group and entity bitmasks for one matched string (cached)"""
+        groups = entities = 0
+        for pattern, targets in self._keywords:
+            if pattern.search(found):
+                for kind, index in targets:
+                    if kind == 'group':
+                        groups |= 1 << index
+                    else:
+                        entities |= 1 << index
+
+        if len(self._found) < MAX_CACHED:
+            self._found[found] = (groups, entities)
+        return groups, entities
+
+    def _result(self, groups: int, entities: int) -> KeywordMatch:
+        """KeywordMatch for group/entity bitmasks (cached)"""
+        result = self._results.get((groups, entities))
+        if result is None:
+            hit_groups = [label for i, label in enumerate(self.groups) if groups >> i & 1]
+            result = KeywordMatch(
+                relevant=bool(groups & self._relevant_bit),
+                labels=frozenset(hit_groups),
+                label=hit_groups[0] if hit_groups else None,
+                entities=[name for i, name in enumerate(self.entities) if entities >> i & 1],
+            )
+            if len(self._results) < MAX_CACHED:
+                self._results[(groups, entities)] = result
+        return result
+
+    def match(self, *texts: Optional[str]) -> KeywordMatch:
+        """
+        Find every keyword group and entity mentioned in the texts.
+
+        Args:
+            *texts: Text fields to search (None is skipped), e.g. title and description
+
+        Returns:
+            KeywordMatch with relevance, all labels, the first label and the entities hit.
+            Results are shared between calls - copy entities before changing it.
+        """
+        text = ' '.join(filter(None, texts)).lower()
+        if not text or self.pattern is None:
+            return self._result(0, 0)
+
+        groups = entities = 0
+        cached = self._found
+        for found in self.pattern.findall(text):
+            bits = cached.get(found) or self._bits(found)
+            groups |= bits[0]
+            entities |= bits[1]
+
+        result = self._results.get((groups, entities))
+        return result if result is not None else self._result(groups, entities)
+
+
+# Companies tagged on news events (Tech RSS, Google News, Bing News)
+COMPANY_NAMES = [
+    'OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
+    'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle',
+    'Hugging Face', 'Stability AI', 'Cohere', 'Mistral',
+]
+
+# News article classification, in priority order (Tech RSS, Google News, Bing News)
+NEWS_EVENT_KEYWORDS = [
+    (EventType.FUNDING, ['funding', 'raises', 'investment*', 'valuation*', 'ipo*']),
+    (EventType.PRODUCT_LAUNCH, ['launches', 'releases', 'unveils', 'announces new']),
+    (EventType.PARTNERSHIP, ['partnership*', 'collaboration*', 'deal*', 'acquisition*']),
+    (EventType.REGULATION, ['regulation*', 'policy', 'policies', 'law', 'laws', 'lawsuit*',
+                            'legal', 'court*']),
+    (EventType.RESEARCH, ['research*', 'paper*', 'study', 'studies', 'breakthrough*']),
+]
+
+NEWS_MATCHER = KeywordMatcher(NEWS_EVENT_KEYWORDS, entities=COMPANY_NAMES)
@@ -16,6 +16,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.keywords import KeywordMatcher
 
 
 class NewsAPISource:
@@ -39,6 +40,17 @@ class NewsAPISource:
         '"machine learning" AND (startup OR investment)',
     ]
 
+    # Event type rules, in priority order (whole words; * = any ending)
+    EVENT_KEYWORDS = [
+        (EventType.PRODUCT_LAUNCH, ['announces', 'launches', 'releases', 'unveils', 'introduces', 'debuts']),
+        (EventType.FUNDING, ['raises', 'funding', 'investment*', 'series', 'valuation*', 'ipo*']),
+        (EventType.PARTNERSHIP, ['partners', 'partnership*', 'acquisition*', 'acquires', 'merger*']),
+        (EventType.REGULATION, ['regulation*', 'regulatory', 'policy', 'policies', 'law', 'laws',
+                                'legislation']),
+    ]
+
+    MATCHER = KeywordMatcher(EVENT_KEYWORDS)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize NewsAPI source.
@@ -114,18 +126,7 @@ class NewsAPISource:
 
     def classify_event_type(self, title: str, description: str = "") -> EventType:
         """Classify event type from article content"""
-        text = ((title or '') + " " + (description or '')).lower()
-
-        if any(word in text for word in ['announces', 'launches', 'releases', 'unveils', 'introduces', 'debuts']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in text for word in ['raises', 'funding', 'investment', 'series', 'valuation', 'ipo']):
-            return EventType.FUNDING
-        elif any(word in text for word in ['partners', 'partnership', 'acquisition', 'acquires', 'merger']):
-            return EventType.PARTNERSHIP
-        elif any(word in text for word in ['regulation', 'regulatory', 'policy', 'law', 'legislation']):
-            return EventType.REGULATION
-        else:
-            return EventType.NEWS
+        return self.MATCHER.match(title, description).label or EventType.NEWS
 
     def article_to_event(self, article: dict) -> Event:
         """
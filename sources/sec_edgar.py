@@ -9,7 +9,6 @@ This catches major news before it's widely reported.
 """
 
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Optional
 import sys
@@ -17,6 +16,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.dates import parse_date
+from sources.feed_parser import parse_feed
+from sources.http_cache import HTTPCache, fetch_feed
+from sources.keywords import KeywordMatcher
 
 
 class SECEdgarSource:
@@ -54,8 +57,21 @@ class SECEdgarSource:
         'SC 13D': 'Major ownership change (>5%)',
     }
 
-    def __init__(self):
-        """Initialize SEC EDGAR source"""
+    # Filing classification (everything else is news)
+    EVENT_KEYWORDS = [
+        (EventType.PARTNERSHIP, ['acquisition*', 'merger*', 'agreement*']),
+    ]
+
+    MATCHER = KeywordMatcher(EVENT_KEYWORDS)
+
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        """
+        Initialize SEC EDGAR source.
+
+        Args:
+            cache: Conditional-GET cache (unchanged feeds are skipped)
+        """
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-Pulse mat.edwards@example.com',  # SEC requires user agent
@@ -91,11 +107,13 @@ class SECEdgarSource:
         }
 
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = fetch_feed(self.session, url, self.cache, 'sec_edgar',
+                                  params=params, timeout=10)
+            if response is None:
+                return []  # Unchanged since the last fetch
 
             # Parse Atom/RSS feed
-            filings = self._parse_atom_feed(response.text, company, days_back)
+            filings = self._parse_atom_feed(response.content, company, days_back)
 
             return filings
 
@@ -103,52 +121,23 @@ class SECEdgarSource:
             print(f"Error fetching {company} filings: {e}")
             return []
 
-    def _parse_atom_feed(self, xml_content: str, company: str, days_back: int) -> List[dict]:
+    def _parse_atom_feed(self, xml_content: bytes, company: str, days_back: int) -> List[dict]:
         """Parse SEC Atom feed"""
         try:
-            root = ET.fromstring(xml_content)
-
-            # Namespace handling
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-            filings = []
             cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-            for entry in root.findall('atom:entry', ns):
-                # Extract filing info
-                title_elem = entry.find('atom:title', ns)
-                link_elem = entry.find('atom:link', ns)
-                updated_elem = entry.find('atom:updated', ns)
-                summary_elem = entry.find('atom:summary', ns)
-
-                if not all([title_elem, link_elem, updated_elem]):
-                    continue
-
-                title = title_elem.text
-                link = link_elem.get('href')
-                updated_str = updated_elem.text
-                summary = summary_elem.text if summary_elem is not None else ""
-
-                # Parse date
-                try:
-                    # Format: 2025-11-11T16:30:00-05:00
-                    updated = datetime.fromisoformat(updated_str.replace('Z', '+00:00'))
-                except:
-                    updated = datetime.utcnow()
-
-                # Filter by date
-                if updated < cutoff:
-                    continue
-
-                filings.append({
+            # Entries without an <updated> date are skipped
+            return [
+                {
                     'company': company,
-                    'title': title,
-                    'link': link,
-                    'updated': updated,
-                    'summary': summary,
-                })
-
-            return filings
+                    'title': entry['title'],
+                    'link': entry['link'],
+                    'updated': entry['published'],
+                    'summary': entry['description'],
+                }
+                for entry in parse_feed(xml_content, parse_date, cutoff)
+                if entry['published'] is not None
+            ]
 
         except Exception as e:
             print(f"Error parsing Atom feed: {e}")
@@ -156,16 +145,8 @@ class SECEdgarSource:
 
     def classify_filing_significance(self, title: str, summary: str) -> EventType:
         """Classify filing type based on content"""
-        text = (title + " " + summary).lower()
-
-        if 'acquisition' in text or 'merger' in text or 'agreement' in text:
-            return EventType.PARTNERSHIP
-        elif 'result' in text or 'earnings' in text or 'financial' in text:
-            return EventType.NEWS
-        elif any(word in text for word in ['appoint', 'resign', 'executive', 'officer']):
-            return EventType.NEWS
-        else:
-            return EventType.NEWS
+        # Results, earnings and officer changes are plain news
+        return self.MATCHER.match(title, summary).label or EventType.NEWS
 
     def filing_to_event(self, filing: dict, filing_type: str) -> Event:
         """Convert SEC filing to Event object"""
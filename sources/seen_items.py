@@ -0,0 +1,159 @@
+"""
+Seen-item lookup for incremental Hacker News and GitHub fetches.
+
+Hacker News and GitHub list their items first (top-story IDs, an org's
+repos) and then make one request per item. Most of those items were
+already handled by an earlier run:
+
+- stored: already in `events` under (source, source_id), or archived (in
+  `archived_ids`) - fetching it again would only be dropped on insert
+- rejected: fetched and turned down (a Hacker News story that isn't about
+  AI, or isn't a story at all)
+
+SeenItems answers both with one bulk query per listing, so the source only
+requests items it has never seen and an immediate rerun makes almost no
+item requests. Rejections are kept in seen_items.db for `window_days` and
+then checked again; stored events are looked up in the events database,
+which is attached but never written to from here.
+
+Skips are counted per source, so the collector can report them. Safe to
+share between the collector's source threads.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, Set
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import EventSource
+from storage.connection import close_connection, connect
+
+
+# IDs per lookup query (each is bound twice; SQLite's default limit is 999)
+CHUNK_SIZE = 400
+
+
+class SeenItems:
+    """
+    Known-ID store for sources that fetch items one by one.
+
+    Usage:
+        seen = SeenItems(events_db_path='ai_pulse.db')
+        known = seen.known(EventSource.HACKER_NEWS, story_ids)
+        ...  # fetch the others
+        seen.add(EventSource.HACKER_NEWS, rejected_ids)
+    """
+
+    def __init__(self, db_path: str = "seen_items.db", events_db_path: str = "ai_pulse.db",
+                 window_days: int = 7):
+        """
+        Args:
+            db_path: Path to the seen-items database
+            events_db_path: Events database to look stored items up in
+            window_days: Days a rejected item is skipped before it is checked again
+        """
+        self.db_path = db_path
+        self.window_days = window_days
+        self.counters = {}
+
+        self._lock = threading.Lock()
+        self.conn = connect(db_path, check_same_thread=False)
+        self._create_tables()
+
+        # Without an events table only rejections are remembered
+        self._has_events = self._has_archived = False
+        if Path(events_db_path).exists():
+            self.conn.execute("ATTACH DATABASE ? AS stored", (events_db_path,))
+            tables = {row[0] for row in self.conn.execute("""
+                SELECT name FROM stored.sqlite_master
+                WHERE type = 'table' AND name IN ('events', 'archived_ids')
+            """)}
+            self._has_events = 'events' in tables
+            # Keys of events moved to the archive (storage/archive.py)
+            self._has_archived = 'archived_ids' in tables
+
+    def _create_tables(self):
+        """Create schema if it doesn't exist, and drop expired rejections"""
+        cutoff = (datetime.utcnow() - timedelta(days=self.window_days)).isoformat()
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS rejected (
+                    source TEXT NOT NULL,
+                    source_id TEXT NOT NULL,
+                    checked_at TEXT NOT NULL,
+                    PRIMARY KEY (source, source_id)
+                )
+            """)
+            self.conn.execute("DELETE FROM rejected WHERE checked_at < ?", (cutoff,))
+            self.conn.commit()
+
+    def known(self, source: EventSource, source_ids: Iterable[str]) -> Set[str]:
+        """
+        IDs among source_ids that are already stored or were recently rejected.
+
+        Args:
+            source: Source the IDs belong to
+            source_ids: Candidate item IDs (as stored in events.source_id)
+
+        Returns:
+            The subset to skip
+        """
+        source_ids = list(dict.fromkeys(str(source_id) for source_id in source_ids))
+        known = set()
+
+        with self._lock:
+            for start in range(0, len(source_ids), CHUNK_SIZE):
+                chunk = source_ids[start:start + CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                query = f"SELECT source_id FROM rejected WHERE source = ? AND source_id IN ({placeholders})"
+                params = [source.value] + chunk
+                if self._has_events:
+                    query += (f" UNION SELECT source_id FROM stored.events"
+                              f" WHERE source = ? AND source_id IN ({placeholders})")
+                    params += [source.value] + chunk
+                if self._has_archived:
+                    query += (f" UNION SELECT source_id FROM stored.archived_ids"
+                              f" WHERE source = ? AND source_id IN ({placeholders})")
+                    params += [source.value] + chunk
+                known.update(row[0] for row in self.conn.execute(query, params))
+
+            self._count(source, skipped=len(known))
+
+        return known
+
+    def add(self, source: EventSource, source_ids: Iterable[str]):
+        """
+        Remember items that were fetched and rejected, so later runs skip them.
+
+        Args:
+            source: Source the IDs belong to
+            source_ids: Rejected item IDs
+        """
+        now = datetime.utcnow().isoformat()
+        rows = [(source.value, str(source_id), now) for source_id in source_ids]
+        if not rows:
+            return
+
+        with self._lock:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO rejected (source, source_id, checked_at) VALUES (?, ?, ?)
+            """, rows)
+            self.conn.commit()
+            self._count(source, rejected=len(rows))
+
+    def _count(self, source: EventSource, skipped: int = 0, rejected: int = 0):
+        """Record skips/rejections for a source (lock held)"""
+        counters = self.counters.setdefault(source.value, {'skipped': 0, 'rejected': 0})
+        counters['skipped'] += skipped
+        counters['rejected'] += rejected
+
+    def stats(self) -> dict:
+        """Per-source counts for this process: skipped (known) and rejected (newly recorded)"""
+        with self._lock:
+            return {source: dict(counters) for source, counters in self.counters.items()}
+
+    def close(self):
+        """Close database connection"""
+        close_connection(self.conn)
@@ -8,7 +8,6 @@ Free, no API key required.
 """
 
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Optional
 import sys
@@ -16,6 +15,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.events import Event, EventSource, EventType
+from sources.dates import parse_date
+from sources.feed_parser import parse_feed
+from sources.http_cache import HTTPCache, fetch_feed
+from sources.keywords import NEWS_MATCHER
 
 
 class TechRSSSource:
@@ -38,8 +41,14 @@ class TechRSSSource:
         'Reuters AI (via Google News)': 'https://news.google.com/rss/search?q=when:24h+allinurl:reuters.com+(AI+OR+artificial+intelligence+OR+machine+learning+OR+nvidia+OR+openai+OR+anthropic+OR+deepmind+OR+microsoft+OR+google)&ceid=US:en&hl=en-US&gl=US',
     }
 
-    def __init__(self):
-        """Initialize Tech RSS source"""
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        """
+        Initialize Tech RSS source.
+
+        Args:
+            cache: Conditional-GET cache (unchanged feeds are skipped)
+        """
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-Pulse/1.0 Investment Research',
@@ -58,165 +67,49 @@ class TechRSSSource:
             List of news items
         """
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            response = fetch_feed(self.session, url, self.cache, 'tech_rss', timeout=10)
+            if response is None:
+                return []  # Unchanged since the last fetch
 
-            items = self._parse_rss_feed(response.text, feed_name, days_back)
+            items = self._parse_rss_feed(response.content, feed_name, days_back)
             return items
 
         except Exception as e:
             print(f"Error fetching {feed_name}: {e}")
             return []
 
-    def _parse_rss_feed(self, xml_content: str, feed_name: str, days_back: int) -> List[dict]:
+    def _parse_rss_feed(self, xml_content: bytes, feed_name: str, days_back: int) -> List[dict]:
         """Parse RSS feed (supports RSS 2.0 and Atom)"""
         try:
-            root = ET.fromstring(xml_content)
-
-            items = []
-            # Use naive datetime for comparison (strip timezone from parsed dates)
             cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-            # Try RSS 2.0 format first
-            for item in root.findall('.//item'):
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pubdate_elem = item.find('pubDate')
-                description_elem = item.find('description')
-
-                # Note: use 'is not None' instead of truthiness check because
-                # XML Element objects evaluate to False if they have no children
-                if title_elem is None or link_elem is None:
-                    continue
-
-                title = title_elem.text
-                link = link_elem.text
-                description = description_elem.text if description_elem is not None else ""
-
-                # Parse date
-                published = self._parse_date(pubdate_elem.text if pubdate_elem is not None else "")
-                if not published:
-                    published = datetime.utcnow()
-
-                # Check if recent enough
-                if published < cutoff:
-                    continue
-
-                items.append({
-                    'title': title,
-                    'link': link,
-                    'description': description,
+            return [
+                {
+                    'title': entry['title'],
+                    'link': entry['link'],
+                    'description': entry['description'],
                     'feed_name': feed_name,
-                    'published': published,
-                })
-
-            # If no items, try Atom format
-            if not items:
-                ns = {'atom': 'http://www.w3.org/2005/Atom'}
-                for entry in root.findall('atom:entry', ns):
-                    title_elem = entry.find('atom:title', ns)
-                    link_elem = entry.find('atom:link', ns)
-                    updated_elem = entry.find('atom:updated', ns)
-                    summary_elem = entry.find('atom:summary', ns)
-
-                    # Note: use 'is not None' instead of truthiness check
-                    if title_elem is None or link_elem is None:
-                        continue
-
-                    title = title_elem.text
-                    link = link_elem.get('href')
-                    description = summary_elem.text if summary_elem is not None else ""
-
-                    published = self._parse_date(updated_elem.text if updated_elem is not None else "")
-                    if not published:
-                        published = datetime.utcnow()
-
-                    # Check if recent enough
-                    if published < cutoff:
-                        continue
-
-                    items.append({
-                        'title': title,
-                        'link': link,
-                        'description': description,
-                        'feed_name': feed_name,
-                        'published': published,
-                    })
-
-            return items
+                    'published': entry['published'] or datetime.utcnow(),
+                }
+                for entry in parse_feed(xml_content, parse_date, cutoff)
+            ]
 
         except Exception as e:
             print(f"Error parsing RSS feed {feed_name}: {e}")
             return []
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse various date formats, returning naive UTC datetime"""
-        if not date_str:
-            return None
-
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %z',  # RFC 822
-            '%a, %d %b %Y %H:%M:%S %Z',  # RFC 822 with timezone name
-            '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601
-            '%Y-%m-%d',                   # Simple date
-        ]
-
-        for fmt in formats:
-            try:
-                parsed = datetime.strptime(date_str.strip(), fmt)
-                # Convert to naive UTC datetime for consistent comparison
-                if parsed.tzinfo is not None:
-                    parsed = parsed.replace(tzinfo=None)
-                return parsed
-            except:
-                continue
-
-        # Try fromisoformat as fallback
-        try:
-            parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            if parsed.tzinfo is not None:
-                parsed = parsed.replace(tzinfo=None)
-            return parsed
-        except:
-            return datetime.utcnow()
-
     def classify_article(self, title: str, description: str) -> EventType:
         """Classify article type"""
-        text = (title + " " + description).lower()
-
-        if any(word in text for word in ['funding', 'raises', 'investment', 'valuation', 'ipo']):
-            return EventType.FUNDING
-        elif any(word in text for word in ['launches', 'releases', 'unveils', 'announces new']):
-            return EventType.PRODUCT_LAUNCH
-        elif any(word in text for word in ['partnership', 'collaboration', 'deal', 'acquisition']):
-            return EventType.PARTNERSHIP
-        elif any(word in text for word in ['regulation', 'policy', 'law', 'legal', 'court']):
-            return EventType.REGULATION
-        elif any(word in text for word in ['research', 'paper', 'study', 'breakthrough']):
-            return EventType.RESEARCH
-        else:
-            return EventType.NEWS
+        return NEWS_MATCHER.match(title, description).label or EventType.NEWS
 
     def extract_companies(self, title: str, description: str) -> List[str]:
         """Extract company mentions"""
-        text = title + " " + description
-        companies = []
-
-        company_names = [
-            'OpenAI', 'Anthropic', 'Google', 'Microsoft', 'Meta', 'Amazon',
-            'NVIDIA', 'AMD', 'Intel', 'Apple', 'Tesla', 'Oracle',
-            'Hugging Face', 'Stability AI', 'Cohere', 'Mistral',
-        ]
-
-        for company in company_names:
-            if company.lower() in text.lower():
-                companies.append(company)
-
-        return companies
+        return list(NEWS_MATCHER.match(title, description).entities)
 
     def item_to_event(self, item: dict) -> Event:
         """Convert RSS item to Event object"""
-        companies = self.extract_companies(item['title'], item['description'])
+        # Event type and companies from one pass over the text
+        hit = NEWS_MATCHER.match(item['title'], item['description'])
 
         event = Event(
             source=EventSource.TECH_RSS,
@@ -225,8 +118,8 @@ class TechRSSSource:
             title=item['title'],
             content=item['description'],
             summary=item['description'][:200] if len(item['description']) > 200 else item['description'],
-            event_type=self.classify_article(item['title'], item['description']),
-            companies=companies,
+            event_type=hit.label or EventType.NEWS,
+            companies=list(hit.entities),
             published_at=item['published'],
         )
 
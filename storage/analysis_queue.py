@@ -0,0 +1,180 @@
+"""
+Work queue of events waiting for significance analysis.
+
+The analyzer and semantic deduplicator used to find their backlog with
+"significance_score IS NULL AND not a duplicate" over the whole events
+table, which gets slower as history grows. analysis_queue holds just the
+backlog - one row per pending event - and triggers on events keep it exact
+however events are written:
+
+- a new event that isn't analyzed or a duplicate is queued
+- setting a score or a duplicate flag removes it (clearing them re-queues it)
+- deleting the event removes it
+
+Workers claim rows with a lease. A claim is made inside one write
+transaction, so two analyzer processes never get the same event, and a
+worker that dies just lets its lease expire.
+"""
+
+import os
+import socket
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+
+# Condition for an events row (new.*) to be in the queue
+_PENDING = """new.significance_score IS NULL
+              AND COALESCE(new.is_duplicate, 0) = 0
+              AND COALESCE(new.is_semantic_duplicate, 0) = 0"""
+
+
+def default_worker_id() -> str:
+    """Identifies this process in claimed_by"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class AnalysisQueue:
+    """
+    Lease-based queue over events that still need analysis.
+
+    Lives in the events database and shares its connection.
+
+    Usage:
+        queue = AnalysisQueue(db.conn)
+        event_ids = queue.claim(20)
+        ... analyze, db.update_event_analysis(...) ...   # dequeues via trigger
+        queue.release(event_ids)                         # give back the rest
+    """
+
+    def __init__(self, conn: sqlite3.Connection, lease_minutes: float = 15,
+                 worker_id: Optional[str] = None):
+        """
+        Args:
+            conn: Connection to the events database
+            lease_minutes: How long a claim lasts before others may take it
+            worker_id: Recorded on claimed rows (default: host:pid)
+        """
+        self.conn = conn
+        self.lease = timedelta(minutes=lease_minutes)
+        self.worker_id = worker_id or default_worker_id()
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create queue schema and sync triggers, filling the queue the first time"""
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analysis_queue'
+        """)
+        exists = cursor.fetchone() is not None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_queue (
+                event_id INTEGER PRIMARY KEY,
+                collected_at TEXT NOT NULL,
+                claimed_by TEXT,
+                lease_until TEXT
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_queue_lease
+            ON analysis_queue(lease_until, collected_at DESC)
+        """)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS analysis_queue_insert AFTER INSERT ON events
+            WHEN {_PENDING}
+            BEGIN
+                INSERT OR IGNORE INTO analysis_queue (event_id, collected_at)
+                VALUES (new.id, new.collected_at);
+            END
+        """)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS analysis_queue_update
+            AFTER UPDATE OF significance_score, is_duplicate, is_semantic_duplicate ON events
+            BEGIN
+                DELETE FROM analysis_queue WHERE event_id = new.id AND NOT ({_PENDING});
+                INSERT OR IGNORE INTO analysis_queue (event_id, collected_at)
+                SELECT new.id, new.collected_at WHERE {_PENDING};
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS analysis_queue_delete AFTER DELETE ON events
+            BEGIN
+                DELETE FROM analysis_queue WHERE event_id = old.id;
+            END
+        """)
+
+        if not exists:
+            # Queue the backlog that built up before the queue existed
+            cursor.execute("""
+                INSERT OR IGNORE INTO analysis_queue (event_id, collected_at)
+                SELECT id, collected_at FROM events
+                WHERE significance_score IS NULL
+                  AND COALESCE(is_duplicate, 0) = 0
+                  AND COALESCE(is_semantic_duplicate, 0) = 0
+            """)
+
+        self.conn.commit()
+
+    def claim(self, limit: int) -> List[int]:
+        """
+        Lease up to limit unclaimed (or lease-expired) events, newest first.
+
+        Returns:
+            Event IDs now leased to this worker
+        """
+        now = datetime.utcnow()
+
+        # Commit anything pending so BEGIN IMMEDIATE starts a fresh
+        # transaction - it takes the write lock before reading, so
+        # concurrent claimers queue up instead of picking the same rows
+        self.conn.commit()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("""
+                SELECT event_id FROM analysis_queue
+                WHERE lease_until IS NULL OR lease_until < ?
+                ORDER BY collected_at DESC
+                LIMIT ?
+            """, (now.isoformat(), limit))
+            event_ids = [row[0] for row in cursor.fetchall()]
+
+            cursor.executemany("""
+                UPDATE analysis_queue SET claimed_by = ?, lease_until = ?
+                WHERE event_id = ?
+            """, [(self.worker_id, (now + self.lease).isoformat(), event_id)
+                  for event_id in event_ids])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return event_ids
+
+    def release(self, event_ids: List[int]):
+        """Give back leases on events still queued (e.g. analysis failed)"""
+        if not event_ids:
+            return
+        self.conn.executemany("""
+            UPDATE analysis_queue SET claimed_by = NULL, lease_until = NULL
+            WHERE event_id = ? AND claimed_by = ?
+        """, [(event_id, self.worker_id) for event_id in event_ids])
+        self.conn.commit()
+
+    def stats(self) -> dict:
+        """Queued, currently leased and available counts"""
+        now = datetime.utcnow().isoformat()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(CASE WHEN lease_until >= ? THEN 1 ELSE 0 END), 0)
+            FROM analysis_queue
+        """, (now,))
+        queued, leased = cursor.fetchone()
+        return {'queued': queued, 'leased': leased, 'available': queued - leased}
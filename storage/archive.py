@@ -0,0 +1,380 @@
+"""
+Monthly archive partitions for old events.
+
+Every event ever collected used to stay in the events table, so scans,
+index maintenance and VACUUM all slowed down as history grew. The archive
+moves whole months of old events (by collected_at) out of ai_pulse.db into
+one SQLite file per month:
+
+    archive/ai_pulse_2025-06.db     events collected in June 2025
+
+Each partition has the same events and event_entities tables and indexes
+as the live one, plus its own events_fts search index (storing the
+decompressed text, so a partition can be searched on its own).
+archive_partitions (in the live database) records which months have been
+moved, so readers know when a time range reaches past the live table:
+
+- queries back to a time the live table still covers don't touch the archive
+- older ranges attach just the partitions that can hold matching events and
+  read "events" as a UNION ALL of the live table and those partitions
+- entity and search lookups run once per partition (batches()) and merge
+
+An event is never collected before it is published, so a partition can
+only hold events published (or collected) before the end of its month.
+
+Archived (source, source_id) keys stay in archived_ids in the live
+database, and a trigger on events skips inserting them again, so an item a
+source returns after its month was archived is still a duplicate (the
+live UNIQUE constraint only sees live rows).
+
+Moves are idempotent - a month interrupted mid-move is finished by the next
+run. Aggregates stay correct: daily_sentiment already counts archived
+events, so its delete trigger is suspended while rows move.
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import EVENT_COLUMNS
+
+
+# Columns read through the union of live and archived events
+UNION_COLUMNS = EVENT_COLUMNS + ('published_date',)
+
+# Triggers on events that must not fire when a row moves to the archive
+# (the event still exists, and still counts)
+KEEP_ON_ARCHIVE = ('daily_sentiment_delete',)
+
+# Live tables copied into each partition (with their indexes)
+PARTITION_TABLES = ('events', 'event_entities')
+
+# SQLite's default cap on attached databases (one is kept free)
+MAX_PARTITIONS = 9
+
+
+def month_bounds(month: str) -> Tuple[str, str]:
+    """ISO timestamp bounds of a month (YYYY-MM): its start and the next month's start"""
+    start = datetime.strptime(month, '%Y-%m')
+    end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start.isoformat(), end.isoformat()
+
+
+class EventArchive:
+    """
+    Moves old events into monthly partition files and attaches them for reads.
+
+    Lives alongside the events database and shares its connection for moves.
+
+    Usage:
+        archive = EventArchive(db.conn, db.db_path)
+        archive.archive(before=datetime(2025, 6, 1))   # months before June
+        source = archive.attach(read_conn, since)      # 'events' or a UNION ALL
+        for schemas in archive.batches(read_conn, since):
+            ...query each schema's events / event_entities / events_fts...
+    """
+
+    def __init__(self, conn: sqlite3.Connection, db_path: str, archive_dir: Optional[str] = None):
+        """
+        Args:
+            conn: Connection to the events database
+            db_path: Path of the events database (names the partition files)
+            archive_dir: Where partition files go (default: archive/ next to the database)
+        """
+        self.conn = conn
+        self.name = Path(db_path).stem
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(db_path).parent / 'archive'
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create the partition catalog"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive_partitions (
+                month TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                events INTEGER NOT NULL DEFAULT 0,
+                archived_at TEXT NOT NULL
+            )
+        """)
+
+        # Keys of archived events - inserting one again is skipped, like a
+        # live (source, source_id) conflict
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS archived_ids (
+                source TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                PRIMARY KEY (source, source_id)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS events_archived_ids
+            BEFORE INSERT ON events
+            WHEN new.source_id IS NOT NULL
+            BEGIN
+                SELECT RAISE(IGNORE) WHERE EXISTS (
+                    SELECT 1 FROM archived_ids
+                    WHERE source = new.source AND source_id = new.source_id
+                );
+            END
+        """)
+        self.conn.commit()
+
+        # Partitions archived before archived_ids existed
+        if (self.conn.execute("SELECT 1 FROM archive_partitions LIMIT 1").fetchone()
+                and not self.conn.execute("SELECT 1 FROM archived_ids LIMIT 1").fetchone()):
+            for schemas in self.batches(self.conn, None):
+                for schema in schemas:
+                    self.conn.execute(f"""
+                        INSERT OR IGNORE INTO main.archived_ids (source, source_id)
+                        SELECT source, source_id FROM {schema}.events WHERE source_id IS NOT NULL
+                    """)
+                # DETACH can't run inside a transaction
+                self.conn.commit()
+
+    def partition_path(self, month: str) -> Path:
+        """Partition file for a month (YYYY-MM)"""
+        return self.archive_dir / f"{self.name}_{month}.db"
+
+    def partitions(self) -> List[dict]:
+        """Archived months, oldest first, with their file and event count"""
+        cursor = self.conn.execute("""
+            SELECT month, path, events, archived_at FROM archive_partitions ORDER BY month
+        """)
+        return [dict(zip(('month', 'path', 'events', 'archived_at'), row)) for row in cursor]
+
+    def horizon(self) -> Optional[datetime]:
+        """
+        Start of the live table's coverage (the month after the newest archived one).
+
+        Returns:
+            None if nothing has been archived
+        """
+        row = self.conn.execute("SELECT MAX(month) FROM archive_partitions").fetchone()
+        if not row or row[0] is None:
+            return None
+        return datetime.fromisoformat(month_bounds(row[0])[1])
+
+    def covering(self, since: Optional[datetime]) -> List[dict]:
+        """Partitions that can hold events back to since (all of them for None)"""
+        return [p for p in self.partitions()
+                if since is None or datetime.fromisoformat(month_bounds(p['month'])[1]) > since]
+
+    def needed(self, since: Optional[datetime]) -> bool:
+        """Whether events back to since may be in the archive"""
+        horizon = self.horizon()
+        return since is not None and horizon is not None and since < horizon
+
+    def archive(self, before: datetime) -> dict:
+        """
+        Move every whole month of events collected before `before` to its partition.
+
+        Args:
+            before: Events collected in months ending on or before this move
+                    (a partial month stays live)
+
+        Returns:
+            Stats dict: months moved and events moved
+        """
+        cutoff = before.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        cursor = self.conn.execute("""
+            SELECT DISTINCT substr(collected_at, 1, 7) FROM events
+            WHERE collected_at < ?
+            ORDER BY 1
+        """, (cutoff.isoformat(),))
+        months = [row[0] for row in cursor.fetchall()]
+
+        moved = 0
+        for month in months:
+            moved += self._move_month(month)
+
+        return {'months': len(months), 'events': moved}
+
+    def _move_month(self, month: str) -> int:
+        """Copy one month of events, entity rows and search text into its partition, then drop them live"""
+        path = self.partition_path(month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        start, end = month_bounds(month)
+        in_month = "collected_at >= ? AND collected_at < ?"
+        columns = ', '.join(EVENT_COLUMNS)
+
+        # ATTACH can't run inside a transaction
+        self.conn.commit()
+        self.conn.execute("ATTACH DATABASE ? AS archive_move", (str(path),))
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                # Same tables and indexes as the live ones
+                schema = cursor.execute(f"""
+                    SELECT type, sql FROM main.sqlite_master
+                    WHERE tbl_name IN ({', '.join('?' * len(PARTITION_TABLES))})
+                      AND type IN ('table', 'index') AND sql IS NOT NULL
+                """, PARTITION_TABLES).fetchall()
+                for kind, sql in schema:
+                    prefix = 'CREATE TABLE ' if kind == 'table' else 'CREATE INDEX '
+                    cursor.execute(sql.replace(prefix, f'{prefix}IF NOT EXISTS archive_move.', 1))
+
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO archive_move.events ({columns})
+                    SELECT {columns} FROM main.events WHERE {in_month}
+                """, (start, end))
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO archive_move.event_entities
+                    SELECT * FROM main.event_entities
+                    WHERE event_id IN (SELECT id FROM main.events WHERE {in_month})
+                """, (start, end))
+                self._move_search_index(cursor, in_month, (start, end))
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO main.archived_ids (source, source_id)
+                    SELECT source, source_id FROM main.events
+                    WHERE {in_month} AND source_id IS NOT NULL
+                """, (start, end))
+
+                kept = cursor.execute(f"""
+                    SELECT name, sql FROM main.sqlite_master
+                    WHERE type = 'trigger' AND name IN ({', '.join('?' * len(KEEP_ON_ARCHIVE))})
+                """, KEEP_ON_ARCHIVE).fetchall()
+                for name, _ in kept:
+                    cursor.execute(f"DROP TRIGGER main.{name}")
+
+                cursor.execute(f"""
+                    DELETE FROM main.event_entities
+                    WHERE event_id IN (SELECT id FROM main.events WHERE {in_month})
+                """, (start, end))
+                cursor.execute(f"DELETE FROM main.events WHERE {in_month}", (start, end))
+                moved = cursor.rowcount
+
+                for _, sql in kept:
+                    cursor.execute(sql)
+
+                cursor.execute("""
+                    INSERT INTO archive_partitions (month, path, events, archived_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(month) DO UPDATE SET
+                        events = events + excluded.events,
+                        archived_at = excluded.archived_at
+                """, (month, str(path), moved, datetime.utcnow().isoformat()))
+
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        finally:
+            self.conn.execute("DETACH DATABASE archive_move")
+
+        return moved
+
+    def _move_search_index(self, cursor: sqlite3.Cursor, in_month: str, params: tuple):
+        """
+        Move a month's events from the live events_fts to the partition's.
+
+        The live index reads text from the events_text view; the partition's
+        stores it, so it works without the live database. Same columns and
+        tokenizer, so queries match the same way. The live index isn't
+        trigger-maintained, so the month's entries are deleted from it here,
+        before the rows go. Skipped without a live index.
+        """
+        row = cursor.execute("""
+            SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = 'events_fts'
+        """).fetchone()
+        if row is None:
+            return
+
+        columns = [info[1] for info in cursor.execute("PRAGMA main.table_info(events_fts)")]
+        tokenize = re.search(r"tokenize\s*=\s*'([^']*)'", row[0])
+        options = f", tokenize='{tokenize.group(1)}'" if tokenize else ''
+        names = ', '.join(columns)
+
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS archive_move.events_fts USING fts5({names}{options})
+        """)
+        cursor.execute(f"""
+            INSERT INTO archive_move.events_fts(rowid, {names})
+            SELECT id, {names} FROM main.events_text
+            WHERE id IN (SELECT id FROM main.events WHERE {in_month})
+              AND id NOT IN (SELECT rowid FROM archive_move.events_fts)
+        """, params)
+        cursor.execute(f"""
+            INSERT INTO main.events_fts(events_fts, rowid, {names})
+            SELECT 'delete', id, {names} FROM main.events_text
+            WHERE id IN (SELECT id FROM main.events WHERE {in_month})
+        """, params)
+
+    def attach(self, conn: sqlite3.Connection, since: Optional[datetime]) -> str:
+        """
+        Attach the partitions needed to read events back to since.
+
+        Args:
+            conn: Connection to read through (not in a transaction)
+            since: Earliest published_at/collected_at the query needs
+                   (ranges over more than MAX_PARTITIONS months are staged
+                   in temp.archived_events)
+
+        Returns:
+            What to read FROM - 'events' when the live table covers since,
+            otherwise a UNION ALL of it and the partitions (aliased events)
+        """
+        if not self.needed(since):
+            return 'events'
+
+        months = self.covering(since)
+        columns = ', '.join(UNION_COLUMNS)
+        selects = [f"SELECT {columns} FROM main.events"]
+
+        if len(months) > MAX_PARTITIONS:
+            # More months than SQLite can attach: copy their rows into a temp
+            # table on this connection instead, a batch of partitions at a time
+            # (on disk - connect() keeps temp tables in memory, and this can
+            # be years of events)
+            conn.execute("DROP TABLE IF EXISTS temp.archived_events")
+            conn.execute("PRAGMA temp_store = FILE")
+            conn.execute(f"CREATE TEMP TABLE archived_events AS SELECT {columns} FROM main.events WHERE 0")
+            for schemas in self.batches(conn, since):
+                for schema in schemas:
+                    conn.execute(f"INSERT INTO temp.archived_events SELECT {columns} FROM {schema}.events")
+                # DETACH can't run inside a transaction
+                conn.commit()
+            selects.append(f"SELECT {columns} FROM temp.archived_events")
+            return f"({' UNION ALL '.join(selects)}) AS events"
+
+        attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+        for partition in months:
+            schema = f"archive_{partition['month'].replace('-', '_')}"
+            if schema not in attached:
+                conn.execute(f"ATTACH DATABASE ? AS {schema}", (partition['path'],))
+            selects.append(f"SELECT {columns} FROM {schema}.events")
+
+        return f"({' UNION ALL '.join(selects)}) AS events"
+
+    def batches(self, conn: sqlite3.Connection, since: Optional[datetime]) -> Iterator[List[str]]:
+        """
+        Attach the partitions that can hold events back to since, a batch at a time.
+
+        For lookups that join a partition's own tables (event_entities,
+        events_fts) and so run once per partition - any number of months,
+        MAX_PARTITIONS attached at once.
+
+        Args:
+            conn: Connection to read through (not in a transaction)
+            since: Earliest published_at/collected_at the query needs (None = all)
+
+        Yields:
+            Schema names of the attached partitions; each batch is detached
+            before the next is attached
+        """
+        months = self.covering(since)
+        for first in range(0, len(months), MAX_PARTITIONS):
+            schemas = []
+            try:
+                for partition in months[first:first + MAX_PARTITIONS]:
+                    schema = f"archive_{partition['month'].replace('-', '_')}"
+                    conn.execute(f"ATTACH DATABASE ? AS {schema}", (partition['path'],))
+                    schemas.append(schema)
+                yield schemas
+            finally:
+                for schema in schemas:
+                    conn.execute(f"DETACH DATABASE {schema}")
@@ -0,0 +1,59 @@
+"""
+Compression codec for large event text columns.
+
+events.content (full article text) and events.analysis (Claude's full
+reasoning) are most of the database's bytes, and every scan drags them
+through the page cache. They are stored zlib-compressed:
+
+    b'ZL1' + zlib.compress(utf-8 text)    stored as a BLOB
+
+Short values, and values that don't shrink, stay plain TEXT - so a column
+can hold both, and rows written before compression read unchanged.
+unpack_text() tells them apart by type and header. EventDatabase decodes
+these columns when it hydrates events (a StoredEventRow only when the
+column is read).
+
+connect() registers unpack_text() as an SQL function, so SQL on those
+connections that needs the text (the events_text view the full-text index
+reads, ad-hoc queries) can decode it too. Plain sqlite3 connections don't
+have it, so nothing that runs on every write (triggers) may call it:
+
+    SELECT unpack_text(content) FROM events WHERE id = ?
+"""
+
+import sqlite3
+import zlib
+from typing import Optional, Union
+
+
+# Event columns stored with pack_text
+COMPRESSED_COLUMNS = ('content', 'analysis')
+
+HEADER = b'ZL1'
+
+# Shorter texts aren't worth compressing (zlib overhead, per-read cost)
+MIN_LENGTH = 256
+
+LEVEL = 6
+
+
+def pack_text(text: Optional[str]) -> Union[str, bytes, None]:
+    """Value to store for a compressed column: compressed BLOB, or the text itself"""
+    if text is None or len(text) < MIN_LENGTH:
+        return text
+
+    data = text.encode('utf-8')
+    packed = HEADER + zlib.compress(data, LEVEL)
+    return packed if len(packed) < len(data) else text
+
+
+def unpack_text(value: Union[str, bytes, None]) -> Optional[str]:
+    """Stored value of a compressed column -> text (plain text passes through)"""
+    if isinstance(value, bytes) and value[:len(HEADER)] == HEADER:
+        return zlib.decompress(value[len(HEADER):]).decode('utf-8')
+    return value
+
+
+def register(conn: sqlite3.Connection):
+    """Make unpack_text() available to SQL on this connection"""
+    conn.create_function('unpack_text', 1, unpack_text, deterministic=True)
@@ -0,0 +1,74 @@
+"""
+Shared SQLite connection factory.
+
+Every module that touches ai_pulse.db (or cost_tracking.db) opens its
+connection here so they all get the same performance profile:
+
+- WAL journal: readers don't block the writer and vice versa, so the
+  reporter/prediction agents can read while the collector is writing
+- synchronous=NORMAL: safe with WAL, avoids an fsync on every commit
+- mmap + larger page cache + in-memory temp tables for scans/sorts
+- busy timeout: wait for a competing writer instead of failing with
+  "database is locked"
+- unpack_text() SQL function for the compressed event text columns
+  (the events_text view the full-text index reads calls it)
+
+ai_pulse.db is committed by the workflows without its -wal file, so
+close_connection() checkpoints the WAL into the database file before
+closing (the workflows also checkpoint before `git add`, for runs that
+were killed before closing).
+"""
+
+import sqlite3
+
+from storage.compression import register as register_codec
+
+
+# Seconds to wait on a locked database before raising
+BUSY_TIMEOUT = 30
+
+# Applied to every connection (journal_mode is persistent in the file,
+# the rest are per-connection)
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("mmap_size", 256 * 1024 * 1024),   # 256MB memory-mapped I/O
+    ("cache_size", -64000),             # ~64MB page cache (negative = KiB)
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", BUSY_TIMEOUT * 1000),
+)
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    Open a SQLite connection with the shared performance settings.
+
+    Args:
+        db_path: Path to SQLite database file
+        **kwargs: Passed through to sqlite3.connect (e.g. check_same_thread)
+
+    Returns:
+        Configured sqlite3.Connection
+    """
+    kwargs.setdefault("timeout", BUSY_TIMEOUT)
+    conn = sqlite3.connect(db_path, **kwargs)
+
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+    register_codec(conn)
+
+    return conn
+
+
+def close_connection(conn: sqlite3.Connection):
+    """
+    Checkpoint the WAL into the database file, then close.
+
+    SQLite checkpoints on its own when the last connection closes cleanly;
+    this also empties the WAL while other connections are still open, so
+    the database file alone holds every committed row.
+    """
+    if not conn.in_transaction:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
@@ -5,13 +5,61 @@ Simple, file-based storage - no external database needed.
 """
 
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from models.events import Event, EventSource, EventType
+from models.events import Event, EventRow, EventSource, EventType, EVENT_COLUMNS, INSERT_COLUMNS
+from storage.connection import close_connection, connect
+from storage.analysis_queue import AnalysisQueue
+from storage.archive import EventArchive
+from storage.compression import COMPRESSED_COLUMNS, pack_text, unpack_text
+
+
+def day_range(date: str) -> tuple:
+    """
+    ISO timestamp bounds of a day, for index-friendly filters on stored timestamps.
+
+    "collected_at >= start AND collected_at < end" selects the same rows as
+    "DATE(collected_at) = date" for the naive UTC timestamps we store, but
+    can use an index.
+
+    Args:
+        date: Date string (YYYY-MM-DD)
+
+    Returns:
+        (start, end) - start of the day and start of the next day
+    """
+    day = datetime.strptime(date, '%Y-%m-%d')
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
+
+
+def event_from_row(row) -> Event:
+    """Event.from_row for a stored row, with content and analysis decompressed"""
+    event = Event.from_row(row)
+    event.content = unpack_text(event.content)
+    event.analysis = unpack_text(event.analysis)
+    return event
+
+
+def event_from_dict(data: dict) -> Event:
+    """Event.from_dict for a stored row, with content and analysis decompressed"""
+    return Event.from_dict({key: unpack_text(value) if key in COMPRESSED_COLUMNS else value
+                            for key, value in data.items()})
+
+
+class StoredEventRow(EventRow):
+    """EventRow over a stored row: content and analysis decompress on first read"""
+
+    __slots__ = ()
+
+    _PARSERS = {**EventRow._PARSERS, **dict.fromkeys(COMPRESSED_COLUMNS, unpack_text)}
+
+    def to_event(self) -> Event:
+        """Hydrate a full Event from the selected columns"""
+        return event_from_dict({key: self._row[key] for key in self._row.keys()})
 
 
 class EventDatabase:
@@ -28,12 +76,62 @@ class EventDatabase:
         self.conn = None
         self._connect()
         self._create_tables()
+        self.analysis_queue = AnalysisQueue(self.conn)
+        self.archive = EventArchive(self.conn, db_path)
+        # After the archive: a changed definition recounts archived events too
+        self._create_sentiment_triggers()
 
     def _connect(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = connect(self.db_path)
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
 
+    def _read_connection(self, since: Optional[datetime] = None) -> Tuple[sqlite3.Connection, str]:
+        """
+        A separate connection for reading events back to since.
+
+        Returns:
+            (connection, source) - source is 'events', or a union of the live
+            table and the archive partitions when since reaches past it
+        """
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn, self.archive.attach(conn, since)
+        except Exception:
+            conn.close()
+            raise
+
+    def _read_partitions(self, sql: str, params: Sequence = (),
+                         since: Optional[datetime] = None) -> List[sqlite3.Row]:
+        """
+        Run a query on every archive partition that can hold events back to since.
+
+        For lookups through a partition's own event_entities/events_fts:
+        sql names its tables as {schema}.events etc. and runs once per
+        partition, so rows come back concatenated - the caller merges them
+        with the live table's rows, re-sorts and re-limits.
+
+        Args:
+            since: Earliest time the query can match (None = every partition)
+
+        Returns:
+            Rows from all partitions ([] if none are in range)
+        """
+        if not self.archive.covering(since):
+            return []
+
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        rows = []
+        try:
+            for schemas in self.archive.batches(conn, since):
+                for schema in schemas:
+                    rows.extend(conn.execute(sql.format(schema=schema), params).fetchall())
+        finally:
+            conn.close()
+        return rows
+
     def _create_tables(self):
         """Create database schema if it doesn't exist"""
         cursor = self.conn.cursor()
@@ -63,10 +161,21 @@ class EventDatabase:
                 key_context TEXT,
                 is_duplicate INTEGER DEFAULT 0,
                 is_semantic_duplicate INTEGER DEFAULT 0,
+                published_date TEXT GENERATED ALWAYS AS (date(published_at)) VIRTUAL,
                 UNIQUE(source, source_id)
             )
         """)
 
+        # Databases created before published_date existed. A VIRTUAL column
+        # is computed on read, so adding it doesn't rewrite the table.
+        # (table_xinfo, unlike table_info, lists generated columns)
+        cursor.execute("PRAGMA table_xinfo(events)")
+        if 'published_date' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("""
+                ALTER TABLE events
+                ADD COLUMN published_date TEXT GENERATED ALWAYS AS (date(published_at)) VIRTUAL
+            """)
+
         # Index for faster queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_collected_at
@@ -83,6 +192,49 @@ class EventDatabase:
             ON events(significance_score DESC)
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_published_at
+            ON events(published_at DESC)
+        """)
+
+        # Per-day aggregation: published_date = ? plus the dedup flags and
+        # sentiment, so daily sentiment counts are answered from the index alone
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_published_date_flags
+            ON events(published_date, is_duplicate, is_semantic_duplicate, sentiment)
+        """)
+
+        # Per-day top events by score
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_published_date_score
+            ON events(published_date, significance_score DESC)
+        """)
+
+        # Entity index - one row per company/product/person mention, so
+        # "all events about NVIDIA" is an index range instead of LIKE over
+        # the comma-joined columns. published_at is copied in so date-bounded
+        # lookups stay inside the index.
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'event_entities'
+        """)
+        needs_backfill = cursor.fetchone() is None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_entities (
+                event_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                name_key TEXT NOT NULL,
+                published_at TEXT,
+                UNIQUE(event_id, kind, name_key)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entities_lookup
+            ON event_entities(kind, name_key, published_at DESC)
+        """)
+
         # Daily sentiment aggregates table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS daily_sentiment (
@@ -234,6 +386,337 @@ class EventDatabase:
 
         self.conn.commit()
 
+        if needs_backfill:
+            self.backfill_entities()
+
+        self._create_search_index()
+
+    # Columns indexed for full-text search, and their BM25 weights (title counts most)
+    SEARCH_COLUMNS = (('title', 10.0), ('content', 1.0), ('analysis', 2.0), ('implications', 2.0))
+
+    def _create_search_index(self):
+        """
+        Create the events_fts full-text index.
+
+        events_fts is an external-content FTS5 table: it stores only the
+        index, reading text by rowid from the events_text view (events with
+        content and analysis decompressed). EventDatabase updates it as it
+        saves, analyzes and archives events (_index_events/_unindex_events)
+        rather than through triggers: decoding needs unpack_text(), which
+        only connect() registers, and a trigger calling it would break every
+        INSERT/UPDATE on events from plain sqlite3 connections (the CLI in
+        the workflows). Builds without FTS5 get no search index (search()
+        then raises).
+        """
+        cursor = self.conn.cursor()
+        columns = ', '.join(name for name, _ in self.SEARCH_COLUMNS)
+
+        view_columns = ', '.join(f"unpack_text({name}) AS {name}" if name in COMPRESSED_COLUMNS else name
+                                 for name, _ in self.SEARCH_COLUMNS)
+        cursor.execute(f"""
+            CREATE VIEW IF NOT EXISTS events_text AS
+            SELECT id, {view_columns} FROM events
+        """)
+
+        # Sync triggers from earlier versions (they called unpack_text)
+        for trigger in ('events_fts_insert', 'events_fts_delete', 'events_fts_update'):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        cursor.execute("""
+            SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'
+        """)
+        row = cursor.fetchone()
+        exists = row is not None
+
+        if exists and "content='events_text'" not in row[0]:
+            # Index from before compressed text columns - it read events
+            # directly. Rebuild it over events_text.
+            cursor.execute("DROP TABLE events_fts")
+            exists = False
+
+        try:
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+                    {columns},
+                    content='events_text', content_rowid='id',
+                    tokenize='porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5
+            self.has_search = False
+            return
+
+        if not exists:
+            # Index events saved before search existed
+            cursor.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+        self.conn.commit()
+        self.has_search = True
+
+    def _index_events(self, where: str, params: Sequence = ()):
+        """
+        Add events' current text to events_fts (caller commits).
+
+        Args:
+            where: SQL filter on events_text selecting the rows to index
+            params: Values for the placeholders in where
+        """
+        if self.has_search:
+            columns = ', '.join(name for name, _ in self.SEARCH_COLUMNS)
+            self.conn.execute(f"""
+                INSERT INTO events_fts(rowid, {columns})
+                SELECT id, {columns} FROM events_text WHERE {where}
+            """, tuple(params))
+
+    def _unindex_events(self, where: str, params: Sequence = ()):
+        """
+        Remove events' indexed text from events_fts (caller commits).
+
+        Run before the rows change: an external-content index deletes by
+        the text it indexed.
+
+        Args:
+            where: SQL filter on events_text selecting the rows to remove
+            params: Values for the placeholders in where
+        """
+        if self.has_search:
+            columns = ', '.join(name for name, _ in self.SEARCH_COLUMNS)
+            self.conn.execute(f"""
+                INSERT INTO events_fts(events_fts, rowid, {columns})
+                SELECT 'delete', id, {columns} FROM events_text WHERE {where}
+            """, tuple(params))
+
+    def rebuild_search_index(self):
+        """
+        Re-index every event from events_text.
+
+        For events written outside EventDatabase (plain sqlite3 connections
+        don't update events_fts).
+        """
+        if self.has_search:
+            self.conn.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+            self.conn.commit()
+
+    # Sentiments counted in daily_sentiment (one column each)
+    SENTIMENTS = ('positive', 'negative', 'neutral', 'mixed')
+
+    # Event columns that decide whether (and where) an event is counted
+    SENTIMENT_INPUTS = ('sentiment', 'is_duplicate', 'is_semantic_duplicate', 'published_at')
+
+    # Triggers that keep daily_sentiment current
+    SENTIMENT_TRIGGERS = ('daily_sentiment_insert', 'daily_sentiment_delete', 'daily_sentiment_update')
+
+    @classmethod
+    def _sentiment_terms(cls, row: str) -> tuple:
+        """
+        SQL for an events row's daily_sentiment contribution.
+
+        The same signal prediction_logger predicts from: an event counts
+        toward its publish day once it has a sentiment, unless it is a
+        duplicate (research papers count too).
+
+        Args:
+            row: Row reference prefix - 'new.', 'old.' or '' (the events table)
+
+        Returns:
+            (day, counted, per-sentiment 0/1 terms)
+        """
+        day = f"date({row}published_at)"
+        counted = f"""{row}published_at IS NOT NULL
+                  AND {row}sentiment IN ({', '.join(f"'{s}'" for s in cls.SENTIMENTS)})
+                  AND COALESCE({row}is_duplicate, 0) = 0
+                  AND COALESCE({row}is_semantic_duplicate, 0) = 0"""
+        terms = [f"({row}sentiment = '{s}')" for s in cls.SENTIMENTS]
+        return day, counted, terms
+
+    def _sentiment_triggers(self) -> dict:
+        """
+        CREATE TRIGGER statements that keep daily_sentiment counts in step with events.
+
+        Every insert, delete, analysis and duplicate-flag change adjusts the
+        affected day's counters, so daily_sentiment is always current and
+        per-day sentiment is a single-row read.
+
+        Returns:
+            {trigger name: SQL}
+        """
+        columns = ', '.join(self.SENTIMENTS)
+
+        def add(row: str) -> str:
+            day, counted, terms = self._sentiment_terms(row)
+            increments = ', '.join(f"{s} = {s} + excluded.{s}" for s in self.SENTIMENTS)
+            return f"""
+                INSERT INTO daily_sentiment (date, {columns}, total_analyzed, created_at)
+                SELECT {day}, {', '.join(terms)}, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+                WHERE {counted}
+                ON CONFLICT(date) DO UPDATE SET {increments},
+                    total_analyzed = total_analyzed + 1;
+            """
+
+        def subtract(row: str) -> str:
+            day, counted, terms = self._sentiment_terms(row)
+            decrements = ', '.join(f"{s} = {s} - {term}" for s, term in zip(self.SENTIMENTS, terms))
+            return f"""
+                UPDATE daily_sentiment SET {decrements}, total_analyzed = total_analyzed - 1
+                WHERE date = {day} AND {counted};
+            """
+
+        insert, delete, update = self.SENTIMENT_TRIGGERS
+        return {
+            insert: f"""CREATE TRIGGER {insert} AFTER INSERT ON events BEGIN
+                {add('new.')}
+            END""",
+            delete: f"""CREATE TRIGGER {delete} AFTER DELETE ON events BEGIN
+                {subtract('old.')}
+            END""",
+            update: f"""CREATE TRIGGER {update}
+            AFTER UPDATE OF {', '.join(self.SENTIMENT_INPUTS)} ON events BEGIN
+                {subtract('old.')}
+                {add('new.')}
+            END""",
+        }
+
+    def _create_sentiment_triggers(self):
+        """
+        Install the daily_sentiment triggers, recounting the table if they changed.
+
+        The stored triggers are the table's version: a database whose
+        triggers are missing (rows are 24h snapshots from publishing) or
+        differ from _sentiment_triggers() (counts under another definition)
+        is backed up and recounted once, so counters are never added on top
+        of rows that mean something else.
+        """
+        triggers = self._sentiment_triggers()
+        stored = dict(self.conn.execute(f"""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'trigger' AND name IN ({', '.join('?' * len(triggers))})
+        """, tuple(triggers)).fetchall())
+
+        if stored != triggers:
+            self.rebuild_daily_sentiment()
+
+    def rebuild_daily_sentiment(self) -> dict:
+        """
+        Back up daily_sentiment, then recount it from every event (triggers included).
+
+        Runs on open when the triggers change (see _create_sentiment_triggers)
+        and from migrations/rebuild_daily_sentiment.py. Archived events are
+        counted too - their days would otherwise drop to the live events
+        alone. The backup, trigger swap and recount are one transaction.
+
+        Returns:
+            {'dates': dates written, 'backup': backup table name (None if the table was empty)}
+        """
+        day, counted, terms = self._sentiment_terms('')
+        sentiments = ', '.join(self.SENTIMENTS)
+
+        # Per-day counts from the archive (partitions only change when
+        # archive_events.py runs, so they can be read before the transaction)
+        archived = self._read_partitions(f"""
+            SELECT {day} AS day, {', '.join(f'SUM({term})' for term in terms)}, COUNT(*)
+            FROM {{schema}}.events
+            WHERE {counted}
+            GROUP BY day
+        """)
+
+        self.conn.commit()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            backup = None
+            if cursor.execute("SELECT 1 FROM daily_sentiment LIMIT 1").fetchone():
+                # Earlier rows may be published snapshots predictions were logged against
+                backup = f"daily_sentiment_backup_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
+                cursor.execute(f"CREATE TABLE {backup} AS SELECT * FROM daily_sentiment")
+
+            for name, sql in self._sentiment_triggers().items():
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+                cursor.execute(sql)
+
+            cursor.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS archived_sentiment (
+                    day TEXT, {', '.join(f'{s} INTEGER' for s in self.SENTIMENTS)}, total INTEGER
+                )
+            """)
+            cursor.execute("DELETE FROM temp.archived_sentiment")
+            cursor.executemany(f"""
+                INSERT INTO temp.archived_sentiment VALUES ({', '.join('?' * (len(self.SENTIMENTS) + 2))})
+            """, [tuple(row) for row in archived])
+
+            cursor.execute("DELETE FROM daily_sentiment")
+            cursor.execute(f"""
+                INSERT INTO daily_sentiment (date, {sentiments}, total_analyzed, created_at)
+                SELECT day, {', '.join(f'SUM({s})' for s in self.SENTIMENTS)}, SUM(total), ?
+                FROM (
+                    SELECT {day} AS day,
+                           {', '.join(f'{term} AS {s}' for term, s in zip(terms, self.SENTIMENTS))},
+                           1 AS total
+                    FROM events
+                    WHERE {counted}
+                    UNION ALL
+                    SELECT day, {sentiments}, total FROM temp.archived_sentiment
+                )
+                GROUP BY day
+            """, (datetime.utcnow().isoformat(),))
+            dates = cursor.rowcount
+            cursor.execute("DROP TABLE temp.archived_sentiment")
+
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return {'dates': dates, 'backup': backup}
+
+    # Event fields indexed in event_entities, and the kind each is stored as
+    ENTITY_KINDS = (('companies', 'company'), ('products', 'product'), ('people', 'person'))
+
+    @staticmethod
+    def entity_key(name: str) -> str:
+        """Lookup key for an entity name ('NVIDIA ' and 'Nvidia' match)"""
+        return ' '.join(name.split()).lower()
+
+    def _entity_rows(self, event_id: int, event: Event) -> List[tuple]:
+        """event_entities rows for one saved event"""
+        published_at = event.published_at.isoformat() if event.published_at else None
+        rows = []
+        for field, kind in self.ENTITY_KINDS:
+            for name in getattr(event, field) or []:
+                name = name.strip()
+                if name:
+                    rows.append((event_id, kind, name, self.entity_key(name), published_at))
+        return rows
+
+    def _save_entities(self, rows: List[tuple]):
+        """Insert entity rows (caller commits)"""
+        if rows:
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO event_entities (event_id, kind, name, name_key, published_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+
+    # Column list shared by the single-row and bulk insert paths, bound
+    # positionally from _stored_row()
+    _INSERT_EVENT_SQL = f"""
+        INSERT INTO events ({', '.join(INSERT_COLUMNS)})
+        VALUES ({', '.join('?' * len(INSERT_COLUMNS))})
+    """
+
+    # Full-event SELECT list, in the order Event.from_row expects
+    _EVENT_SELECT = ', '.join(EVENT_COLUMNS)
+
+    # Positions of the compressed text columns in Event.to_row()
+    _PACKED_POSITIONS = tuple(INSERT_COLUMNS.index(column) for column in COMPRESSED_COLUMNS)
+
+    @classmethod
+    def _stored_row(cls, event: Event) -> tuple:
+        """Event.to_row() with content and analysis compressed for storage"""
+        row = list(event.to_row())
+        for position in cls._PACKED_POSITIONS:
+            row[position] = pack_text(row[position])
+        return tuple(row)
+
     def save_event(self, event: Event) -> int:
         """
         Save an event to the database.
@@ -245,30 +728,23 @@ class EventDatabase:
             Database ID of saved event
 
         Note:
-            If event with same source+source_id exists, it will be skipped (UNIQUE constraint)
+            If event with same source+source_id exists, it will be skipped (UNIQUE
+            constraint, or the archived_ids trigger for archived events)
         """
         cursor = self.conn.cursor()
 
-        data = event.to_dict()
-        del data['id']  # Don't insert ID, let database auto-generate
-
         try:
-            cursor.execute("""
-                INSERT INTO events (
-                    source, source_id, source_url, title, content, summary,
-                    event_type, companies, products, people,
-                    published_at, collected_at, significance_score, sentiment, analysis,
-                    implications, affected_parties, investment_relevance, key_context
-                ) VALUES (
-                    :source, :source_id, :source_url, :title, :content, :summary,
-                    :event_type, :companies, :products, :people,
-                    :published_at, :collected_at, :significance_score, :sentiment, :analysis,
-                    :implications, :affected_parties, :investment_relevance, :key_context
-                )
-            """, data)
+            # ID is left for the database to auto-generate
+            cursor.execute(self._INSERT_EVENT_SQL, self._stored_row(event))
+            if cursor.rowcount == 0:
+                # Skipped by the archived_ids trigger - an archived event's key
+                return None
+            event_id = cursor.lastrowid
+            self._save_entities(self._entity_rows(event_id, event))
+            self._index_events("id = ?", (event_id,))
 
             self.conn.commit()
-            return cursor.lastrowid
+            return event_id
 
         except sqlite3.IntegrityError:
             # Event already exists (duplicate source + source_id)
@@ -276,7 +752,12 @@ class EventDatabase:
 
     def save_events(self, events: List[Event]) -> dict:
         """
-        Save multiple events.
+        Save multiple events in a single transaction.
+
+        Uses executemany with ON CONFLICT DO NOTHING, so the whole batch costs
+        one commit instead of one per event. Rows skipped by the
+        UNIQUE(source, source_id) constraint (or, for archived events, the
+        archived_ids trigger) are counted as duplicates.
 
         Args:
             events: List of Event objects
@@ -284,6 +765,50 @@ class EventDatabase:
         Returns:
             Dictionary with counts: {'saved': 5, 'duplicates': 2}
         """
+        if not events:
+            return {'saved': 0, 'duplicates': 0}
+
+        rows = [self._stored_row(event) for event in events]
+
+        cursor = self.conn.cursor()
+
+        try:
+            with self.conn:
+                # AUTOINCREMENT ids only grow, so rows above this are the ones
+                # this batch inserted (skipped duplicates keep their old id)
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM events")
+                last_id = cursor.fetchone()[0]
+
+                cursor.executemany(
+                    self._INSERT_EVENT_SQL + " ON CONFLICT(source, source_id) DO NOTHING",
+                    rows
+                )
+                saved = cursor.rowcount
+
+                # Match new ids back to events; within a key, rows went in in order
+                by_key = {}
+                for event in events:
+                    by_key.setdefault((event.source.value, event.source_id), []).append(event)
+
+                cursor.execute("SELECT id, source, source_id FROM events WHERE id > ? ORDER BY id",
+                               (last_id,))
+                entity_rows = []
+                for event_id, source, source_id in cursor.fetchall():
+                    pending = by_key.get((source, source_id))
+                    if pending:
+                        entity_rows.extend(self._entity_rows(event_id, pending.pop(0)))
+                self._save_entities(entity_rows)
+                self._index_events("id > ?", (last_id,))
+        except sqlite3.IntegrityError:
+            # Some other constraint failed (e.g. NULL title) and the batch was
+            # rolled back - fall back to row-by-row so good rows still land
+            return self._save_events_one_by_one(events)
+
+        # rowcount summed the rows actually inserted across the batch
+        return {'saved': saved, 'duplicates': len(events) - saved}
+
+    def _save_events_one_by_one(self, events: List[Event]) -> dict:
+        """Save events individually (one commit each), skipping failures"""
         saved = 0
         duplicates = 0
 
@@ -296,7 +821,35 @@ class EventDatabase:
 
         return {'saved': saved, 'duplicates': duplicates}
 
-    def get_recent_events(self, limit: int = 50, hours: int = 24) -> List[Event]:
+    @staticmethod
+    def _projection(fields: Optional[Sequence[str]], alias: str = '') -> str:
+        """
+        SELECT list for an events query.
+
+        Args:
+            fields: Event columns to load (None = every Event column, in from_row order)
+            alias: Table alias prefix, e.g. 'e.'
+        """
+        if fields is None:
+            return ', '.join(f"{alias}{column}" for column in EVENT_COLUMNS)
+
+        unknown = [field for field in fields if field not in EVENT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown event fields: {', '.join(unknown)}")
+
+        # id always comes along so rows can be updated or re-fetched
+        columns = dict.fromkeys(('id',) + tuple(fields))
+        return ', '.join(f"{alias}{column}" for column in columns)
+
+    @staticmethod
+    def _hydrate(rows, fields: Optional[Sequence[str]]) -> List[Union[Event, EventRow]]:
+        """Full Events for the full column list, lazy EventRows for a projection"""
+        if fields is None:
+            return [event_from_row(row) for row in rows]
+        return [StoredEventRow(row) for row in rows]
+
+    def get_recent_events(self, limit: int = 50, hours: int = 24,
+                          fields: Optional[Sequence[str]] = None) -> List[Event]:
         """
         Get recent events by published date.
 
@@ -312,50 +865,373 @@ class EventDatabase:
             limit: Maximum number of events to return
             hours: Only return events published in last N hours
                    Default 24 captures overnight window when run at 1pm GMT
+            fields: Only load these columns (returns lazy EventRows)
 
         Returns:
-            List of Event objects
+            List of Event objects (EventRow objects if fields given)
         """
-        cursor = self.conn.cursor()
-
         from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-        cursor.execute("""
-            SELECT * FROM events
+        sql = f"""
+            SELECT {self._projection(fields)}, published_at AS sort_published_at FROM {{schema}}.events
             WHERE published_at >= ?
             ORDER BY published_at DESC
             LIMIT ?
-        """, (cutoff.isoformat(), limit))
+        """
+        params = (cutoff.isoformat(), limit)
 
+        cursor = self.conn.cursor()
+        cursor.execute(sql.format(schema='main'), params)
         rows = cursor.fetchall()
-        return [Event.from_dict(dict(row)) for row in rows]
 
-    def get_events_by_type(self, event_type: EventType, limit: int = 50) -> List[Event]:
-        """Get events of a specific type"""
+        # Windows reaching past the live table also read archived months
+        if self.archive.needed(cutoff):
+            archived = self._read_partitions(sql, params, cutoff)
+            if archived:
+                rows = sorted(rows + archived, key=lambda row: row['sort_published_at'],
+                              reverse=True)[:limit]
+
+        return self._hydrate(rows, fields)
+
+    def get_events_by_type(self, event_type: EventType, limit: int = 50,
+                           fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """Get events of a specific type (EventRows with only fields, if given)"""
         cursor = self.conn.cursor()
 
-        cursor.execute("""
-            SELECT * FROM events
+        cursor.execute(f"""
+            SELECT {self._projection(fields)} FROM events
             WHERE event_type = ?
             ORDER BY collected_at DESC
             LIMIT ?
         """, (event_type.value, limit))
 
         rows = cursor.fetchall()
-        return [Event.from_dict(dict(row)) for row in rows]
+        return self._hydrate(rows, fields)
 
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
-        """Get a specific event by database ID"""
+        """Get a specific event by database ID (archived events included)"""
         cursor = self.conn.cursor()
 
-        cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+        cursor.execute(f"SELECT {self._EVENT_SELECT} FROM events WHERE id = ?", (event_id,))
         row = cursor.fetchone()
 
+        if row is None:
+            # Not live - it may have been archived
+            rows = self._read_partitions(f"SELECT {self._EVENT_SELECT} FROM {{schema}}.events WHERE id = ?",
+                                         (event_id,))
+            row = rows[0] if rows else None
+
         if row:
-            return Event.from_dict(dict(row))
+            return event_from_row(row)
         return None
 
+    def get_events_by_entity(self, kind: str, name: str, since: Optional[datetime] = None,
+                             limit: Optional[int] = None,
+                             fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """
+        Get events mentioning an entity, newest first.
+
+        Archive partitions keep their own event_entities rows, so archived
+        events are found too (each partition in range is read on its own).
+
+        Args:
+            kind: 'company', 'product' or 'person'
+            name: Entity name (case and spacing are ignored)
+            since: Only events published at or after this time
+            limit: Maximum number of events to return
+            fields: Only load these columns (returns lazy EventRows)
+
+        Returns:
+            List of Event objects (EventRow objects if fields given)
+        """
+        cursor = self.conn.cursor()
+
+        query = f"""
+            SELECT {self._projection(fields, 'e.')}, ee.published_at AS entity_published_at
+            FROM {{schema}}.event_entities ee
+            JOIN {{schema}}.events e ON e.id = ee.event_id
+            WHERE ee.kind = ? AND ee.name_key = ?
+        """
+        params = [kind, self.entity_key(name)]
+        if since:
+            query += " AND ee.published_at >= ?"
+            params.append(since.isoformat())
+        query += " ORDER BY ee.published_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor.execute(query.format(schema='main'), params)
+        rows = cursor.fetchall()
+
+        archived = self._read_partitions(query, params, since)
+        if archived:
+            rows = sorted(rows + archived, key=lambda row: row['entity_published_at'] or '',
+                          reverse=True)[:limit or None]
+        return self._hydrate(rows, fields)
+
+    def get_events_by_company(self, name: str, since: Optional[datetime] = None,
+                              limit: Optional[int] = None,
+                              fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """Get events mentioning a company (see get_events_by_entity)"""
+        return self.get_events_by_entity('company', name, since, limit, fields)
+
+    def get_events_by_product(self, name: str, since: Optional[datetime] = None,
+                              limit: Optional[int] = None,
+                              fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """Get events mentioning a product (see get_events_by_entity)"""
+        return self.get_events_by_entity('product', name, since, limit, fields)
+
+    def get_events_by_person(self, name: str, since: Optional[datetime] = None,
+                             limit: Optional[int] = None,
+                             fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """Get events mentioning a person (see get_events_by_entity)"""
+        return self.get_events_by_entity('person', name, since, limit, fields)
+
+    def get_entity_counts(self, kind: str = 'company', since: Optional[datetime] = None,
+                          limit: int = 20) -> List[dict]:
+        """
+        Most-mentioned entities of one kind (archived events included).
+
+        Returns:
+            List of {'name': ..., 'events': N}, most mentioned first
+        """
+        cursor = self.conn.cursor()
+
+        query = """
+            SELECT name_key, MIN(name) as name, COUNT(*) as events
+            FROM {schema}.event_entities
+            WHERE kind = ?
+        """
+        params = [kind]
+        if since:
+            query += " AND published_at >= ?"
+            params.append(since.isoformat())
+        query += " GROUP BY name_key"
+
+        archived = self._read_partitions(query, params, since)
+        if not archived:
+            cursor.execute(query.format(schema='main') + " ORDER BY events DESC LIMIT ?",
+                           params + [limit])
+            return [{'name': row['name'], 'events': row['events']} for row in cursor.fetchall()]
+
+        # Sum each entity's counts over the live table and the partitions
+        totals = {}
+        cursor.execute(query.format(schema='main'), params)
+        for row in cursor.fetchall() + archived:
+            name, events = totals.get(row['name_key'], (row['name'], 0))
+            totals[row['name_key']] = (min(name, row['name']), events + row['events'])
+
+        ranked = sorted(totals.values(), key=lambda entry: entry[1], reverse=True)[:limit]
+        return [{'name': name, 'events': events} for name, events in ranked]
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """
+        Turn free text into an FTS5 query that can't be a syntax error.
+
+        Each word is quoted ("GPT-5" stays one token sequence) and words are
+        ANDed; a trailing * keeps prefix matching (nvid*).
+        """
+        terms = []
+        for word in text.split():
+            prefix = word.endswith('*')
+            word = word.rstrip('*').replace('"', '""')
+            if word:
+                terms.append(f'"{word}"' + ('*' if prefix else ''))
+        return ' '.join(terms)
+
+    def search(self, query: str, since: Optional[datetime] = None, limit: int = 20,
+               min_score: Optional[float] = None, raw: bool = False) -> List[dict]:
+        """
+        Full-text search over title, content, analysis and implications.
+
+        Args:
+            query: Words to find (all must match). With raw=True, FTS5 query
+                syntax instead (OR, NOT, "phrases", title:word, ...)
+            since: Only events published at or after this time
+            limit: Maximum number of results
+            min_score: Only events with significance_score at or above this
+
+        Returns:
+            List of {'event': Event, 'rank': bm25 (lower is better), 'snippet': str},
+            best match first. Matched words in snippets are wrapped in [ ].
+            Archived events are searched too, through each partition's own
+            index - their ranks are scored against that month's events, so
+            they compare only roughly with live ranks.
+        """
+        if not self.has_search:
+            raise RuntimeError("SQLite was built without FTS5 - full-text search unavailable")
+
+        match = query if raw else self._fts_query(query)
+        if not match:
+            return []
+
+        weights = ', '.join(str(weight) for _, weight in self.SEARCH_COLUMNS)
+        cursor = self.conn.cursor()
+
+        # snippet column -1: whichever column matched best
+        sql = f"""
+            SELECT {self._projection(None, 'e.')},
+                   bm25(events_fts, {weights}) AS search_rank,
+                   snippet(events_fts, -1, '[', ']', '...', 16) AS search_snippet
+            FROM {{schema}}.events_fts
+            JOIN {{schema}}.events e ON e.id = events_fts.rowid
+            WHERE events_fts MATCH ?
+        """
+        params = [match]
+        if since:
+            sql += " AND e.published_at >= ?"
+            params.append(since.isoformat())
+        if min_score is not None:
+            sql += " AND e.significance_score >= ?"
+            params.append(min_score)
+        sql += " ORDER BY search_rank LIMIT ?"
+        params.append(limit)
+
+        cursor.execute(sql.format(schema='main'), params)
+        rows = cursor.fetchall()
+
+        archived = self._read_partitions(sql, params, since)
+        if archived:
+            rows = sorted(rows + archived, key=lambda row: row['search_rank'])[:limit]
+
+        results = []
+        for row in rows:
+            results.append({'event': event_from_row(row), 'rank': row['search_rank'],
+                            'snippet': row['search_snippet']})
+        return results
+
+    def backfill_entities(self, batch_size: int = 5000) -> int:
+        """
+        Index entities of events saved before event_entities existed.
+
+        Safe to re-run - only events with entities but no index rows are read.
+
+        Returns:
+            Number of entity rows added
+        """
+        cursor = self.conn.cursor()
+        added = 0
+        last_id = 0
+
+        while True:
+            cursor.execute("""
+                SELECT id, companies, products, people, published_at FROM events
+                WHERE id > ?
+                  AND (companies IS NOT NULL OR products IS NOT NULL OR people IS NOT NULL)
+                  AND NOT EXISTS (SELECT 1 FROM event_entities WHERE event_id = events.id)
+                ORDER BY id
+                LIMIT ?
+            """, (last_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            entity_rows = []
+            for row in rows:
+                event = Event.from_dict(dict(row))
+                entity_rows.extend(self._entity_rows(row['id'], event))
+            last_id = rows[-1]['id']
+
+            with self.conn:
+                self._save_entities(entity_rows)
+            added += len(entity_rows)
+
+        return added
+
+    def iter_events(self, where: str = '1', params: Sequence = (), batch_size: int = 1000,
+                    fields: Optional[Sequence[str]] = None,
+                    order: str = 'collected_at DESC',
+                    since: Optional[datetime] = None) -> Iterator[Tuple[str, List[Event]]]:
+        """
+        Stream events matching a filter, one publish date at a time.
+
+        For batch jobs over long windows (retroactive dedup): rows are loaded
+        batch_size at a time, so a pass over months of history holds one day
+        of events instead of the whole window. Only the (day, id) keys go
+        through SQLite's sort; rows are fetched by id as they are needed.
+
+        Reads run on their own connection (a WAL snapshot), so the caller can
+        keep writing and committing through self.conn while iterating.
+
+        Args:
+            where: SQL filter on events, with ? placeholders (trusted SQL)
+            params: Values for the placeholders in where
+            batch_size: Rows per fetchmany / load
+            fields: Only load these columns (yields lazy EventRows)
+            order: ORDER BY within a day (trusted SQL)
+            since: Earliest time where can match - archived months from then
+                   on are read too (default: live table only)
+
+        Yields:
+            (date, events) - oldest day first; date is YYYY-MM-DD, by
+            published_at (collected_at when there is none)
+        """
+        hydrate = event_from_row if fields is None else StoredEventRow
+
+        conn, source = self._read_connection(since)
+        select = f"SELECT {self._projection(fields)} FROM {source} WHERE id IN"
+        try:
+            keys = conn.execute(f"""
+                SELECT id, COALESCE(published_date, date(collected_at)) AS day
+                FROM {source}
+                WHERE {where}
+                ORDER BY day, {order}
+            """, tuple(params))
+
+            day, events = None, []
+            while True:
+                batch = keys.fetchmany(batch_size)
+                if not batch:
+                    break
+
+                placeholders = ', '.join('?' * len(batch))
+                rows = {row['id']: row for row in
+                        conn.execute(f"{select} ({placeholders})", [key[0] for key in batch])}
+
+                for event_id, event_day in batch:
+                    if event_day != day:
+                        if events:
+                            yield day, events
+                        day, events = event_day, []
+                    events.append(hydrate(rows[event_id]))
+
+            if events:
+                yield day, events
+        finally:
+            conn.close()
+
+    def get_events_by_ids(self, event_ids: List[int],
+                          fields: Optional[Sequence[str]] = None) -> List[Event]:
+        """
+        Get events by database ID, most recently collected first (EventRows if fields given).
+
+        IDs not in the live table are looked up in the archive.
+        """
+        if not event_ids:
+            return []
+
+        cursor = self.conn.cursor()
+        query = f"""
+            SELECT {self._projection(fields)}, collected_at AS sort_collected_at FROM {{schema}}.events
+            WHERE id IN ({{placeholders}})
+            ORDER BY collected_at DESC
+        """
+        cursor.execute(query.format(schema='main', placeholders=', '.join('?' * len(event_ids))),
+                       list(event_ids))
+        rows = cursor.fetchall()
+
+        missing = set(event_ids) - {row['id'] for row in rows}
+        if missing:
+            archived = self._read_partitions(
+                query.replace('{placeholders}', ', '.join('?' * len(missing))), list(missing))
+            if archived:
+                rows = sorted(rows + archived, key=lambda row: row['sort_collected_at'] or '',
+                              reverse=True)
+        return self._hydrate(rows, fields)
+
     def get_stats(self) -> dict:
         """Get database statistics"""
         cursor = self.conn.cursor()
@@ -411,6 +1287,8 @@ class EventDatabase:
         """
         cursor = self.conn.cursor()
 
+        # analysis and implications are indexed - swap the old text out
+        self._unindex_events("id = ?", (event_id,))
         cursor.execute("""
             UPDATE events
             SET significance_score = ?,
@@ -424,66 +1302,64 @@ class EventDatabase:
         """, (
             analysis_data.get('significance_score'),
             analysis_data.get('sentiment'),
-            analysis_data.get('full_analysis'),  # Store full text
+            pack_text(analysis_data.get('full_analysis')),  # Full text, compressed
             analysis_data.get('implications'),
             analysis_data.get('affected_parties'),
             analysis_data.get('investment_relevance'),
             analysis_data.get('key_context'),
             event_id
         ))
+        self._index_events("id = ?", (event_id,))
 
         self.conn.commit()
 
-    def save_daily_sentiment(self, date: str, sentiment_counts: dict):
+    def get_daily_sentiment(self, date: str) -> dict:
         """
-        Save or update daily sentiment aggregates.
+        Sentiment counts for one day (kept current by triggers on events).
 
         Args:
             date: Date string (YYYY-MM-DD)
-            sentiment_counts: Dict with sentiment counts
+
+        Returns:
+            Dict with positive/negative/neutral/mixed counts and total_analyzed
+            (all 0 for a day with no analyzed events)
         """
         cursor = self.conn.cursor()
 
         cursor.execute("""
-            INSERT INTO daily_sentiment (
-                date, positive, negative, neutral, mixed, total_analyzed, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                positive = excluded.positive,
-                negative = excluded.negative,
-                neutral = excluded.neutral,
-                mixed = excluded.mixed,
-                total_analyzed = excluded.total_analyzed
-        """, (
-            date,
-            sentiment_counts.get('positive', 0),
-            sentiment_counts.get('negative', 0),
-            sentiment_counts.get('neutral', 0),
-            sentiment_counts.get('mixed', 0),
-            sum(sentiment_counts.values()),
-            datetime.utcnow().isoformat()
-        ))
+            SELECT positive, negative, neutral, mixed, total_analyzed
+            FROM daily_sentiment
+            WHERE date = ?
+        """, (date,))
 
-        self.conn.commit()
+        row = cursor.fetchone()
+        if row is None:
+            return dict.fromkeys(self.SENTIMENTS + ('total_analyzed',), 0)
+        return dict(row)
 
     def get_sentiment_history(self, days: int = 30) -> List[dict]:
         """
-        Get sentiment history for last N days.
+        Get sentiment history for the last N days, ending today (UTC).
+
+        Rows are by publish date, so dates outside the window (old
+        archives, events published with a future date) are left out.
 
         Args:
             days: Number of days to retrieve
 
         Returns:
-            List of dicts with date and sentiment counts
+            List of dicts with date and sentiment counts, newest first
+            (days with no counted events have no entry)
         """
+        today = datetime.utcnow().date()
         cursor = self.conn.cursor()
 
         cursor.execute("""
             SELECT date, positive, negative, neutral, mixed, total_analyzed
             FROM daily_sentiment
+            WHERE date > ? AND date <= ?
             ORDER BY date DESC
-            LIMIT ?
-        """, (days,))
+        """, ((today - timedelta(days=days)).isoformat(), today.isoformat()))
 
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
@@ -646,7 +1522,7 @@ class EventDatabase:
     def close(self):
         """Close database connection"""
         if self.conn:
-            self.conn.close()
+            close_connection(self.conn)
 
     def __enter__(self):
         """Context manager support"""
@@ -0,0 +1,257 @@
+"""
+Persistent fingerprints of recently stored events.
+
+deduplicate_events only compares events inside one fetch batch, so
+yesterday's story re-reported by another source today would be saved again
+and sent for analysis. FingerprintStore keeps a small table of fingerprints
+for every event stored in the last few days:
+
+- normalized URL (scheme, www., tracking params, fragment, trailing slash dropped)
+- hash of the normalized title
+- 64-bit simhash of the title's words, split into four 16-bit bands
+
+A new event is a repeat if its URL or title hash matches, or if its simhash
+is within MAX_DISTANCE bits of a stored one. Any simhash within 3 bits
+agrees with it on at least one whole band, so the lookup is a few indexed
+equality queries - the events table is never scanned.
+
+Fingerprints older than the window are pruned whenever new ones are added.
+"""
+
+import re
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from pathlib import Path
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.events import Event, EventSource
+
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Query parameters that identify the referrer, not the article
+_TRACKING_PARAMS = re.compile(r'^(utm_\w+|ref|ref_src|fbclid|gclid|mc_cid|mc_eid|cmpid|smid)$')
+
+# Sources whose titles are templated ("NVIDIA files 8-K: ...", repo names,
+# paper titles) - different items can share a title, so only their URL counts
+URL_ONLY_SOURCES = frozenset({EventSource.SEC_EDGAR, EventSource.GITHUB, EventSource.ARXIV})
+
+# Max differing simhash bits for two titles to count as the same story
+MAX_DISTANCE = 3
+
+# Titles with fewer words than this are too short for a meaningful simhash
+MIN_SIMHASH_WORDS = 5
+
+BANDS = 4
+BAND_BITS = 16
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """Reduce a URL to the parts that identify the article"""
+    if not url:
+        return None
+
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return None
+
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not _TRACKING_PARAMS.match(k.lower())]
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('', host, path, urlencode(sorted(query)), ''))
+
+
+def title_words(title: str) -> List[str]:
+    """Lowercase alphanumeric words of a title"""
+    return _WORD_RE.findall((title or '').lower())
+
+
+def title_hash(words: List[str]) -> Optional[str]:
+    """Hash of the normalized title (punctuation and spacing ignored)"""
+    if not words:
+        return None
+    return hashlib.sha1(' '.join(words).encode('utf-8')).hexdigest()
+
+
+def simhash(words: List[str]) -> int:
+    """64-bit simhash over title words and adjacent word pairs"""
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    weights = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.md5(feature.encode('utf-8')).digest()[:8], 'big')
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    value = 0
+    for bit in range(64):
+        if weights[bit] > 0:
+            value |= 1 << bit
+    return value
+
+
+def simhash_bands(value: int) -> Tuple[int, ...]:
+    """Split a simhash into BANDS equal bands (low bits first)"""
+    mask = (1 << BAND_BITS) - 1
+    return tuple(value >> (i * BAND_BITS) & mask for i in range(BANDS))
+
+
+def _to_signed(value: int) -> int:
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class FingerprintStore:
+    """
+    Rolling-window fingerprint table for cross-run deduplication.
+
+    Lives in the events database and shares its connection.
+
+    Usage:
+        store = FingerprintStore(db.conn, window_days=7)
+        new_events, repeats = store.filter_new(events)
+        db.save_events(new_events)
+        store.add(new_events)
+    """
+
+    def __init__(self, conn: sqlite3.Connection, window_days: int = 7):
+        """
+        Args:
+            conn: Connection to the events database
+            window_days: How long a fingerprint is kept and matched against
+        """
+        self.conn = conn
+        self.window_days = window_days
+        self._create_table()
+
+    def _create_table(self):
+        """Create fingerprint schema if it doesn't exist"""
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_fingerprints (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                url TEXT,
+                title_hash TEXT,
+                simhash INTEGER,
+                band0 INTEGER,
+                band1 INTEGER,
+                band2 INTEGER,
+                band3 INTEGER,
+                seen_at TEXT NOT NULL
+            )
+        """)
+
+        for column in ('url', 'title_hash', 'seen_at', 'band0', 'band1', 'band2', 'band3'):
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_fingerprints_{column}
+                ON event_fingerprints({column})
+            """)
+
+        self.conn.commit()
+
+    def _fingerprint(self, event: Event) -> dict:
+        """Compute the stored fingerprint fields for an event"""
+        fingerprint = {
+            'source': event.source.value,
+            'url': normalize_url(event.source_url),
+            'title_hash': None,
+            'simhash': None,
+            'bands': None,
+        }
+
+        if event.source not in URL_ONLY_SOURCES:
+            words = title_words(event.title)
+            fingerprint['title_hash'] = title_hash(words)
+            if len(words) >= MIN_SIMHASH_WORDS:
+                value = simhash(words)
+                fingerprint['simhash'] = value
+                fingerprint['bands'] = simhash_bands(value)
+
+        return fingerprint
+
+    def _cutoff(self) -> str:
+        return (datetime.utcnow() - timedelta(days=self.window_days)).isoformat()
+
+    def is_seen(self, event: Event) -> bool:
+        """Check whether an event matches a fingerprint inside the window"""
+        return self._matches(self._fingerprint(event), self._cutoff())
+
+    def _matches(self, fingerprint: dict, cutoff: str) -> bool:
+        cursor = self.conn.cursor()
+
+        if fingerprint['url']:
+            cursor.execute("""
+                SELECT 1 FROM event_fingerprints
+                WHERE url = ? AND seen_at >= ? LIMIT 1
+            """, (fingerprint['url'], cutoff))
+            if cursor.fetchone():
+                return True
+
+        if fingerprint['title_hash']:
+            cursor.execute("""
+                SELECT 1 FROM event_fingerprints
+                WHERE title_hash = ? AND seen_at >= ? LIMIT 1
+            """, (fingerprint['title_hash'], cutoff))
+            if cursor.fetchone():
+                return True
+
+        if fingerprint['bands']:
+            value = fingerprint['simhash']
+            for i, band in enumerate(fingerprint['bands']):
+                cursor.execute(f"""
+                    SELECT simhash FROM event_fingerprints
+                    WHERE band{i} = ? AND seen_at >= ?
+                """, (band, cutoff))
+                for (stored,) in cursor.fetchall():
+                    if bin((stored & (1 << 64) - 1) ^ value).count('1') <= MAX_DISTANCE:
+                        return True
+
+        return False
+
+    def filter_new(self, events: List[Event]) -> Tuple[List[Event], int]:
+        """
+        Drop events already fingerprinted inside the window.
+
+        Returns:
+            Tuple of (new_events, num_repeats_removed)
+        """
+        cutoff = self._cutoff()
+        new_events = [e for e in events if not self._matches(self._fingerprint(e), cutoff)]
+        return new_events, len(events) - len(new_events)
+
+    def add(self, events: List[Event]):
+        """Fingerprint stored events and prune ones older than the window"""
+        now = datetime.utcnow().isoformat()
+        rows = []
+        for event in events:
+            fp = self._fingerprint(event)
+            if not (fp['url'] or fp['title_hash']):
+                continue
+            bands = fp['bands'] or (None,) * BANDS
+            simhash_value = _to_signed(fp['simhash']) if fp['simhash'] is not None else None
+            rows.append((fp['source'], fp['url'], fp['title_hash'], simhash_value, *bands, now))
+
+        with self.conn:
+            if rows:
+                self.conn.executemany("""
+                    INSERT INTO event_fingerprints (
+                        source, url, title_hash, simhash,
+                        band0, band1, band2, band3, seen_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+            self.conn.execute("DELETE FROM event_fingerprints WHERE seen_at < ?", (self._cutoff(),))
+
+    def count(self) -> int:
+        """Number of fingerprints currently stored"""
+        return self.conn.execute("SELECT COUNT(*) FROM event_fingerprints").fetchone()[0]
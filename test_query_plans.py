@@ -0,0 +1,95 @@
+"""
+Check per-day event queries use indexes (EXPLAIN QUERY PLAN)
+
+Runs the prediction, Discord and reporter per-day queries against a
+scratch database, captures the SQL they send, and fails if any plan
+scans the events table instead of searching an index.
+
+Usage:
+    python test_query_plans.py
+"""
+
+import sys
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent))
+
+from storage.db import EventDatabase
+from storage.connection import connect
+from models.events import Event, EventSource
+import agents.discord_morning as discord_morning
+from agents.prediction_logger import get_sentiment_percentages, get_top_events
+
+def full_scans(conn: sqlite3.Connection, sql: str) -> list:
+    """Plan lines that read all of events (or its FTS index) row by row"""
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return [row[3] for row in plan if row[3].startswith('SCAN events')]
+
+
+tmp = tempfile.TemporaryDirectory()
+db_path = str(Path(tmp.name) / "plans.db")
+today = datetime.utcnow().strftime('%Y-%m-%d')
+
+db = EventDatabase(db_path)
+now = datetime.utcnow()
+db.save_events([
+    Event(source=EventSource.MANUAL, source_id=str(i), title=f"Event {i}",
+          published_at=now - timedelta(hours=i), significance_score=i % 100,
+          sentiment=['positive', 'negative', 'neutral', 'mixed'][i % 4])
+    for i in range(500)
+])
+db.conn.execute("ANALYZE")
+db.conn.commit()
+
+# Capture the SQL each query function sends (with parameters filled in)
+captured = []
+db.conn.set_trace_callback(captured.append)
+
+
+def traced_connect(path, **kwargs):
+    conn = connect(path, **kwargs)
+    conn.set_trace_callback(captured.append)
+    return conn
+
+
+discord_morning.connect = traced_connect
+
+print("=" * 80)
+print("QUERY PLAN CHECK: per-day event queries")
+print("=" * 80)
+
+get_sentiment_percentages(db, today)
+get_top_events(db, today)
+db.get_recent_events(hours=24)
+discord_morning.get_top_stories(db_path)
+
+db.conn.set_trace_callback(None)
+
+failures = 0
+checked = 0
+for sql in captured:
+    if not sql.lstrip().upper().startswith('SELECT') or 'events' not in sql:
+        continue
+    checked += 1
+    scans = full_scans(db.conn, sql)
+    first_line = ' '.join(sql.split())[:70]
+    if scans:
+        failures += 1
+        print(f"✗ {first_line}...")
+        for line in scans:
+            print(f"    {line}")
+    else:
+        print(f"✓ {first_line}...")
+
+db.close()
+tmp.cleanup()
+
+print("\n" + "=" * 80)
+if failures or not checked:
+    print(f"FAILED: {failures} of {checked} queries scan the events table")
+    print("=" * 80)
+    sys.exit(1)
+print(f"PASSED: all {checked} queries use an index")
+print("=" * 80)